@@ -41,4 +41,13 @@ app.conf.beat_schedule = {
         "task": "poupeai_finance_service.credit_cards.tasks.check_and_notify_due_soon_invoices",
         "schedule": crontab(hour=9, minute=5),
     },
+    # Warmed entries are kept for DASHBOARD_PREWARM_TIMEOUT (24h), through the morning traffic.
+    "prewarm-dashboards-daily": {
+        "task": "poupeai_finance_service.dashboard.tasks.prewarm_dashboards",
+        "schedule": crontab(hour=5, minute=0),
+    },
+    "cleanup-stale-statement-imports-hourly": {
+        "task": "poupeai_finance_service.imports.tasks.cleanup_stale_statement_imports",
+        "schedule": crontab(minute=30),
+    },
 }
\ No newline at end of file
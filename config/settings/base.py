@@ -68,6 +68,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize",
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -90,6 +91,7 @@ LOCAL_APPS = [
     "poupeai_finance_service.transactions",
     "poupeai_finance_service.profiles",
     "poupeai_finance_service.dashboard",
+    "poupeai_finance_service.imports",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -464,3 +466,67 @@ KEYCLOAK_ADMIN_CLIENT_SECRET = env("KEYCLOAK_ADMIN_CLIENT_SECRET", default="clie
 REPORTS_SERVICE_URL = env("REPORTS_SERVICE_URL", default="http://reports-service:8081/api/v1")
 
 
+
+# ------------------------------------------------------------------------------
+# Dashboard
+# ------------------------------------------------------------------------------
+# Responses are cached per (profile, period, data version); any write to the
+# profile's data moves it to a new version, so stale entries are never served.
+DASHBOARD_CACHE_ENABLED = env.bool("DASHBOARD_CACHE_ENABLED", default=True)
+DASHBOARD_CACHE_TIMEOUT = env.int("DASHBOARD_CACHE_TIMEOUT", default=60 * 60)
+# Sections of the dashboard run serially by default; "threads" runs them concurrently on a
+# bounded pool (each worker uses its own DB connection), bounded by a per-section timeout.
+DASHBOARD_EXECUTOR = env("DASHBOARD_EXECUTOR", default="serial")
+DASHBOARD_MAX_WORKERS = env.int("DASHBOARD_MAX_WORKERS", default=4)
+DASHBOARD_SECTION_TIMEOUT = env.float("DASHBOARD_SECTION_TIMEOUT", default=5.0)
+# Per-section overrides, e.g. DASHBOARD_SECTION_TIMEOUTS="estimated_saving=2.0,invoices=3.0"
+DASHBOARD_SECTION_TIMEOUTS = env.dict("DASHBOARD_SECTION_TIMEOUTS", cast={"value": float}, default={})
+# Number of categories listed individually in "spending_by_category"; the rest are grouped as "Outros".
+DASHBOARD_SPENDING_TOP_N = env.int("DASHBOARD_SPENDING_TOP_N", default=5)
+# Nightly pre-warm (05:00) of the current-period dashboards of profiles with transactions written in
+# the last DASHBOARD_PREWARM_ACTIVE_DAYS days. Profiles are split in chunks of DASHBOARD_PREWARM_CHUNK_SIZE
+# and at most DASHBOARD_PREWARM_CONCURRENCY chunks run at the same time.
+DASHBOARD_PREWARM_ACTIVE_DAYS = env.int("DASHBOARD_PREWARM_ACTIVE_DAYS", default=7)
+DASHBOARD_PREWARM_CHUNK_SIZE = env.int("DASHBOARD_PREWARM_CHUNK_SIZE", default=20)
+DASHBOARD_PREWARM_CONCURRENCY = env.int("DASHBOARD_PREWARM_CONCURRENCY", default=4)
+# Pre-warmed entries must outlive the morning traffic, so they are kept until the next run instead of
+# DASHBOARD_CACHE_TIMEOUT; any write still makes them unreachable through the data version.
+DASHBOARD_PREWARM_TIMEOUT = env.int("DASHBOARD_PREWARM_TIMEOUT", default=24 * 60 * 60)
+# A chunk stops at the soft limit and hands its count on to the next chunk of its lane; the default
+# chunk size leaves ~12s per profile (two dashboards) within it.
+DASHBOARD_PREWARM_CHUNK_SOFT_TIME_LIMIT = env.int("DASHBOARD_PREWARM_CHUNK_SOFT_TIME_LIMIT", default=4 * 60)
+
+# ------------------------------------------------------------------------------
+# Transactions
+# ------------------------------------------------------------------------------
+# Opt-in fast path for the transaction list: pages are built from values() rows by a
+# precompiled field mapper instead of a model instance and a serializer per row. The JSON is
+# the same; measure it with `manage.py benchmark_transaction_list`.
+TRANSACTION_LIST_VALUES_PATH = env.bool("TRANSACTION_LIST_VALUES_PATH", default=False)
+
+# ------------------------------------------------------------------------------
+# Idempotency keys
+# ------------------------------------------------------------------------------
+# Responses of writes sent with an `Idempotency-Key` header are kept in the cache for
+# IDEMPOTENCY_KEY_TIMEOUT seconds and replayed on retries. A concurrent retry waits at most
+# IDEMPOTENCY_LOCK_TIMEOUT seconds for the first request before getting a 409.
+IDEMPOTENCY_KEY_TIMEOUT = env.int("IDEMPOTENCY_KEY_TIMEOUT", default=24 * 60 * 60)
+IDEMPOTENCY_LOCK_TIMEOUT = env.int("IDEMPOTENCY_LOCK_TIMEOUT", default=10)
+
+# ------------------------------------------------------------------------------
+# Statement imports
+# ------------------------------------------------------------------------------
+# Uploaded OFX/CSV statements are parsed as a stream by a Celery task and written in chunks of
+# STATEMENT_IMPORT_CHUNK_SIZE lines, each chunk in its own database transaction.
+STATEMENT_IMPORT_CHUNK_SIZE = env.int("STATEMENT_IMPORT_CHUNK_SIZE", default=500)
+STATEMENT_IMPORT_MAX_FILE_SIZE = env.int("STATEMENT_IMPORT_MAX_FILE_SIZE", default=20 * 1024 * 1024)
+# Number of per-line errors kept on the import for the status endpoint.
+STATEMENT_IMPORT_MAX_ERRORS = env.int("STATEMENT_IMPORT_MAX_ERRORS", default=50)
+STATEMENT_IMPORT_SOFT_TIME_LIMIT = env.int("STATEMENT_IMPORT_SOFT_TIME_LIMIT", default=30 * 60)
+# Statements hold the users' bank data: they are stored outside MEDIA_ROOT, which nginx serves
+# publicly, and deleted as soon as their import ends.
+STATEMENT_IMPORT_ROOT = env("STATEMENT_IMPORT_ROOT", default=str(BASE_DIR / "private" / "statement_imports"))
+# Imports still pending or processing after STATEMENT_IMPORT_STALE_AFTER seconds lost their task
+# (killed by the hard time limit or never delivered); cleanup_stale_statement_imports fails them
+# and deletes their files. Keep it above the task's hard time limit.
+STATEMENT_IMPORT_STALE_AFTER = env.int("STATEMENT_IMPORT_STALE_AFTER", default=2 * 60 * 60)
@@ -33,6 +33,7 @@ urlpatterns = [
     path("api/v1/goals/", include("poupeai_finance_service.goals.urls", namespace="goals")),
     path("api/v1/budgets/", include("poupeai_finance_service.budgets.urls", namespace="budgets")),
     path("api/v1/dashboard/", include("poupeai_finance_service.dashboard.urls", namespace="dashboard")),
+    path("api/v1/imports/", include("poupeai_finance_service.imports.urls", namespace="imports")),
 ]
 
 # urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -6,11 +6,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
 from poupeai_finance_service.bank_accounts.api.serializers import BankAccountSerializer, BankAccountUpdateSerializer
 from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.core.conditional import ConditionalListMixin
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
+from poupeai_finance_service.transactions.rollups import collect_rollup_keys, refresh_rollup_keys
 
 log = structlog.get_logger(__name__)
 
@@ -46,7 +49,7 @@ log = structlog.get_logger(__name__)
         description='Delete a specific bank account'
     ),
 )
-class BankAccountViewSet(viewsets.ModelViewSet):
+class BankAccountViewSet(ConditionalListMixin, viewsets.ModelViewSet):
     queryset = BankAccount.objects.all()
     permission_classes = [IsProfileActive, IsAuthenticated]
 
@@ -155,4 +158,10 @@ class BankAccountViewSet(viewsets.ModelViewSet):
             )
 
     def perform_create(self, serializer):
-        serializer.save(profile=self.request.user)
\ No newline at end of file
+        serializer.save(profile=self.request.user)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            rollup_keys = collect_rollup_keys(instance.transactions.all())
+            instance.delete()
+            refresh_rollup_keys(rollup_keys)
\ No newline at end of file
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from poupeai_finance_service.budgets.api.serializers import BudgetSerializer, CreateBudgetSerializer
 from poupeai_finance_service.budgets.models import Budget
+from poupeai_finance_service.core.conditional import ConditionalListMixin
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema_view, extend_schema
@@ -45,7 +46,7 @@ log = structlog.get_logger(__name__)
     ),
 )
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(ConditionalListMixin, viewsets.ModelViewSet):
     queryset = Budget.objects.all()
     serializer_class = BudgetSerializer
     permission_classes = [IsProfileActive, IsAuthenticated]
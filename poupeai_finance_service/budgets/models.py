@@ -1,7 +1,7 @@
 from django.db import models
 from poupeai_finance_service.categories.models import Category
 from poupeai_finance_service.profiles.models import Profile
-from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.transactions.models import DailyLedgerRollup
 from django.utils import timezone
 
 class Budget(models.Model):
@@ -21,12 +21,12 @@ class Budget(models.Model):
         return self.actual_amount_from_month(now)
 
     def actual_amount_from_month(self, date):
-        total = Transaction.objects.filter(
+        total = DailyLedgerRollup.objects.filter(
             category=self.category,
             profile=self.profile,
-            issue_date__year=date.year,
-            issue_date__month=date.month
-        ).aggregate(total=models.Sum('amount'))['total'] or 0.0
+            date__year=date.year,
+            date__month=date.month
+        ).aggregate(total=models.Sum('total_amount'))['total'] or 0.0
 
         return total
     
@@ -10,6 +10,7 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
+from poupeai_finance_service.core.conditional import ConditionalListMixin
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
 
 from poupeai_finance_service.categories.api.serializers import CategorySerializer, CreateCategorySerializer
@@ -49,7 +50,7 @@ log = structlog.get_logger(__name__)
         description='Delete a specific category'
     ),
 )
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(ConditionalListMixin, ModelViewSet):
     queryset = Category.objects.all()
     permission_classes = [IsProfileActive, IsAuthenticated]
     
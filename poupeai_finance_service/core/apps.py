@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "poupeai_finance_service.core"
+
+    def ready(self):
+        import poupeai_finance_service.core.signals  # noqa: F401
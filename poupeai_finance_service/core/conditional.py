@@ -0,0 +1,75 @@
+import hashlib
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+
+from poupeai_finance_service.core.data_version import get_data_version
+
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+def get_profile_etag(request, variant):
+    """
+    Returns the ETag of a profile-scoped GET, combining the profile's data version with `variant`
+    (whatever else selects the representation, e.g. the query string), the negotiated format and
+    the current date, since some fields (like invoice statuses) depend on it.
+
+    No Last-Modified is derived from it: its one second resolution would let a write later in the
+    same second pass If-Modified-Since, so the ETag is the only validator.
+
+    Returns None when the data version is unavailable, e.g. while the cache is down (django-redis
+    then returns None instead of raising): a constant version would keep answering 304 after
+    writes, so the response is served without a validator instead.
+    """
+    profile_id = request.user.pk
+    version = get_data_version(profile_id)
+    if version is None:
+        return None
+
+    accepted_renderer = getattr(request, 'accepted_renderer', None)
+    fingerprint = ":".join([
+        str(profile_id),
+        str(version),
+        variant,
+        getattr(accepted_renderer, 'format', '') or '',
+        timezone.now().date().isoformat(),
+    ])
+    return f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+
+def get_not_modified_response(request, etag):
+    """
+    Returns a 304 response when the request's If-None-Match validator still matches, or None
+    when the resource has to be rendered.
+    """
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        set_validator_headers(response, etag)
+    return response
+
+def set_validator_headers(response, etag):
+    if etag is None:
+        return response
+    response['ETag'] = etag
+    response['Cache-Control'] = CONDITIONAL_CACHE_CONTROL
+    return response
+
+class ConditionalListMixin:
+    """
+    Adds ETag support to the `list` action of a profile-scoped viewset.
+    While the profile's data version is unchanged the list answers 304 Not Modified without
+    running the queryset or the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        # get_queryset also validates the URL kwargs (e.g. the parent credit card) before
+        # a 304 is allowed to be returned; querysets are lazy, so this does not hit the list query.
+        self.get_queryset()
+
+        etag = get_profile_etag(request, request.get_full_path())
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        return set_validator_headers(response, etag)
@@ -0,0 +1,40 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+DATA_VERSION_KEY = "profile-data-version:{profile_id}"
+
+def _initial_version():
+    # Seeding with a millisecond clock keeps a counter that was evicted from the cache
+    # from restarting at a value that older cache entries were already stored under.
+    return int(time.time() * 1000)
+
+def get_data_version(profile_id):
+    """
+    Returns the current data version of a profile.
+    The version changes whenever the profile's financial data is written.
+    """
+    key = DATA_VERSION_KEY.format(profile_id=profile_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+def _increment_data_version(profile_id):
+    key = DATA_VERSION_KEY.format(profile_id=profile_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_version(), timeout=None)
+
+def bump_data_version(profile_id):
+    """
+    Invalidates everything derived from the profile's data by moving it to a new version.
+    The bump only happens once the surrounding database transaction commits, so readers
+    never cache pre-commit data under the new version.
+    """
+    if profile_id is None:
+        return
+    transaction.on_commit(lambda: _increment_data_version(profile_id))
@@ -2,6 +2,7 @@ from enum import Enum
 
 class EventType(str, Enum):
     REQUEST_COMPLETED = "REQUEST_COMPLETED"
+    IDEMPOTENT_REQUEST_REPLAYED = "IDEMPOTENT_REQUEST_REPLAYED"
 
     # --- Eventos do App 'Profiles' ---
     PROFILE_CREATED = "PROFILE_CREATED"
@@ -37,6 +38,11 @@ class EventType(str, Enum):
     TRANSACTION_CREATION_FAILED = "TRANSACTION_CREATION_FAILED"
     TRANSACTION_UPDATE_FAILED = "TRANSACTION_UPDATE_FAILED"
     TRANSACTION_DELETION_FAILED = "TRANSACTION_DELETION_FAILED"
+    TRANSACTION_BATCH_CREATED = "TRANSACTION_BATCH_CREATED"
+    TRANSACTION_BATCH_CREATION_FAILED = "TRANSACTION_BATCH_CREATION_FAILED"
+    TRANSACTION_BULK_UPDATED = "TRANSACTION_BULK_UPDATED"
+    TRANSACTION_BULK_UPDATE_FAILED = "TRANSACTION_BULK_UPDATE_FAILED"
+    TRANSACTION_EXPORTED = "TRANSACTION_EXPORTED"
 
     # --- Eventos do App 'Goals' ---
     GOAL_CREATED = "GOAL_CREATED"
@@ -97,4 +103,16 @@ class EventType(str, Enum):
     BANK_ACCOUNT_DELETED = "BANK_ACCOUNT_DELETED"
     BANK_ACCOUNT_CREATION_FAILED = "BANK_ACCOUNT_CREATION_FAILED"
     BANK_ACCOUNT_UPDATE_FAILED = "BANK_ACCOUNT_UPDATE_FAILED"
-    BANK_ACCOUNT_DELETION_FAILED = "BANK_ACCOUNT_DELETION_FAILED"
\ No newline at end of file
+    BANK_ACCOUNT_DELETION_FAILED = "BANK_ACCOUNT_DELETION_FAILED"
+
+    # --- Eventos da Task de 'Dashboard' ---
+    DASHBOARD_PREWARM_SKIPPED = "DASHBOARD_PREWARM_SKIPPED"
+    DASHBOARD_PREWARM_STARTED = "DASHBOARD_PREWARM_STARTED"
+    DASHBOARD_PREWARM_FAILED = "DASHBOARD_PREWARM_FAILED"
+    DASHBOARD_PREWARM_COMPLETED = "DASHBOARD_PREWARM_COMPLETED"
+
+    # --- Eventos do App 'Imports' ---
+    STATEMENT_IMPORT_REQUESTED = "STATEMENT_IMPORT_REQUESTED"
+    STATEMENT_IMPORT_STARTED = "STATEMENT_IMPORT_STARTED"
+    STATEMENT_IMPORT_COMPLETED = "STATEMENT_IMPORT_COMPLETED"
+    STATEMENT_IMPORT_FAILED = "STATEMENT_IMPORT_FAILED"
\ No newline at end of file
@@ -0,0 +1,147 @@
+import functools
+import hashlib
+import time
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError as DRFValidationError
+from rest_framework.response import Response
+
+from poupeai_finance_service.core.events import EventType
+
+log = structlog.get_logger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_REPLAYED_HEADER = 'Idempotent-Replayed'
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+IDEMPOTENCY_RESPONSE_KEY = "idempotency:{profile_id}:{scope}:{key}"
+IDEMPOTENCY_LOCK_KEY = "idempotency-lock:{profile_id}:{scope}:{key}"
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    IDEMPOTENCY_KEY_HEADER,
+    str,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description=(
+        'Unique key of the write (e.g. a UUID). Retries with the same key and body replay the '
+        'first successful response instead of writing again.'
+    ),
+)
+
+# Interval between two checks while a concurrent request with the same key holds the lock.
+IDEMPOTENCY_LOCK_POLL_INTERVAL = 0.05
+
+class IdempotencyKeyInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = _("A request with this Idempotency-Key is still being processed. Retry later.")
+    default_code = 'idempotency_key_in_progress'
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = _("This Idempotency-Key was already used with a different request.")
+    default_code = 'idempotency_key_reused'
+
+def get_request_fingerprint(request):
+    """
+    Identifies what a request asks for: the same key must always come with the same method,
+    path and body.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{request.method}:{request.get_full_path()}:".encode())
+    digest.update(request.body)
+    return digest.hexdigest()
+
+def _replay(stored):
+    response = Response(stored['data'], status=stored['status'], headers=stored['headers'])
+    response[IDEMPOTENCY_REPLAYED_HEADER] = 'true'
+    return response
+
+def _wait_for_lock(lock_key):
+    deadline = time.monotonic() + settings.IDEMPOTENCY_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(IDEMPOTENCY_LOCK_POLL_INTERVAL)
+        if cache.get(lock_key) is None:
+            return True
+    return False
+
+def _store_and_release(response_key, lock_key, stored):
+    cache.set(response_key, stored, timeout=settings.IDEMPOTENCY_KEY_TIMEOUT)
+    cache.delete(lock_key)
+
+def idempotent(view_method):
+    """
+    Makes a write action of a profile-scoped view idempotent under the `Idempotency-Key` header.
+
+    The first successful (2xx) response for a key is stored in the cache, once the request's
+    transaction commits, for IDEMPOTENCY_KEY_TIMEOUT seconds; retries with the same key get it
+    back (with `Idempotent-Replayed: true`) without running the action again. Concurrent requests
+    with the same key are serialized through a short lock: they wait for the first one and
+    replay its response. Requests without the header are not affected.
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if key is None:
+            return view_method(self, request, *args, **kwargs)
+        if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise DRFValidationError({
+                IDEMPOTENCY_KEY_HEADER: _("Must have between 1 and %(max)d characters.")
+                % {'max': IDEMPOTENCY_KEY_MAX_LENGTH}
+            })
+
+        names = {
+            'profile_id': request.user.pk,
+            'scope': f"{type(self).__name__}.{self.action}",
+            'key': hashlib.sha256(key.encode()).hexdigest(),
+        }
+        response_key = IDEMPOTENCY_RESPONSE_KEY.format(**names)
+        lock_key = IDEMPOTENCY_LOCK_KEY.format(**names)
+        fingerprint = get_request_fingerprint(request)
+
+        while True:
+            stored = cache.get(response_key)
+            if stored is not None:
+                if stored['fingerprint'] != fingerprint:
+                    raise IdempotencyKeyReused()
+                log.info(
+                    "Idempotent request replayed",
+                    event_type=EventType.IDEMPOTENT_REQUEST_REPLAYED,
+                    event_details={"scope": names['scope'], "status": stored['status']}
+                )
+                return _replay(stored)
+
+            # add() is atomic, so only one request per key gets past this point. A backend error
+            # swallowed by the cache (None instead of False) does not block the write.
+            if cache.add(lock_key, fingerprint, timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT) is not False:
+                break
+            if not _wait_for_lock(lock_key):
+                raise IdempotencyKeyInProgress()
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except BaseException:
+            cache.delete(lock_key)
+            raise
+
+        if not status.is_success(response.status_code):
+            cache.delete(lock_key)
+            return response
+
+        stored = {
+            'fingerprint': fingerprint,
+            'status': response.status_code,
+            'data': response.data,
+            'headers': dict(response.items()),
+        }
+        # Stored only once the write is committed, so a retry never replays a rolled back write.
+        # If the commit fails the lock is left to expire and the retry runs the action again.
+        transaction.on_commit(lambda: _store_and_release(response_key, lock_key, stored))
+        return response
+
+    return wrapper
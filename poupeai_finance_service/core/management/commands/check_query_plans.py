@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from poupeai_finance_service.core.query_plans import check_query_plans
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAINs the hot query paths against this database and fails when one of them does not scan "
+        "its intended index. A helper for inspecting a real database; the test suite runs the same "
+        "checks on seeded data (tests/test_query_plans.py)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile',
+            default=None,
+            help='Profile user_id used in the explained queries. Defaults to a random one.'
+        )
+        parser.add_argument(
+            '--allow-seqscan',
+            action='store_true',
+            help="Keep sequential scans enabled, to check the planner's real choice on production-sized data."
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Query plans can only be checked against PostgreSQL.")
+
+        failures = 0
+        for check, scanned, ok in check_query_plans(options['profile'], options['allow_seqscan']):
+            scanned_label = ", ".join(sorted(scanned)) or "no index"
+            if ok:
+                self.stdout.write(f"OK    {check.name}: {scanned_label}")
+            else:
+                failures += 1
+                self.stdout.write(self.style.ERROR(
+                    f"FAIL  {check.name}: scanned {scanned_label}, expected one of {', '.join(check.expected_indexes)}"
+                ))
+
+        if failures:
+            raise CommandError(f"{failures} hot query(ies) do not use their intended index.")
+        self.stdout.write(self.style.SUCCESS("All hot queries use their intended indexes."))
@@ -0,0 +1,223 @@
+import base64
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError as DRFValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+def get_cursor_fields(queryset, view):
+    """
+    Returns the attribute names of the concrete model fields a keyset page of `queryset` reads
+    back from its rows to build cursors: those of its ordering and the view's tie-breakers.
+    """
+    opts = queryset.model._meta
+    tie_breakers = getattr(view, 'keyset_tie_breakers', KeysetPagination.default_tie_breakers)
+    names = []
+    for field in [*queryset.query.order_by, *tie_breakers]:
+        if not isinstance(field, str):
+            continue
+        name = field.lstrip('-')
+        try:
+            attname = opts.pk.attname if name == 'pk' else opts.get_field(name).attname
+        except FieldDoesNotExist:
+            continue
+        if attname not in names:
+            names.append(attname)
+    return names
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination: each page is fetched with a WHERE on the last row's ordering key
+    instead of an OFFSET, and no COUNT(*) is run, so a deep page costs the same as the first one.
+
+    The ordering comes from the queryset (so OrderingFilter and the view's `ordering` still apply),
+    completed with the view's `keyset_tie_breakers` to make it total. Cursors are opaque
+    base64-encoded positions bound to that ordering. Only model fields can be part of a position:
+    a queryset ordered by an annotation or an expression, such as the relevance of a search
+    without an explicit `ordering`, is rejected with a 400 rather than paged in another order.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    default_tie_breakers = ('id',)
+    invalid_cursor_message = _('Invalid cursor.')
+    unsupported_ordering_message = _(
+        'Cursor pagination can only order by fields. Pass an explicit ordering (search results are '
+        'otherwise ordered by relevance) or use page number pagination.'
+    )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), 'page')
+        self.model = queryset.model
+        self.ordering = self.get_ordering(queryset, view)
+
+        position, reverse = self.decode_cursor(request)
+        self.has_cursor = position is not None
+
+        keys = [(field, descending != reverse) for field, descending in self.ordering]
+        queryset = queryset.order_by(*[f"-{field}" if descending else field for field, descending in keys])
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(keys, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+
+        self.page = rows
+        return rows
+
+    def get_ordering(self, queryset, view):
+        """
+        Returns the [(field, descending)] ordering of the page: the queryset's ordering followed by
+        the tie-breakers it does not already contain, which follow the direction of the first field.
+        """
+        ordering = []
+        for field in queryset.query.order_by or queryset.model._meta.ordering:
+            if not isinstance(field, str):
+                raise DRFValidationError({api_settings.ORDERING_PARAM: self.unsupported_ordering_message})
+            descending = field.startswith('-')
+            name = field.lstrip('-')
+            name = 'id' if name == 'pk' else name
+            try:
+                # Only concrete fields of the model can be part of a keyset position.
+                self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise DRFValidationError({api_settings.ORDERING_PARAM: self.unsupported_ordering_message})
+            ordering.append((name, descending))
+
+        tie_breakers = getattr(view, 'keyset_tie_breakers', self.default_tie_breakers)
+        descending = ordering[0][1] if ordering else False
+        names = {name for name, descending in ordering}
+        ordering.extend((name, descending) for name in tie_breakers if name not in names)
+        return ordering
+
+    def get_keyset_filter(self, keys, position):
+        """
+        Builds (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ..., with < for descending keys.
+        """
+        keyset_filter = Q()
+        equal = Q()
+        for (field, descending), value in zip(keys, position):
+            lookup = 'lt' if descending else 'gt'
+            keyset_filter |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+        return keyset_filter
+
+    def encode_cursor(self, row, reverse):
+        fields = [self.model._meta.get_field(field) for field, descending in self.ordering]
+        if isinstance(row, dict):
+            # A values() row, keyed by attribute name.
+            row = SimpleNamespace(**{field.attname: row[field.attname] for field in fields})
+        position = [field.value_to_string(row) for field in fields]
+        payload = {
+            "p": position,
+            "r": reverse,
+            "o": [f"-{field}" if descending else field for field, descending in self.ordering],
+        }
+        cursor = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            ordering = [f"-{field}" if descending else field for field, descending in self.ordering]
+            if payload["o"] != ordering or len(payload["p"]) != len(self.ordering):
+                raise ValueError("Cursor does not match the current ordering.")
+            position = [
+                self.model._meta.get_field(field).to_python(value)
+                for (field, descending), value in zip(self.ordering, payload["p"])
+            ]
+            return position, bool(payload["r"])
+        except (KeyError, TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    Page-number pagination by default. Passing `pagination=cursor` (or a `cursor` returned by a
+    previous page) opts into KeysetPagination for the same endpoint.
+    """
+    mode_query_param = 'pagination'
+    keyset_mode = 'cursor'
+    keyset_class = KeysetPagination
+
+    def use_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.keyset_mode
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.keyset_class() if self.use_keyset(request) else None
+        if self.keyset is not None:
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    "Set to 'cursor' to use keyset pagination (next/previous cursors, no count). "
+                    "Combined with `search`, an explicit `ordering` is required."
+                ),
+                'schema': {'type': 'string', 'enum': [self.keyset_mode]},
+            },
+            {
+                'name': self.keyset_class.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned in the next/previous links of keyset pagination.',
+                'schema': {'type': 'string'},
+            },
+        ]
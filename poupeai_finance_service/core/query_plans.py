@@ -0,0 +1,144 @@
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from poupeai_finance_service.core.search import get_search_query
+from poupeai_finance_service.credit_cards.models import Invoice
+from poupeai_finance_service.transactions.models import DailyLedgerRollup, Transaction
+
+INDEX_SCAN_NODES = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+@dataclass
+class QueryPlanCheck:
+    """
+    A hot query and the indexes any of which its plan is expected to scan.
+    """
+    name: str
+    build: Callable[[uuid.UUID], object]
+    expected_indexes: tuple
+
+def get_hot_queries():
+    today = timezone.localdate()
+    return [
+        QueryPlanCheck(
+            "transaction list page",
+            lambda profile_id: Transaction.objects.filter(profile_id=profile_id)
+                .order_by('-issue_date', '-created_at', '-id')[:10],
+            ("transaction_profile_date_idx",),
+        ),
+        QueryPlanCheck(
+            "transaction list keyset page",
+            lambda profile_id: Transaction.objects.filter(
+                profile_id=profile_id, issue_date__lt=today
+            ).order_by('-issue_date', '-created_at', '-id')[:11],
+            ("transaction_profile_date_idx",),
+        ),
+        QueryPlanCheck(
+            "transaction list by kind",
+            lambda profile_id: Transaction.objects.filter(
+                profile_id=profile_id, type='expense', source_type='CREDIT_CARD'
+            ).order_by('-issue_date')[:10],
+            ("transaction_profile_kind_idx",),
+        ),
+        QueryPlanCheck(
+            "rollup refresh rows",
+            lambda profile_id: Transaction.objects.filter(
+                profile_id=profile_id, issue_date__in=[today, today - timedelta(days=1)]
+            ),
+            ("transaction_profile_date_idx", "transaction_profile_kind_idx"),
+        ),
+        QueryPlanCheck(
+            "transaction search",
+            lambda profile_id: Transaction.objects.filter(
+                profile_id=profile_id, search_vector=get_search_query(["mercado"])
+            ),
+            ("transaction_search_idx",),
+        ),
+        QueryPlanCheck(
+            "description suggestions",
+            lambda profile_id: Transaction.objects.filter(profile_id=profile_id).suggest_descriptions("mercado"),
+            ("transaction_desc_trgm_idx",),
+        ),
+        QueryPlanCheck(
+            "installment group",
+            lambda profile_id: Transaction.objects.filter(purchase_group_uuid=uuid.uuid4())
+                .order_by('installment_number'),
+            ("transaction_purchase_group_idx",),
+        ),
+        QueryPlanCheck(
+            "recently active profiles",
+            lambda profile_id: Transaction.objects.filter(
+                updated_at__gte=timezone.now() - timedelta(days=7)
+            ).values('profile_id'),
+            ("transaction_updated_at_idx",),
+        ),
+        QueryPlanCheck(
+            "dashboard totals until",
+            lambda profile_id: DailyLedgerRollup.objects.filter(
+                profile_id=profile_id, date__lt=today, source_type='BANK_ACCOUNT'
+            ).values('type').annotate(total=Sum('total_amount')).order_by(),
+            ("rollup_profile_source_date_idx",),
+        ),
+        QueryPlanCheck(
+            "dashboard period totals",
+            lambda profile_id: DailyLedgerRollup.objects.filter(
+                profile_id=profile_id, date__gte=today - timedelta(days=30), date__lt=today
+            ).values('category_id').annotate(total=Sum('total_amount')).order_by(),
+            ("rollup_profile_source_date_idx", "unique_daily_ledger_rollup_key"),
+        ),
+        QueryPlanCheck(
+            "overdue invoices task",
+            lambda profile_id: Invoice.objects.filter(
+                due_date__lt=today, payment_date__isnull=True, overdue_notification_sent=False
+            ),
+            ("invoice_overdue_pending_idx",),
+        ),
+        QueryPlanCheck(
+            "due soon invoices task",
+            lambda profile_id: Invoice.objects.filter(
+                due_date=today + timedelta(days=5), payment_date__isnull=True, due_soon_notification_sent=False
+            ),
+            ("invoice_due_soon_pending_idx",),
+        ),
+    ]
+
+def _scanned_indexes(plan):
+    indexes = set()
+    if plan.get("Node Type") in INDEX_SCAN_NODES and plan.get("Index Name"):
+        indexes.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        indexes |= _scanned_indexes(child)
+    return indexes
+
+def explain(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+def check_query_plans(profile_id=None, allow_seqscan=False, checks=None):
+    """
+    EXPLAINs every hot query (or only `checks`) and returns [(check, scanned indexes, ok)].
+    Unless `allow_seqscan` is set, sequential scans are disabled for the check, so the result
+    tells whether the intended index is usable even on a small development database where the
+    planner would rightly prefer a sequential scan.
+    """
+    profile_id = profile_id or uuid.uuid4()
+    results = []
+    with transaction.atomic():
+        if not allow_seqscan:
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        for check in get_hot_queries() if checks is None else checks:
+            scanned = _scanned_indexes(explain(check.build(profile_id)))
+            results.append((check, scanned, bool(scanned & set(check.expected_indexes))))
+    return results
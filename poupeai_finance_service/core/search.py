@@ -0,0 +1,69 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+# Text search configuration created by transactions.0005: Portuguese stemming, plus accent
+# folding through the unaccent dictionary where the extension is available.
+SEARCH_CONFIG = 'portuguese_unaccent'
+
+SEARCH_TOKEN_RE = re.compile(r'\w+')
+
+def get_search_query(terms):
+    """
+    Builds a tsquery matching rows that contain every term, each one as a prefix so partial
+    words keep matching as they did with ILIKE. Only word characters are kept, so user input
+    cannot inject tsquery operators.
+    """
+    tokens = [token for term in terms for token in SEARCH_TOKEN_RE.findall(term)]
+    if not tokens:
+        return None
+    return SearchQuery(
+        " & ".join(f"{token}:*" for token in tokens),
+        config=SEARCH_CONFIG,
+        search_type='raw',
+    )
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Drop-in replacement for SearchFilter (same `search` parameter) that matches against the
+    view's `search_vector_field`, a stored and GIN-indexed tsvector, instead of ILIKE over
+    `search_fields`. Results are ranked by relevance unless an explicit ordering was requested.
+
+    Fields listed in the view's `search_trigram_fields` (trigram GIN-indexed) also match by word
+    similarity, so misspelled words ("mercdo") still find their rows.
+    """
+    rank_annotation = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        search_query = get_search_query(search_terms)
+        if search_query is None:
+            # Only punctuation was searched for; no description can match it as a word.
+            return queryset.none()
+
+        vector = F(getattr(view, 'search_vector_field', 'search_vector'))
+        search_text = " ".join(search_terms)
+        trigram_fields = getattr(view, 'search_trigram_fields', ())
+
+        matches = Q(**{vector.name: search_query})
+        for field in trigram_fields:
+            matches |= Q(**{f"{field}__trigram_word_similar": search_text})
+        queryset = queryset.filter(matches)
+
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+
+        rank = SearchRank(vector, search_query)
+        if trigram_fields:
+            # GREATEST skips NULLs, so a missing statement description does not null the rank.
+            rank = Greatest(rank, *[TrigramWordSimilarity(search_text, field) for field in trigram_fields])
+        return queryset.annotate(**{self.rank_annotation: rank}).order_by(
+            f"-{self.rank_annotation}", *queryset.query.order_by
+        )
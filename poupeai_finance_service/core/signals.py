@@ -0,0 +1,45 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.budgets.models import Budget
+from poupeai_finance_service.categories.models import Category
+from poupeai_finance_service.core.data_version import bump_data_version
+from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
+from poupeai_finance_service.goals.models import Goal, GoalDeposit
+
+# Transaction writes bump the version through the ledger rollup refresh, which every
+# write path (including queryset updates and deletes) already goes through.
+
+@receiver(post_save, sender=BankAccount)
+@receiver(post_delete, sender=BankAccount)
+@receiver(post_save, sender=CreditCard)
+@receiver(post_delete, sender=CreditCard)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+def bump_profile_data_version(sender, instance, **kwargs):
+    bump_data_version(instance.profile_id)
+
+@receiver(post_save, sender=Invoice)
+@receiver(post_delete, sender=Invoice)
+def bump_invoice_profile_data_version(sender, instance, **kwargs):
+    try:
+        profile_id = instance.credit_card.profile_id
+    except CreditCard.DoesNotExist:
+        # Cascading from a credit card deletion, which bumps the version itself.
+        return
+    bump_data_version(profile_id)
+
+@receiver(post_save, sender=GoalDeposit)
+@receiver(post_delete, sender=GoalDeposit)
+def bump_goal_deposit_profile_data_version(sender, instance, **kwargs):
+    try:
+        profile_id = instance.goal.profile_id
+    except Goal.DoesNotExist:
+        # Cascading from a goal deletion, which bumps the version itself.
+        return
+    bump_data_version(profile_id)
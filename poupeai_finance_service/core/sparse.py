@@ -0,0 +1,100 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from poupeai_finance_service.core.pagination import get_cursor_fields
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+def _parse_field_names(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+class SparseFieldsetMixin:
+    """
+    Viewset mixin for `?fields=a,b` (only those) and `?omit=c,d` (all but those) on the
+    `sparse_fieldset_actions`. Dropped serializer fields are never evaluated, so the properties
+    behind them (e.g. per-row aggregates) are not computed, and the queryset is narrowed with
+    only() to the columns the remaining fields read.
+
+    `sparse_field_columns` maps the serializer fields that are not plain model fields to the
+    model fields (or related lookups, which are select_related) they read. While a kept field
+    is neither mapped nor a model field, the full rows are loaded.
+    """
+    sparse_fieldset_actions = ('list', 'retrieve')
+    sparse_field_columns = {}
+
+    def get_sparse_fieldset(self):
+        """
+        The names of the serializer fields to render, or None to render them all.
+        """
+        if hasattr(self, '_sparse_fieldset'):
+            return self._sparse_fieldset
+
+        self._sparse_fieldset = None
+        query_params = self.request.query_params
+        if self.action not in self.sparse_fieldset_actions or not (
+            FIELDS_PARAM in query_params or OMIT_PARAM in query_params
+        ):
+            return None
+
+        available = list(self.get_serializer_class()(context=self.get_serializer_context()).fields)
+        requested = _parse_field_names(query_params.get(FIELDS_PARAM, '')) or available
+        omitted = _parse_field_names(query_params.get(OMIT_PARAM, ''))
+        unknown = [name for name in requested + omitted if name not in available]
+        if unknown:
+            raise DRFValidationError({
+                FIELDS_PARAM if FIELDS_PARAM in query_params else OMIT_PARAM:
+                    _("Unknown field(s): %(unknown)s. Available fields: %(available)s.") % {
+                        'unknown': ", ".join(unknown),
+                        'available': ", ".join(available),
+                    }
+            })
+
+        self._sparse_fieldset = [name for name in available if name in requested and name not in omitted]
+        return self._sparse_fieldset
+
+    def is_field_requested(self, name):
+        fieldset = self.get_sparse_fieldset()
+        return fieldset is None or name in fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fieldset = self.get_sparse_fieldset()
+        if fieldset is not None:
+            fields = getattr(serializer, 'child', serializer).fields
+            for name in list(fields):
+                if name not in fieldset:
+                    fields.pop(name)
+        return serializer
+
+    def get_sparse_columns(self, queryset):
+        opts = queryset.model._meta
+        columns = {opts.pk.name}
+        for name in self.get_sparse_fieldset():
+            if name in self.sparse_field_columns:
+                columns.update(self.sparse_field_columns[name])
+                continue
+            try:
+                opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            columns.add(name)
+
+        # Ordering fields are read back by keyset pagination to build its cursors.
+        columns.update(get_cursor_fields(queryset, self))
+        return columns
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.get_sparse_fieldset() is None:
+            return queryset
+
+        columns = self.get_sparse_columns(queryset)
+        if columns is None:
+            return queryset
+        queryset = queryset.select_related(None)
+        relations = {column.split('__')[0] for column in columns if '__' in column}
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*columns)
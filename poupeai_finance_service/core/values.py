@@ -0,0 +1,118 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.functional import cached_property
+from rest_framework.relations import PKOnlyObject, RelatedField
+from rest_framework.response import Response
+from rest_framework.serializers import SerializerMethodField
+
+from poupeai_finance_service.core.pagination import get_cursor_fields
+
+class UnsupportedValuesField(Exception):
+    """
+    Raised when a serializer field cannot be read from a values() row.
+    """
+
+class ValuesMapper:
+    """
+    Precompiled read path of a ModelSerializer: builds the same representation as
+    `serializer_class(instance).data` straight from `.values()` rows, calling each field's own
+    to_representation, without model instances or serializer machinery per row.
+
+    Each readable field is read from the model field (or related lookup) of its source;
+    `lookups` maps the fields whose source is not a model field (e.g. a property backed by an
+    annotation) to the values() lookup holding the same value.
+    """
+    def __init__(self, serializer_class, lookups=None):
+        self.serializer_class = serializer_class
+        self.lookups = lookups or {}
+
+    @cached_property
+    def columns(self):
+        """
+        [(field name, values() lookup, to_representation)], compiled once on first use.
+        """
+        serializer = self.serializer_class()
+        model = serializer.Meta.model
+        columns = []
+        for field in serializer._readable_fields:
+            lookup = self.lookups.get(field.field_name) or self._get_lookup(model, field)
+            if isinstance(field, RelatedField):
+                to_representation = self._related_to_representation(field)
+            else:
+                to_representation = field.to_representation
+            columns.append((field.field_name, lookup, to_representation))
+        return columns
+
+    @staticmethod
+    def _get_lookup(model, field):
+        if isinstance(field, SerializerMethodField) or field.source == '*':
+            raise UnsupportedValuesField(field.field_name)
+
+        lookup = []
+        opts = model._meta
+        source_attrs = field.source.split('.')
+        for position, attr in enumerate(source_attrs):
+            try:
+                model_field = opts.get_field(attr)
+            except FieldDoesNotExist:
+                raise UnsupportedValuesField(field.field_name)
+            is_last = position == len(source_attrs) - 1
+            if model_field.is_relation and is_last:
+                # Related fields render the primary key, read without the join.
+                lookup.append(model_field.attname)
+            else:
+                lookup.append(model_field.name)
+            if not is_last:
+                if not model_field.is_relation or model_field.many_to_many or model_field.one_to_many:
+                    raise UnsupportedValuesField(field.field_name)
+                opts = model_field.related_model._meta
+        return '__'.join(lookup)
+
+    @staticmethod
+    def _related_to_representation(field):
+        return lambda value: field.to_representation(PKOnlyObject(pk=value))
+
+    def get_columns(self, fieldset=None):
+        if fieldset is None:
+            return self.columns
+        return [column for column in self.columns if column[0] in fieldset]
+
+    def get_lookups(self, fieldset=None):
+        return [lookup for name, lookup, to_representation in self.get_columns(fieldset)]
+
+    def to_representation(self, rows, fieldset=None):
+        columns = self.get_columns(fieldset)
+        return [
+            {
+                name: None if row[lookup] is None else to_representation(row[lookup])
+                for name, lookup, to_representation in columns
+            }
+            for row in rows
+        ]
+
+class ValuesListMixin:
+    """
+    Viewset mixin that serves `list` through the view's `values_mapper` (a ValuesMapper of the
+    list serializer) when `use_values_list()` allows it, instead of instantiating a model and
+    a serializer per row. The output is the same as the regular path.
+    """
+    values_mapper = None
+
+    def use_values_list(self):
+        return self.values_mapper is not None
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_values_list():
+            return super().list(request, *args, **kwargs)
+
+        mapper = self.values_mapper
+        fieldset = self.get_sparse_fieldset() if hasattr(self, 'get_sparse_fieldset') else None
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = mapper.get_lookups(fieldset)
+        # Keyset pagination reads the ordering fields back from the rows to build its cursors.
+        lookups += [name for name in get_cursor_fields(queryset, self) if name not in lookups]
+        rows = queryset.values(*lookups)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(mapper.to_representation(page, fieldset))
+        return Response(mapper.to_representation(rows, fieldset))
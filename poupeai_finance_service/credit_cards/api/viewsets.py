@@ -12,7 +12,10 @@ from rest_framework.viewsets import ModelViewSet
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from django.db import transaction
 
+from poupeai_finance_service.core.conditional import ConditionalListMixin
+from poupeai_finance_service.core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
 from poupeai_finance_service.core.permissions import IsOwnerProfile
+from poupeai_finance_service.core.sparse import SparseFieldsetMixin
 from poupeai_finance_service.credit_cards.api.serializers import (
     CreditCardSerializer,
     InvoiceSerializer,
@@ -20,6 +23,7 @@ from poupeai_finance_service.credit_cards.api.serializers import (
 )
 from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
+from poupeai_finance_service.transactions.rollups import collect_rollup_keys, refresh_rollup_keys
 
 log = structlog.get_logger(__name__)
 
@@ -56,10 +60,15 @@ log = structlog.get_logger(__name__)
     ),
 )
 
-class CreditCardViewSet(ModelViewSet):
+class CreditCardViewSet(SparseFieldsetMixin, ModelViewSet):
     queryset = CreditCard.objects.all()
     serializer_class = CreditCardSerializer
     permission_classes = [IsProfileActive, IsAuthenticated]
+    sparse_field_columns = {
+        'used_credit_limit': [],
+        'available_credit_limit': ['credit_limit'],
+        'brand_display': ['brand'],
+    }
 
     def get_queryset(self):
         user = self.request.user
@@ -137,6 +146,12 @@ class CreditCardViewSet(ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(profile=self.request.user)
 
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            rollup_keys = collect_rollup_keys(instance.transactions.all())
+            instance.delete()
+            refresh_rollup_keys(rollup_keys)
+
 @extend_schema_view(
     list=extend_schema(
         tags=['Invoices'],
@@ -158,6 +173,7 @@ class CreditCardViewSet(ModelViewSet):
         summary='Pay an invoice',
         description='Registers the payment for a specific invoice.',
         request=InvoicePaymentSerializer,
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         responses={204: None}
     ),
     reopen=extend_schema(
@@ -168,7 +184,9 @@ class CreditCardViewSet(ModelViewSet):
         responses={204: None}
     ),
 )
-class InvoiceViewSet(mixins.RetrieveModelMixin,
+class InvoiceViewSet(SparseFieldsetMixin,
+                     ConditionalListMixin,
+                     mixins.RetrieveModelMixin,
                      mixins.ListModelMixin,
                      mixins.DestroyModelMixin,
                      viewsets.GenericViewSet):
@@ -178,6 +196,10 @@ class InvoiceViewSet(mixins.RetrieveModelMixin,
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     ordering_fields = ['due_date', 'month', 'year']
     ordering = ['-year', '-month']
+    sparse_field_columns = {
+        'is_paid': ['payment_date'],
+        'total_amount': [],
+    }
 
     def get_queryset(self):
         user_profile = self.request.user
@@ -194,6 +216,7 @@ class InvoiceViewSet(mixins.RetrieveModelMixin,
         return self.queryset.filter(credit_card=credit_card)
 
     @action(detail=True, methods=['post'], url_path='payment')
+    @idempotent
     def payment(self, request, id=None, pk=None):
         invoice = self.get_object()
         if invoice.is_paid:
@@ -212,6 +235,8 @@ class InvoiceViewSet(mixins.RetrieveModelMixin,
                 invoice.payment_date = payment_date
                 invoice.save()
 
+                # Neither field is part of the daily rollups; the Invoice post_save signal
+                # already bumps the data version of the cached responses.
                 invoice.transactions.update(
                     bank_account=bank_account,
                     payment_date=payment_date
@@ -3,7 +3,10 @@ import calendar
 from django.db import models
 
 class InvoiceManager(models.Manager):
-    def get_or_create_invoice(self, credit_card, issue_date):
+    def get_invoice_period(self, credit_card, issue_date):
+        """
+        Returns the (month, year, due_date) of the invoice a purchase made on `issue_date` belongs to.
+        """
         closing_day = credit_card.closing_day
         transaction_day = issue_date.day
         
@@ -22,6 +25,11 @@ class InvoiceManager(models.Manager):
         due_day = min(due_day, last_day_of_invoice_month)
         invoice_due_date = issue_date.replace(year=invoice_year, month=invoice_month, day=due_day)
 
+        return invoice_month, invoice_year, invoice_due_date
+
+    def get_or_create_invoice(self, credit_card, issue_date):
+        invoice_month, invoice_year, invoice_due_date = self.get_invoice_period(credit_card, issue_date)
+
         invoice, created = self.get_or_create(
             credit_card=credit_card,
             month=invoice_month,
@@ -29,4 +37,68 @@ class InvoiceManager(models.Manager):
             defaults={'due_date': invoice_due_date}
         )
         
-        return invoice
\ No newline at end of file
+        return invoice
+
+
+    def get_or_create_invoices(self, purchases):
+        """
+        Set-based get_or_create_invoice for many (credit_card, issue_date) purchases.
+        Returns {(credit_card_id, issue_date): invoice}, fetching the existing invoices with one
+        query and inserting the missing ones with one bulk INSERT.
+        """
+        return self.save_invoices(self.build_invoices(purchases))
+
+    def _fetch_invoices(self, periods):
+        # A superset of the wanted (credit_card_id, month, year) periods, narrowed down in Python.
+        candidates = self.filter(
+            credit_card_id__in={card_id for card_id, month, year in periods},
+            month__in={month for card_id, month, year in periods},
+            year__in={year for card_id, month, year in periods},
+        )
+        return {
+            (invoice.credit_card_id, invoice.month, invoice.year): invoice
+            for invoice in candidates
+            if (invoice.credit_card_id, invoice.month, invoice.year) in periods
+        }
+
+    def build_invoices(self, purchases):
+        """
+        Like get_or_create_invoices, but the missing invoices are only built, not inserted, so a
+        caller can validate the purchases first and save_invoices() those of the accepted ones.
+        """
+        periods = {}
+        invoice_keys = {}
+        for credit_card, issue_date in purchases:
+            month, year, due_date = self.get_invoice_period(credit_card, issue_date)
+            periods.setdefault((credit_card.pk, month, year), (credit_card, due_date))
+            invoice_keys[(credit_card.pk, issue_date)] = (credit_card.pk, month, year)
+        if not periods:
+            return {}
+
+        invoices = self._fetch_invoices(periods)
+        for key, (credit_card, due_date) in periods.items():
+            if key not in invoices:
+                invoices[key] = self.model(credit_card=credit_card, month=key[1], year=key[2], due_date=due_date)
+
+        return {purchase: invoices[key] for purchase, key in invoice_keys.items()}
+
+    def save_invoices(self, invoices):
+        """
+        Inserts the unsaved invoices of a build_invoices() result with one bulk INSERT and returns
+        the result with the stored invoices in their place.
+        """
+        missing = {
+            (invoice.credit_card_id, invoice.month, invoice.year): invoice
+            for invoice in invoices.values()
+            if invoice.pk is None
+        }
+        if not missing:
+            return invoices
+
+        # ignore_conflicts keeps a concurrent insert of the same period from failing the batch.
+        self.bulk_create(missing.values(), ignore_conflicts=True)
+        stored = self._fetch_invoices(missing)
+        return {
+            purchase: stored[(invoice.credit_card_id, invoice.month, invoice.year)] if invoice.pk is None else invoice
+            for purchase, invoice in invoices.items()
+        }
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('credit_cards', '0003_invoice_due_soon_notification_sent'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='invoice',
+            index=models.Index(condition=models.Q(('overdue_notification_sent', False), ('payment_date__isnull', True)), fields=['due_date'], name='invoice_overdue_pending_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='invoice',
+            index=models.Index(condition=models.Q(('due_soon_notification_sent', False), ('payment_date__isnull', True)), fields=['due_date'], name='invoice_due_soon_pending_idx'),
+        ),
+    ]
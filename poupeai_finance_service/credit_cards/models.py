@@ -128,6 +128,19 @@ class Invoice(TimeStampedModel):
         verbose_name_plural = _('Invoices')
         unique_together = ('credit_card', 'month', 'year')
         ordering = ['-year', '-month']
+        indexes = [
+            # Partial indexes over the few unpaid, not yet notified invoices scanned by the daily tasks.
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(payment_date__isnull=True, overdue_notification_sent=False),
+                name='invoice_overdue_pending_idx'
+            ),
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(payment_date__isnull=True, due_soon_notification_sent=False),
+                name='invoice_due_soon_pending_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.credit_card.name} - {self.month}/{self.year}"
@@ -143,36 +156,19 @@ class Invoice(TimeStampedModel):
     
     def delete(self, *args, **kwargs):
         from poupeai_finance_service.transactions.models import Transaction
+        from poupeai_finance_service.transactions.rollups import collect_rollup_keys, refresh_rollup_keys
         
         with transaction.atomic():
             related_transactions = self.transactions.all()
+            rollup_keys = collect_rollup_keys(related_transactions)
+            installment_groups = set(
+                related_transactions.filter(is_installment=True, purchase_group_uuid__isnull=False)
+                .order_by().values_list('purchase_group_uuid', flat=True).distinct()
+            )
+
+            related_transactions.delete()
+            Transaction.objects.renumber_installments(installment_groups)
             
-            installment_groups = {}
-            for trans in related_transactions:
-                if trans.is_installment and trans.purchase_group_uuid:
-                    group_uuid = trans.purchase_group_uuid
-                    if group_uuid not in installment_groups:
-                        installment_groups[group_uuid] = []
-                    installment_groups[group_uuid].append(trans)
-            
-            non_installment_trans = related_transactions.filter(is_installment=False)
-            non_installment_trans.delete()
-            
-            for group_uuid, transactions in installment_groups.items():
-                transactions_ids = [t.id for t in transactions]
-                Transaction.objects.filter(id__in=transactions_ids).delete()
-                
-                remaining_installments = Transaction.objects.filter(
-                    purchase_group_uuid=group_uuid
-                ).order_by('installment_number')
-                
-                if remaining_installments.exists():
-                    for idx, trans in enumerate(remaining_installments, start=1):
-                        trans.installment_number = idx
-                        original_desc = trans.original_purchase_description or trans.description.split(' (')[0]
-                        trans.description = f"{original_desc} ({idx}/{remaining_installments.count()})"
-                        trans.save()
-                    
-                    remaining_installments.update(total_installments=remaining_installments.count())
-            
-            super().delete(*args, **kwargs)
\ No newline at end of file
+            result = super().delete(*args, **kwargs)
+            refresh_rollup_keys(rollup_keys)
+            return result
\ No newline at end of file
@@ -2,25 +2,23 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from datetime import datetime
 from django.utils import timezone
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
-from poupeai_finance_service.bank_accounts.models import BankAccount
-from poupeai_finance_service.profiles.api.permissions import IsProfileActive
-from poupeai_finance_service.transactions.models import Transaction
-
-from poupeai_finance_service.dashboard.services import (
-    get_transactions_by_period,
-    get_chart_data,
-    get_initial_balance_until,
-    get_category_summary,
-    get_invoices_summary,
-    fetch_savings_estimate
+from poupeai_finance_service.core.conditional import (
+    get_not_modified_response,
+    get_profile_etag,
+    set_validator_headers,
 )
+from poupeai_finance_service.profiles.api.permissions import IsProfileActive
+
+from poupeai_finance_service.dashboard.cache import get_dashboard_period_key, get_or_build_dashboard
+from poupeai_finance_service.dashboard.services import get_dashboard_data, get_dashboard_period
+from poupeai_finance_service.dashboard.tools import GRANULARITIES, GRANULARITY_DAY
 
-from poupeai_finance_service.dashboard.tools import get_difference_in_percent
+# LTTB always keeps the first and last points, so fewer than 3 points is meaningless.
+MIN_MAX_POINTS = 3
 
 class DashboardView(APIView):
     permission_classes = [IsProfileActive, IsAuthenticated]
@@ -30,80 +28,76 @@ class DashboardView(APIView):
         summary="Dashboard data",
         description="Retrieves dashboard data for the specified period.",
         parameters=[
-            OpenApiParameter("period", description="Period in 'yyyy-mm' format", type=str, required=False)
+            OpenApiParameter(
+                "period",
+                description="Period in 'yyyy-mm' (month) or 'yyyy' (year) format, or 'all' for the whole history. "
+                            "Defaults to the last 30 days.",
+                type=str,
+                required=False
+            ),
+            OpenApiParameter(
+                "granularity",
+                description="Size of each chart point, bucketed in the database.",
+                type=str,
+                enum=GRANULARITIES,
+                default=GRANULARITY_DAY,
+                required=False
+            ),
+            OpenApiParameter(
+                "max_points",
+                description=f"Downsamples the balance series to at most this many points (minimum {MIN_MAX_POINTS}).",
+                type=int,
+                required=False
+            ),
         ]
     )
     def get(self, request):
         period = request.query_params.get('period', None)
-        
-        # Obtenha as datas de início e fim como objetos date simples para consistência com issue_date
-        if period:
+        granularity = request.query_params.get('granularity', GRANULARITY_DAY)
+        max_points = request.query_params.get('max_points', None)
+
+        profile = self.request.user
+
+        try:
+            start_date_obj, end_date_obj = get_dashboard_period(profile, period)
+        except ValueError:
+            return Response({'error': "Invalid period. Use 'yyyy-mm', 'yyyy' or 'all'."}, status=400)
+
+        if granularity not in GRANULARITIES:
+            return Response({'error': f"Invalid granularity. Use one of: {', '.join(GRANULARITIES)}."}, status=400)
+
+        if max_points is not None:
             try:
-                year, month = map(int, period.split('-'))
-                start_dt = datetime(year, month, 1) # Sem tzinfo por enquanto
-                # Fim do mês (início do próximo mês para filtro exclusivo)
-                if month == 12:
-                    end_dt = start_dt.replace(year=start_dt.year+1, month=1)
-                else:
-                    end_dt = start_dt.replace(month=start_dt.month+1)
-            except Exception:
-                return Response({'error': 'Invalid yyyy-mm format.'}, status=400)
-        else:
-            # Últimos 30 dias, incluindo o dia atual.
-            today_dt = timezone.now() # Use timezone.now() aqui para pegar a data atual com fuso horário
-            end_dt = today_dt.replace(hour=0, minute=0, second=0, microsecond=0) + timezone.timedelta(days=1)
-            start_dt = end_dt - timezone.timedelta(days=30)
-            
-        # Converter para objetos date simples para os filtros
-        # E para passar para as funções de serviço
-        start_date_obj = start_dt.date()
-        end_date_obj = end_dt.date()
+                max_points = int(max_points)
+            except ValueError:
+                max_points = 0
+            if max_points < MIN_MAX_POINTS:
+                return Response({'error': f'max_points must be an integer greater than or equal to {MIN_MAX_POINTS}.'}, status=400)
 
         # Validação de data (opcional, pode ser ajustado para usar date_obj)
         if start_date_obj > timezone.now().date(): # Comparar date com date
              return Response({'error': 'The specified period cannot be in the future.'}, status=400)
-        
-        profile = self.request.user
-        
-        # Passar os objetos date para as funções de serviço
-        incomes, expenses = get_transactions_by_period(profile, start_date_obj, end_date_obj)
-        
-        bank_accounts = BankAccount.objects.filter(profile=profile)
-        
-        initial_balance = get_initial_balance_until(profile, bank_accounts, start_date_obj)
-        balance_chart_data, current_balance = get_chart_data(incomes, expenses, start_date_obj, end_date_obj, initial_balance)
-
-        balance_difference = get_difference_in_percent(initial_balance, current_balance)
-        
-        incomes_summary = get_category_summary(profile, bank_accounts, 'income', start_date_obj, end_date_obj)
-        expenses_summary = get_category_summary(profile, bank_accounts, 'expense', start_date_obj, end_date_obj)
-        
-        # Para get_invoices_summary, passe o ano e mês do start_dt
-        invoices_summary = get_invoices_summary(profile, start_dt.year, start_dt.month)
 
         access_token = request.auth
     
         if not access_token:
             return Response({'error': 'Authentication token not found.'}, status=401)
 
-        estimated_saving = fetch_savings_estimate(
-            profile.user_id, 
-            Transaction.objects.filter(profile=profile),
-            access_token
+        period_key = get_dashboard_period_key(start_date_obj, end_date_obj, granularity, max_points)
+
+        # Um cliente que já tem o payload da versão atual dos dados recebe 304 sem recalcular nada
+        etag = get_profile_etag(request, period_key)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        payload, cache_status = get_or_build_dashboard(
+            profile.pk,
+            period_key,
+            lambda: get_dashboard_data(
+                profile, start_date_obj, end_date_obj, access_token, granularity, max_points
+            )
         )
 
-        return Response({
-            "message": "Dashboard data retrieved successfully.",
-            "start_date": start_date_obj.isoformat(), # Usar a data simples para o output
-            "end_date": (end_date_obj - timezone.timedelta(days=1)).isoformat(), # Usar a data simples para o output
-            "balance": {
-                "current_total": current_balance,
-                "difference": balance_difference,
-                "chart_data": balance_chart_data
-            },
-            "incomes": incomes_summary,
-            "expenses": expenses_summary,
-            "invoices": invoices_summary,
-            "spending_by_category": {},
-            "estimated_saving": estimated_saving,
-        }, status=200)
\ No newline at end of file
+        response = Response(payload, status=200, headers={'X-Dashboard-Cache': cache_status})
+        return set_validator_headers(response, etag)
@@ -0,0 +1,330 @@
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.categories.models import Category
+from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
+from poupeai_finance_service.profiles.models import Profile
+from poupeai_finance_service.transactions.models import DailyLedgerRollup, Transaction
+from poupeai_finance_service.transactions.rollups import rebuild_daily_rollups
+
+BENCHMARK_EMAIL = "benchmark-{size}@poupe.ai"
+BENCHMARK_TOKEN = "benchmark-token"
+SEED_BATCH_SIZE = 5000
+
+# Share of the seeded rows per kind; the rest are bank account transactions.
+CARD_PURCHASE_RATIO = 0.25
+INSTALLMENT_RATIO = 0.10
+MAX_INSTALLMENTS = 12
+
+INCOME_CATEGORIES = ("Salário", "Freelance", "Rendimentos")
+EXPENSE_CATEGORIES = (
+    "Mercado", "Lazer", "Transporte", "Moradia", "Saúde",
+    "Educação", "Restaurantes", "Assinaturas", "Viagens",
+)
+
+def _random_amount(rng):
+    return Decimal(rng.randint(100, 50000)) / 100
+
+class _TransactionWriter:
+    """
+    Buffers seeded transactions and writes them with bulk_create in fixed-size batches.
+    """
+
+    def __init__(self):
+        self.batch = []
+        self.count = 0
+
+    def add(self, instance):
+        self.batch.append(instance)
+        self.count += 1
+        if len(self.batch) == SEED_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        Transaction.objects.bulk_create(self.batch)
+        self.batch = []
+
+def _create_invoices(credit_cards, periods, bank_account, today):
+    """
+    Bulk-creates the invoices referenced by the seeded card purchases. Invoices that were
+    due more than a week ago are created as paid from `bank_account`.
+    """
+    invoices = []
+    for (card_id, month, year), due_date in periods.items():
+        paid = due_date < today - timedelta(days=7)
+        invoices.append(Invoice(
+            credit_card=credit_cards[card_id],
+            month=month,
+            year=year,
+            due_date=due_date,
+            payment_date=due_date if paid else None,
+            bank_account=bank_account if paid else None,
+        ))
+    Invoice.objects.bulk_create(invoices, batch_size=SEED_BATCH_SIZE)
+    return {
+        (invoice.credit_card_id, invoice.month, invoice.year): invoice
+        for invoice in Invoice.objects.filter(credit_card__in=credit_cards.values())
+    }
+
+def seed_benchmark_profile(size, transactions_per_month=300, seed=0, max_history_days=None):
+    """
+    Creates a throwaway profile holding `size` transactions: bank account transactions, single
+    credit card purchases and installment purchases, with their invoices.
+    Every month gets about the same number of transactions, so a larger size means a longer
+    history rather than a busier recent period. `max_history_days` caps that history (the
+    months then get busier instead), so large sizes keep a realistic date range.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    history_days = max(90, (size * 30) // transactions_per_month)
+    if max_history_days is not None:
+        history_days = min(history_days, max_history_days)
+
+    with transaction.atomic():
+        Profile.objects.filter(email=BENCHMARK_EMAIL.format(size=size)).delete()
+        profile = Profile.objects.create(
+            user_id=uuid.uuid4(),
+            email=BENCHMARK_EMAIL.format(size=size),
+            first_name="Benchmark",
+        )
+        incomes = [
+            Category.objects.create(profile=profile, name=name, type="income", color_hex="#2E7D32")
+            for name in INCOME_CATEGORIES
+        ]
+        expenses = [
+            Category.objects.create(profile=profile, name=name, type="expense", color_hex="#C62828")
+            for name in EXPENSE_CATEGORIES
+        ]
+        bank_accounts = [
+            BankAccount.objects.create(
+                profile=profile, name="Conta Benchmark", initial_balance=Decimal("1000.00"), is_default=True
+            ),
+            BankAccount.objects.create(profile=profile, name="Poupança Benchmark", initial_balance=Decimal("5000.00")),
+        ]
+        credit_cards = {
+            card.pk: card
+            for card in (
+                CreditCard.objects.create(
+                    profile=profile, name="Cartão Benchmark", credit_limit=Decimal("10000.00"),
+                    closing_day=5, due_day=15, brand=CreditCard.BrandChoices.VISA
+                ),
+                CreditCard.objects.create(
+                    profile=profile, name="Cartão Benchmark 2", credit_limit=Decimal("5000.00"),
+                    closing_day=25, due_day=3, brand=CreditCard.BrandChoices.MASTERCARD
+                ),
+            )
+        }
+
+        # Card purchases are planned first so their invoices can be bulk-created up front.
+        card_purchases = []
+        invoice_periods = {}
+        planned = 0
+        target_card_rows = int(size * (CARD_PURCHASE_RATIO + INSTALLMENT_RATIO))
+        while planned < target_card_rows:
+            card = rng.choice(list(credit_cards.values()))
+            issue_date = today - timedelta(days=rng.randint(0, history_days))
+            installments = 1
+            if rng.random() < INSTALLMENT_RATIO / (CARD_PURCHASE_RATIO + INSTALLMENT_RATIO):
+                installments = min(rng.randint(2, MAX_INSTALLMENTS), target_card_rows - planned)
+
+            dates = [
+                Transaction.objects._calculate_installment_date(issue_date, offset)
+                for offset in range(installments)
+            ]
+            for day in dates:
+                month, year, due_date = Invoice.objects.get_invoice_period(card, day)
+                invoice_periods[(card.pk, month, year)] = due_date
+            card_purchases.append((card, dates))
+            planned += installments
+
+        invoices = _create_invoices(credit_cards, invoice_periods, bank_accounts[0], today)
+
+        writer = _TransactionWriter()
+        for i, (card, dates) in enumerate(card_purchases):
+            category = rng.choice(expenses)
+            amount = _random_amount(rng)
+            is_installment = len(dates) > 1
+            description = f"Compra {i}"
+            group_uuid = uuid.uuid4()
+            for number, day in enumerate(dates, start=1):
+                month, year, _ = Invoice.objects.get_invoice_period(card, day)
+                invoice = invoices[(card.pk, month, year)]
+                writer.add(Transaction(
+                    profile=profile,
+                    category=category,
+                    type=category.type,
+                    description=f"{description} ({number}/{len(dates)})" if is_installment else description,
+                    amount=amount,
+                    issue_date=day,
+                    source_type="CREDIT_CARD",
+                    credit_card=card,
+                    invoice=invoice,
+                    bank_account=invoice.bank_account,
+                    payment_date=invoice.payment_date,
+                    is_installment=is_installment,
+                    installment_number=number if is_installment else None,
+                    total_installments=len(dates) if is_installment else None,
+                    purchase_group_uuid=group_uuid,
+                    original_purchase_description=description if is_installment else None,
+                ))
+
+        for i in range(max(size - writer.count, 0)):
+            category = rng.choice(incomes) if rng.random() < 0.3 else rng.choice(expenses)
+            writer.add(Transaction(
+                profile=profile,
+                category=category,
+                type=category.type,
+                description=f"Benchmark {i}",
+                amount=_random_amount(rng),
+                issue_date=today - timedelta(days=rng.randint(0, history_days)),
+                source_type="BANK_ACCOUNT",
+                bank_account=rng.choice(bank_accounts),
+            ))
+        writer.flush()
+
+        rebuild_daily_rollups(profile.pk)
+
+    _analyze_tables()
+    return profile
+
+def get_benchmark_profile(size):
+    """
+    Returns the profile seeded for `size` by a previous run, if it is still complete.
+    """
+    profile = Profile.objects.filter(email=BENCHMARK_EMAIL.format(size=size)).first()
+    if profile is None or Transaction.objects.filter(profile=profile).count() != size:
+        return None
+    return profile
+
+def _analyze_tables():
+    # Refresh planner statistics after the bulk load, as autovacuum would eventually do,
+    # otherwise Postgres plans the measured queries for empty tables.
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for model in (Transaction, DailyLedgerRollup, Invoice):
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+def measure(func, repeat=5):
+    """
+    Runs `func` `repeat` times and returns its wall time (in milliseconds) and query count.
+    """
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as context:
+            started_at = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started_at) * 1000)
+        queries = len(context.captured_queries)
+    return {
+        "queries": queries,
+        "wall_ms_min": round(min(timings), 3),
+        "wall_ms_median": round(statistics.median(timings), 3),
+    }
+
+def call_dashboard_view(profile, params=None):
+    """
+    Calls DashboardView.get in-process, authenticating the profile with a stub token
+    instead of Keycloak.
+    """
+    from poupeai_finance_service.dashboard.api.viewsets import DashboardView
+
+    request = APIRequestFactory().get("/api/v1/dashboard/", params or {})
+    force_authenticate(request, user=profile, token=BENCHMARK_TOKEN)
+    response = DashboardView.as_view()(request)
+    response.render()
+    if response.status_code != 200:
+        raise RuntimeError(f"DashboardView returned {response.status_code}: {response.content[:200]!r}")
+    return response
+
+def get_benchmark_scenarios(profile):
+    """
+    Returns the {name: callable} pairs measured for a profile: the dashboard view for the usual
+    periods and every dashboard.services function for the default period (last 30 days).
+    """
+    from poupeai_finance_service.dashboard import services
+
+    start, end = services.get_dashboard_period(profile, None)
+    today = timezone.now().date()
+    bank_accounts = BankAccount.objects.filter(profile=profile)
+    daily_totals = services.get_daily_totals(profile, start, end)
+    totals_until = services.get_totals_until(profile, start)
+
+    return {
+        "view.default": lambda: call_dashboard_view(profile),
+        "view.month": lambda: call_dashboard_view(profile, {"period": today.strftime("%Y-%m")}),
+        "view.year_weekly": lambda: call_dashboard_view(
+            profile, {"period": str(today.year), "granularity": "week"}
+        ),
+        "view.all_monthly": lambda: call_dashboard_view(profile, {"period": "all", "granularity": "month"}),
+        "view.all_daily_lttb": lambda: call_dashboard_view(profile, {"period": "all", "max_points": 200}),
+        "services.get_dashboard_data": lambda: services.get_dashboard_data(profile, start, end, BENCHMARK_TOKEN),
+        "services.get_totals_until": lambda: services.get_totals_until(profile, start),
+        "services.get_initial_balance_until": lambda: services.get_initial_balance_until(
+            profile, list(bank_accounts), start
+        ),
+        "services.get_daily_totals": lambda: services.get_daily_totals(profile, start, end),
+        "services.get_balance_summary": lambda: services.get_balance_summary(
+            profile, start, end, daily_totals, totals_until
+        ),
+        "services.get_category_summary.income": lambda: services.get_category_summary(
+            profile, None, "income", start, end
+        ),
+        "services.get_category_summary.expense": lambda: services.get_category_summary(
+            profile, None, "expense", start, end
+        ),
+        "services.get_invoices_summary": lambda: services.get_invoices_summary(profile, start.year, start.month),
+        "services.get_spending_by_category": lambda: services.get_spending_by_category(profile, start, end),
+        "services.fetch_savings_estimate": lambda: services.fetch_savings_estimate(profile, BENCHMARK_TOKEN),
+    }
+
+def run_dashboard_benchmark(profile, repeat=5):
+    """
+    Measures every benchmark scenario for the profile with the dashboard cache disabled,
+    so the numbers reflect the computation rather than cache hits.
+    """
+    results = {}
+    with override_settings(DASHBOARD_CACHE_ENABLED=False):
+        for name, func in get_benchmark_scenarios(profile).items():
+            # Warm-up run, so the first scenario does not pay for cold connections and caches.
+            func()
+            results[name] = measure(func, repeat=repeat)
+    return results
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_reports(baseline, current):
+    """
+    Yields (size, scenario, baseline_median, current_median, ratio) for every scenario present
+    in both reports.
+    """
+    for size, current_size in current["sizes"].items():
+        baseline_size = baseline.get("sizes", {}).get(size)
+        if not baseline_size:
+            continue
+        for name, result in current_size["scenarios"].items():
+            previous = baseline_size["scenarios"].get(name)
+            if not previous:
+                continue
+            before, after = previous["wall_ms_median"], result["wall_ms_median"]
+            yield size, name, before, after, (after / before if before else 0.0)
@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from poupeai_finance_service.core.data_version import get_data_version
+
+DASHBOARD_CACHE_KEY = "dashboard:{profile_id}:{period_key}:v{version}"
+DASHBOARD_CACHE_HITS_KEY = "dashboard-cache:hits"
+DASHBOARD_CACHE_MISSES_KEY = "dashboard-cache:misses"
+
+def get_dashboard_cache_key(profile_id, period_key):
+    """
+    Builds the cache key of a dashboard response. Because the key embeds the profile's
+    current data version, any write makes the previous entries unreachable without deleting them.
+    Returns None when the version is unavailable (the cache is down), so nothing is cached under it.
+    """
+    version = get_data_version(profile_id)
+    if version is None:
+        return None
+    return DASHBOARD_CACHE_KEY.format(profile_id=profile_id, period_key=period_key, version=version)
+
+def get_dashboard_period_key(start_date, end_date, granularity, max_points=None):
+    """
+    Identifies a dashboard request inside the profile's cache namespace: the period plus every
+    parameter that changes the payload.
+    """
+    return f"{start_date.isoformat()}:{end_date.isoformat()}:{granularity}:{max_points or ''}"
+
+def _increment_counter(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+def get_or_build_dashboard(profile_id, period_key, builder):
+    """
+    Returns the cached dashboard payload for the profile/period, building and storing it on a miss.
+    Returns a (payload, cache_status) tuple, where cache_status is 'HIT', 'MISS' or 'BYPASS'.
+    """
+    if not settings.DASHBOARD_CACHE_ENABLED:
+        return builder(), 'BYPASS'
+
+    key = get_dashboard_cache_key(profile_id, period_key)
+    if key is None:
+        return builder(), 'BYPASS'
+
+    payload = cache.get(key)
+    if payload is not None:
+        _increment_counter(DASHBOARD_CACHE_HITS_KEY)
+        return payload, 'HIT'
+
+    _increment_counter(DASHBOARD_CACHE_MISSES_KEY)
+    payload = builder()
+    # A payload with degraded sections is served once but never cached.
+    if not payload.get("degraded_sections"):
+        cache.set(key, payload, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return payload, 'MISS'
+
+def warm_dashboard(profile_id, period_key, builder):
+    """
+    Builds and stores the dashboard payload for the profile/period unless it is already cached
+    under the current data version, for DASHBOARD_PREWARM_TIMEOUT seconds so it lasts through the
+    morning traffic. Does not touch the hit/miss counters.
+    Returns True when a payload was built and stored.
+    """
+    key = get_dashboard_cache_key(profile_id, period_key)
+    if key is None or cache.get(key) is not None:
+        return False
+
+    payload = builder()
+    if payload.get("degraded_sections"):
+        return False
+    cache.set(key, payload, timeout=settings.DASHBOARD_PREWARM_TIMEOUT)
+    return True
+
+def get_dashboard_cache_stats():
+    hits = cache.get(DASHBOARD_CACHE_HITS_KEY) or 0
+    misses = cache.get(DASHBOARD_CACHE_MISSES_KEY) or 0
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else 0.0,
+    }
+
+def reset_dashboard_cache_stats():
+    cache.delete_many([DASHBOARD_CACHE_HITS_KEY, DASHBOARD_CACHE_MISSES_KEY])
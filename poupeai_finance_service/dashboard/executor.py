@@ -0,0 +1,100 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import structlog
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+log = structlog.get_logger(__name__)
+
+EXECUTOR_SERIAL = "serial"
+EXECUTOR_THREADS = "threads"
+
+@dataclass
+class DashboardSection:
+    """
+    An independent piece of the dashboard payload.
+    `fallback` is returned instead of the result when the section fails or exceeds its timeout.
+    """
+    name: str
+    func: Callable[[], Any]
+    fallback: Any
+
+    @property
+    def timeout(self):
+        return settings.DASHBOARD_SECTION_TIMEOUTS.get(self.name, settings.DASHBOARD_SECTION_TIMEOUT)
+
+_thread_pool = None
+
+def _get_thread_pool():
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=settings.DASHBOARD_MAX_WORKERS,
+            thread_name_prefix="dashboard-section",
+        )
+    return _thread_pool
+
+def _run_in_worker(func):
+    # Worker threads get their own DB connections; recycle them like Django does around requests.
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+def _degrade(section, reason, degraded, exc=None):
+    log.warning(
+        "Dashboard section degraded",
+        section=section.name,
+        reason=reason,
+        exc_info=exc,
+    )
+    degraded.append(section.name)
+    return section.fallback
+
+def _run_serial(sections, degraded):
+    results = {}
+    for section in sections:
+        try:
+            # Sections run inside the request transaction; the savepoint keeps a failed query
+            # from aborting it for the sections that follow.
+            with transaction.atomic():
+                results[section.name] = section.func()
+        except Exception as e:
+            results[section.name] = _degrade(section, "error", degraded, e)
+    return results
+
+def _run_threads(sections, degraded):
+    pool = _get_thread_pool()
+    started_at = time.monotonic()
+    futures = [(section, pool.submit(_run_in_worker, section.func)) for section in sections]
+
+    results = {}
+    for section, future in futures:
+        remaining = section.timeout - (time.monotonic() - started_at)
+        try:
+            results[section.name] = future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            future.cancel()
+            results[section.name] = _degrade(section, "timeout", degraded)
+        except Exception as e:
+            results[section.name] = _degrade(section, "error", degraded, e)
+    return results
+
+def run_sections(sections, mode=None):
+    """
+    Runs the dashboard sections and returns ({name: result}, [degraded section names]).
+    In "threads" mode the sections run concurrently on a bounded pool, each one bounded by its
+    own timeout, so the response time follows the slowest section instead of their sum.
+    """
+    mode = mode or settings.DASHBOARD_EXECUTOR
+    degraded = []
+    if mode == EXECUTOR_THREADS:
+        results = _run_threads(sections, degraded)
+    else:
+        results = _run_serial(sections, degraded)
+    return results, degraded
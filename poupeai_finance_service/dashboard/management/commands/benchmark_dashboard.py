@@ -0,0 +1,114 @@
+import json
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from poupeai_finance_service.dashboard.benchmarks import (
+    compare_reports,
+    get_benchmark_profile,
+    get_git_commit,
+    run_dashboard_benchmark,
+    seed_benchmark_profile,
+)
+
+class Command(BaseCommand):
+    help = (
+        "Seeds benchmark profiles with synthetic transactions, cards, invoices and installments, "
+        "times DashboardView.get and every dashboard.services function, and writes a JSON report "
+        "that can be compared between commits. Authentication is stubbed, so Keycloak is not needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[1000, 100000, 1000000],
+            help='Number of transactions of each seeded profile.'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per scenario.')
+        parser.add_argument(
+            '--history-days',
+            type=int,
+            default=3650,
+            help='Maximum number of days of history of a seeded profile.'
+        )
+        parser.add_argument(
+            '--output',
+            default='benchmark-dashboard.json',
+            help='Path of the JSON report.'
+        )
+        parser.add_argument(
+            '--compare',
+            default=None,
+            help='Path of a previous report to compare the medians with.'
+        )
+        parser.add_argument(
+            '--reuse',
+            action='store_true',
+            help='Reuse the profiles seeded by a previous run instead of seeding them again.'
+        )
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded profiles afterwards.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING(
+                f"Running against {connection.vendor}; the numbers are not comparable with Postgres runs."
+            ))
+
+        report = {
+            "commit": get_git_commit(),
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "executor": settings.DASHBOARD_EXECUTOR,
+            "repeat": options['repeat'],
+            "history_days": options['history_days'],
+            "sizes": {},
+        }
+
+        for size in sorted(options['sizes']):
+            profile = get_benchmark_profile(size) if options['reuse'] else None
+            seed_seconds = None
+            if profile is None:
+                self.stdout.write(f"Seeding {size} transactions...")
+                started_at = time.perf_counter()
+                profile = seed_benchmark_profile(size, max_history_days=options['history_days'])
+                seed_seconds = round(time.perf_counter() - started_at, 3)
+
+            try:
+                scenarios = run_dashboard_benchmark(profile, repeat=options['repeat'])
+            finally:
+                if not options['keep'] and not options['reuse']:
+                    profile.delete()
+
+            report["sizes"][str(size)] = {"seed_seconds": seed_seconds, "scenarios": scenarios}
+            self._write_size(size, scenarios)
+
+        with open(options['output'], 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+
+        if options['compare']:
+            self._compare(options['compare'], report)
+
+    def _write_size(self, size, scenarios):
+        self.stdout.write(f"== {size} transactions")
+        for name, result in scenarios.items():
+            self.stdout.write(
+                f"  {name:<42} median={result['wall_ms_median']:>10.2f}ms "
+                f"min={result['wall_ms_min']:>10.2f}ms queries={result['queries']}"
+            )
+
+    def _compare(self, path, report):
+        try:
+            with open(path) as baseline_file:
+                baseline = json.load(baseline_file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read the baseline report {path}: {e}")
+
+        self.stdout.write(f"== Compared with {path} (commit {baseline.get('commit')})")
+        for size, name, before, after, ratio in compare_reports(baseline, report):
+            self.stdout.write(f"  {size:>8} {name:<42} {before:>10.2f}ms -> {after:>10.2f}ms ({ratio:.2f}x)")
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from poupeai_finance_service.dashboard.benchmarks import measure, seed_benchmark_profile
+from poupeai_finance_service.dashboard.services import fetch_savings_estimate
+
+class Command(BaseCommand):
+    help = (
+        "Times fetch_savings_estimate on profiles with a growing transaction history. "
+        "The latency must stay flat, since only the last months are aggregated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[1000, 10000, 100000],
+            help='Number of transactions of each seeded profile.'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per size.')
+        parser.add_argument(
+            '--max-ratio',
+            type=float,
+            default=None,
+            help='Fail when the median of the largest size exceeds the smallest one by this factor.'
+        )
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded profiles afterwards.')
+
+    def handle(self, *args, **options):
+        results = []
+        for size in sorted(options['sizes']):
+            profile = seed_benchmark_profile(size)
+            try:
+                # Warm-up run, so the first size does not pay for cold caches.
+                fetch_savings_estimate(profile, None)
+                result = measure(
+                    lambda: fetch_savings_estimate(profile, None),
+                    repeat=options['repeat'],
+                )
+            finally:
+                if not options['keep']:
+                    profile.delete()
+
+            results.append((size, result))
+            self.stdout.write(
+                f"{size:>10} transactions: median={result['wall_ms_median']:.2f}ms "
+                f"min={result['wall_ms_min']:.2f}ms queries={result['queries']}"
+            )
+
+        smallest, largest = results[0][1], results[-1][1]
+        ratio = largest['wall_ms_median'] / smallest['wall_ms_median'] if smallest['wall_ms_median'] else 0.0
+        self.stdout.write(f"Largest/smallest median ratio: {ratio:.2f}")
+
+        if options['max_ratio'] is not None and ratio > options['max_ratio']:
+            raise CommandError(f"Savings estimate latency grew {ratio:.2f}x with the history size.")
+        self.stdout.write(self.style.SUCCESS("Savings estimate benchmark finished."))
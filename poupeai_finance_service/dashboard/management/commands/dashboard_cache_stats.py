@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from poupeai_finance_service.dashboard.cache import get_dashboard_cache_stats, reset_dashboard_cache_stats
+
+class Command(BaseCommand):
+    help = "Shows the dashboard response cache hit/miss counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing them.')
+
+    def handle(self, *args, **options):
+        stats = get_dashboard_cache_stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_ratio={stats['hit_ratio']}"
+        )
+        if options['reset']:
+            reset_dashboard_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Dashboard cache counters reset."))
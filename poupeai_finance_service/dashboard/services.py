@@ -1,15 +1,23 @@
 import structlog
 
-from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.transactions.models import DailyLedgerRollup, Transaction
 from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
+from poupeai_finance_service.dashboard.executor import DashboardSection, run_sections
+from poupeai_finance_service.dashboard.tools import (
+    GRANULARITY_DAY,
+    downsample_lttb,
+    get_difference_in_percent,
+    iter_buckets,
+)
 
 from datetime import date
 from dateutil.relativedelta import relativedelta
 
 from django.utils import timezone
 from django.db import models
-from django.db.models import Sum
-from django.db.models.functions import Coalesce
+from django.db.models import F, Min, Q, Sum
+from django.db.models.functions import Coalesce, Trunc
 
 from decimal import Decimal
 
@@ -19,106 +27,107 @@ import requests
 
 log = structlog.get_logger(__name__)
 
-def get_initial_balance_until(profile, bank_accounts, until_date):
-    initial_balance = sum([account.initial_balance for account in bank_accounts])
-    incomes = Transaction.objects.filter(
-        profile=profile,
-        type='income',
-        issue_date__lt=until_date,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
-    ).aggregate(total=models.Sum('amount'))['total'] or 0
-    expenses = Transaction.objects.filter(
-        profile=profile,
-        type='expense',
-        issue_date__lt=until_date,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
-    ).aggregate(total=models.Sum('amount'))['total'] or 0
-    return initial_balance + incomes - expenses
-
-def get_transactions_by_period(profile, start, end):
-    incomes = Transaction.objects.filter(
+SPENDING_OTHERS_COLOR = "#9E9E9E"
+
+def get_totals_until(profile, until_date):
+    """
+    Soma receitas e despesas de conta bancária anteriores a `until_date` em uma única consulta.
+    Lê a tabela de rollups diários em vez de percorrer todo o histórico de transações.
+    """
+    rows = DailyLedgerRollup.objects.filter(
         profile=profile,
-        type='income',
-        issue_date__gte=start,
-        issue_date__lt=end,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
-    )
-    expenses = Transaction.objects.filter(
+        date__lt=until_date,
+        source_type='BANK_ACCOUNT'
+    ).values('type').annotate(total=Sum('total_amount')).order_by()
+
+    totals = {'income': Decimal('0.0'), 'expense': Decimal('0.0')}
+    for row in rows:
+        totals[row['type']] += row['total']
+    return totals
+
+def get_initial_balance_until(profile, bank_accounts, until_date, totals_until=None):
+    initial_balance = sum([account.initial_balance for account in bank_accounts])
+    if totals_until is None:
+        totals_until = get_totals_until(profile, until_date)
+    return initial_balance + totals_until['income'] - totals_until['expense']
+
+def get_daily_totals(profile, start, end, granularity=GRANULARITY_DAY):
+    """
+    Agrupa as transações de conta bancária do período por (bucket, type) em uma única consulta sobre os rollups.
+    O bucket é o dia, ou o início da semana/mês truncado no banco (date_trunc) conforme `granularity`.
+    Retorna um dicionário {date: {'income': Decimal, 'expense': Decimal}} apenas com os buckets que têm movimento.
+    """
+    rollups = DailyLedgerRollup.objects.filter(
         profile=profile,
-        type='expense',
-        issue_date__gte=start,
-        issue_date__lt=end,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
+        date__gte=start,
+        date__lt=end,
+        source_type='BANK_ACCOUNT'
     )
-    return incomes, expenses
+    if granularity == GRANULARITY_DAY:
+        rollups = rollups.annotate(bucket=F('date'))
+    else:
+        rollups = rollups.annotate(bucket=Trunc('date', granularity, output_field=models.DateField()))
+    rows = rollups.values('bucket', 'type').annotate(total=Sum('total_amount')).order_by()
 
-def get_chart_data(incomes, expenses, start, end, initial_balance):
-    chart_data = []
-    current_balance = initial_balance 
+    daily_totals = defaultdict(lambda: {'income': Decimal('0.0'), 'expense': Decimal('0.0')})
+    for row in rows:
+        daily_totals[row['bucket']][row['type']] += row['total']
+    return daily_totals
 
-    daily_totals = defaultdict(lambda: {'incomes': Decimal('0.0'), 'expenses': Decimal('0.0')})
+def densify_daily_totals(daily_totals, start, end, granularity=GRANULARITY_DAY):
+    """
+    Gera a série completa de buckets do período, preenchendo com zero os buckets sem transações.
+    O primeiro bucket de uma semana/mês parcial é rotulado com o início do período.
+    """
+    empty = {'income': Decimal('0.0'), 'expense': Decimal('0.0')}
+    for bucket in iter_buckets(start, end, granularity):
+        yield max(bucket, start), daily_totals.get(bucket, empty)
 
-    # Certifique-se de que os objetos incomes e expenses sejam QuerySets
-    # Iterar sobre QuerySet para agrupar por data (já está ok como amount é Decimal)
-    for income in incomes:
-        daily_totals[income.issue_date.isoformat()]['incomes'] += income.amount 
-    for expense in expenses:
-        daily_totals[expense.issue_date.isoformat()]['expenses'] += expense.amount 
+def get_chart_data(daily_totals, start, end, initial_balance, granularity=GRANULARITY_DAY, max_points=None):
+    chart_data = []
+    current_balance = initial_balance
 
-    # Iterar sobre cada dia do período. Agora 'start' e 'end' são objetos date.
-    for i in range((end - start).days): 
-        day = start + timezone.timedelta(days=i)
-        day_str = day.isoformat() # Usar isoformat direto do objeto date
-        
-        day_incomes = daily_totals[day_str]['incomes']
-        day_expenses = daily_totals[day_str]['expenses']
-        
-        current_balance += day_incomes - day_expenses
+    for day, totals in densify_daily_totals(daily_totals, start, end, granularity):
+        current_balance += totals['income'] - totals['expense']
 
         chart_data.append({
-            "date": day_str,
+            "date": day.isoformat(),
             "balance": float(current_balance),
         })
+
+    if max_points:
+        chart_data = downsample_lttb(chart_data, max_points, "balance")
     return chart_data, current_balance
 
-def get_category_chart_data(queryset, start, end):
-    chart_data = []
-    for i in range((end - start).days):
-        day = start + timezone.timedelta(days=i)
-        day_str = day.isoformat() # Usar isoformat direto do objeto date
-        # O queryset já vem filtrado pelo período. Agora filtramos por objeto date.
-        day_total = queryset.filter(issue_date=day).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.0') # <--- ALTEARADO AQUI (day e Decimal)
-        chart_data.append({
-            "date": day_str,
-            "total": float(day_total),
-        })
-    return chart_data
+def get_category_chart_data(daily_totals, category_type, start, end, granularity=GRANULARITY_DAY):
+    return [
+        {
+            "date": day.isoformat(),
+            "total": float(totals[category_type]),
+        }
+        for day, totals in densify_daily_totals(daily_totals, start, end, granularity)
+    ]
 
-def get_category_summary(profile, bank_accounts, category_type, start, end):
+def get_category_summary(profile, bank_accounts, category_type, start, end, daily_totals=None, totals_until=None,
+                         granularity=GRANULARITY_DAY):
     """
     Calcula o total, diferença percentual e chart_data para receitas ou despesas.
+    `daily_totals` e `totals_until` podem ser reaproveitados entre receitas, despesas e saldo
+    para que o custo não dependa da quantidade de dias do período.
     """
+    if daily_totals is None:
+        daily_totals = get_daily_totals(profile, start, end, granularity)
+    if totals_until is None:
+        totals_until = get_totals_until(profile, start)
+
     # Transações do período atual
-    queryset = Transaction.objects.filter(
-        profile=profile,
-        type=category_type,
-        issue_date__gte=start,
-        issue_date__lt=end,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
-    )
-    current_total = queryset.aggregate(total=models.Sum('amount'))['total'] or 0
+    current_total = sum((totals[category_type] for totals in daily_totals.values()), Decimal('0.0'))
 
     # Transações do período anterior
     # Importante: o cálculo da diferença percentual está comparando o total atual
     # com o *total acumulado até o início do período atual*. Se você deseja
     # comparar com o total do *período imediatamente anterior*, esta lógica precisaria ser alterada.
-    # Por ora, mantemos o filtro source_type.
-    prev_total = Transaction.objects.filter(
-        profile=profile,
-        type=category_type,
-        issue_date__lt=start,
-        source_type='BANK_ACCOUNT' # Adicionado filtro
-    ).aggregate(total=models.Sum('amount'))['total'] or 0
+    prev_total = totals_until[category_type]
 
     # Diferença percentual
     if prev_total == 0:
@@ -127,7 +136,7 @@ def get_category_summary(profile, bank_accounts, category_type, start, end):
         percent_diff = ((current_total - prev_total) / abs(prev_total)) * 100
 
     # Chart data
-    chart_data = get_category_chart_data(queryset, start, end)
+    chart_data = get_category_chart_data(daily_totals, category_type, start, end, granularity)
 
     return {
         "current_total": float(current_total),
@@ -194,42 +203,50 @@ def get_invoices_summary(profile, year, month):
         "chart_data": invoices_data
     }
 
-def fetch_savings_estimate(account_id, transactions_queryset, access_token):
+def fetch_savings_estimate(profile, access_token):
     """
     Estima a economia mensal com base nas transações de receita e despesa.
+    Os totais do mês anterior e do mês retrasado são calculados no banco com uma única agregação
+    condicional sobre os totais diários, então o custo não cresce com o histórico do perfil.
     """
+    account_id = profile.user_id
     today = date.today()
     start_date = today.replace(day=1) - relativedelta(months=3)
-    
-    transactions = transactions_queryset.prefetch_related("category").filter(
-        issue_date__gte=start_date,
-        issue_date__lte=today
+
+    end_current_period = today.replace(day=1) - relativedelta(days=1)
+    start_current_period = end_current_period.replace(day=1)
+
+    end_previous_period = start_current_period - relativedelta(days=1)
+    start_previous_period = end_previous_period.replace(day=1)
+
+    totals = DailyLedgerRollup.objects.filter(
+        profile=profile,
+        date__gte=start_date,
+        date__lte=today
+    ).aggregate(
+        transactions_count=Sum('transaction_count', default=0),
+        current_period_expenses=Sum(
+            'total_amount',
+            filter=Q(type='expense', date__range=(start_current_period, end_current_period)),
+            default=Decimal('0.0')
+        ),
+        previous_period_expenses=Sum(
+            'total_amount',
+            filter=Q(type='expense', date__range=(start_previous_period, end_previous_period)),
+            default=Decimal('0.0')
+        ),
     )
 
-    if not transactions.exists():
+    if not totals['transactions_count']:
         return {
             "estimated_savings": 0.0,
             "savings_percentage": 0.0,
             "message": "Não há transações recentes para calcular a economia.",
             "comparison_period": "monthly"
         }
-    
-    end_current_period = today.replace(day=1) - relativedelta(days=1)
-    start_current_period = end_current_period.replace(day=1)
-
-    end_previous_period = start_current_period - relativedelta(days=1)
-    start_previous_period = end_previous_period.replace(day=1)
 
-    current_period_expenses = 0.0
-    previous_period_expenses = 0.0
-
-    for t in transactions:
-        if t.type == 'expense':
-            amount = float(t.amount)
-            if start_current_period <= t.issue_date <= end_current_period:
-                current_period_expenses += amount
-            elif start_previous_period <= t.issue_date <= end_previous_period:
-                previous_period_expenses += amount
+    current_period_expenses = totals['current_period_expenses']
+    previous_period_expenses = totals['previous_period_expenses']
     
     if previous_period_expenses == 0:
         log.warning(f"Análise de economia para conta {account_id} não pôde ser feita. "
@@ -258,12 +275,195 @@ def fetch_savings_estimate(account_id, transactions_queryset, access_token):
         message = "Seus gastos permaneceram os mesmos em relação ao mês anterior."
 
     return {
-        "estimated_savings": round(difference, 2),
-        "savings_percentage": round(percentage_change, 2),
+        "estimated_savings": float(round(difference, 2)),
+        "savings_percentage": float(round(percentage_change, 2)),
         "message": message,
         "comparison_period": "monthly"
     }
 
+def get_spending_by_category(profile, start, end, top_n=None):
+    """
+    Agrupa as despesas do período (conta bancária e cartão) por categoria em uma única consulta,
+    com o nome e a cor da categoria vindos do JOIN. As `top_n` maiores categorias são retornadas
+    individualmente e as demais são somadas no grupo "Outros".
+    """
+    if top_n is None:
+        top_n = settings.DASHBOARD_SPENDING_TOP_N
+
+    rows = DailyLedgerRollup.objects.filter(
+        profile=profile,
+        date__gte=start,
+        date__lt=end,
+        type='expense'
+    ).values(
+        'category_id', 'category__name', 'category__color_hex'
+    ).annotate(total=Sum('total_amount')).order_by('-total', 'category__name')
+
+    rows = list(rows)
+    total = sum((row['total'] for row in rows), Decimal('0.0'))
+
+    def get_percentage(value):
+        return float(round(value / total * 100, 2)) if total else 0.0
+
+    categories = [
+        {
+            "category_id": row['category_id'],
+            "name": row['category__name'],
+            "color_hex": row['category__color_hex'],
+            "total": float(row['total']),
+            "percentage": get_percentage(row['total']),
+        }
+        for row in rows[:top_n]
+    ]
+
+    others = rows[top_n:]
+    if others:
+        others_total = sum((row['total'] for row in others), Decimal('0.0'))
+        categories.append({
+            "category_id": None,
+            "name": "Outros",
+            "color_hex": SPENDING_OTHERS_COLOR,
+            "total": float(others_total),
+            "percentage": get_percentage(others_total),
+        })
+
+    return {
+        "total": float(total),
+        "categories": categories,
+    }
+
+EMPTY_SUMMARY = {
+    "current_total": 0.0,
+    "difference": 0.0,
+    "chart_data": [],
+}
+
+EMPTY_SPENDING_BY_CATEGORY = {
+    "total": 0.0,
+    "categories": [],
+}
+
+EMPTY_SAVINGS_ESTIMATE = {
+    "estimated_savings": 0.0,
+    "savings_percentage": 0.0,
+    "message": "Não foi possível calcular a economia no momento.",
+    "comparison_period": "monthly"
+}
+
+def get_balance_summary(profile, start, end, daily_totals, totals_until, granularity=GRANULARITY_DAY, max_points=None):
+    """
+    Calcula o saldo atual, a diferença percentual e o chart_data do saldo no período.
+    Com `max_points`, a série do saldo é reduzida com LTTB para no máximo esse número de pontos.
+    """
+    bank_accounts = BankAccount.objects.filter(profile=profile)
+
+    initial_balance = get_initial_balance_until(profile, bank_accounts, start, totals_until)
+    balance_chart_data, current_balance = get_chart_data(
+        daily_totals, start, end, initial_balance, granularity, max_points
+    )
+
+    return {
+        "current_total": current_balance,
+        "difference": get_difference_in_percent(initial_balance, current_balance),
+        "chart_data": balance_chart_data
+    }
+
+PERIOD_ALL = "all"
+
+def get_dashboard_period(profile, period=None):
+    """
+    Converte o parâmetro `period` no intervalo [start, end) do dashboard, como objetos date.
+    Aceita 'yyyy-mm' (mês), 'yyyy' (ano), 'all' (todo o histórico até hoje) ou None (últimos 30 dias,
+    incluindo o dia atual). Lança ValueError para formatos inválidos.
+    """
+    today = timezone.now().date()
+    default_end = today + timezone.timedelta(days=1)
+    default_start = default_end - timezone.timedelta(days=30)
+
+    if not period:
+        return default_start, default_end
+
+    if period == PERIOD_ALL:
+        first_date = DailyLedgerRollup.objects.filter(profile=profile).aggregate(first=Min('date'))['first']
+        start = min(first_date, default_start) if first_date else default_start
+        return start, default_end
+
+    parts = period.split('-')
+    if len(parts) == 1:
+        start = date(int(parts[0]), 1, 1)
+        return start, start + relativedelta(years=1)
+    if len(parts) == 2:
+        start = date(int(parts[0]), int(parts[1]), 1)
+        return start, start + relativedelta(months=1)
+    raise ValueError(f"Invalid dashboard period: {period}")
+
+def get_dashboard_data(profile, start_date, end_date, access_token=None, granularity=GRANULARITY_DAY, max_points=None):
+    """
+    Monta o payload completo do dashboard para o período [start_date, end_date).
+    As seções são independentes e rodam pelo executor configurado em DASHBOARD_EXECUTOR;
+    uma seção que falhe ou estoure o timeout é substituída pelo seu fallback e listada em "degraded_sections".
+    """
+    # Uma única consulta agrupada por (bucket, type) alimenta o saldo, as receitas e as despesas
+    daily_totals = get_daily_totals(profile, start_date, end_date, granularity)
+    totals_until = get_totals_until(profile, start_date)
+
+    sections = [
+        DashboardSection(
+            "balance",
+            lambda: get_balance_summary(
+                profile, start_date, end_date, daily_totals, totals_until, granularity, max_points
+            ),
+            EMPTY_SUMMARY,
+        ),
+        DashboardSection(
+            "incomes",
+            lambda: get_category_summary(
+                profile, None, 'income', start_date, end_date, daily_totals, totals_until, granularity
+            ),
+            EMPTY_SUMMARY,
+        ),
+        DashboardSection(
+            "expenses",
+            lambda: get_category_summary(
+                profile, None, 'expense', start_date, end_date, daily_totals, totals_until, granularity
+            ),
+            EMPTY_SUMMARY,
+        ),
+        # Para get_invoices_summary, passe o ano e mês do início do período
+        DashboardSection(
+            "invoices",
+            lambda: get_invoices_summary(profile, start_date.year, start_date.month),
+            EMPTY_SUMMARY,
+        ),
+        DashboardSection(
+            "spending_by_category",
+            lambda: get_spending_by_category(profile, start_date, end_date),
+            EMPTY_SPENDING_BY_CATEGORY,
+        ),
+        DashboardSection(
+            "estimated_saving",
+            lambda: fetch_savings_estimate(profile, access_token),
+            EMPTY_SAVINGS_ESTIMATE,
+        ),
+    ]
+    results, degraded_sections = run_sections(sections)
+
+    payload = {
+        "message": "Dashboard data retrieved successfully.",
+        "start_date": start_date.isoformat(),
+        "end_date": (end_date - timezone.timedelta(days=1)).isoformat(),
+        "granularity": granularity,
+        "balance": results["balance"],
+        "incomes": results["incomes"],
+        "expenses": results["expenses"],
+        "invoices": results["invoices"],
+        "spending_by_category": results["spending_by_category"],
+        "estimated_saving": results["estimated_saving"],
+    }
+    if degraded_sections:
+        payload["degraded_sections"] = degraded_sections
+    return payload
+
 # def fetch_savings_estimate(account_id, transactions_queryset, access_token):
 #     """
 #     Estima a economia mensal com base nas transações de receita e despesa.
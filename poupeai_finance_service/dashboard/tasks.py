@@ -0,0 +1,144 @@
+import time
+import uuid
+from datetime import timedelta
+
+import structlog
+from celery import chain, chord, shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.utils import timezone
+
+from poupeai_finance_service.core.events import EventType
+from poupeai_finance_service.dashboard.cache import get_dashboard_period_key, warm_dashboard
+from poupeai_finance_service.dashboard.services import get_dashboard_data, get_dashboard_period
+from poupeai_finance_service.dashboard.tools import GRANULARITY_DAY
+from poupeai_finance_service.profiles.models import Profile
+from poupeai_finance_service.transactions.models import Transaction
+
+log = structlog.get_logger(__name__)
+
+def get_active_profile_ids(days):
+    """
+    Returns the ids of the active profiles with transactions created or updated in the last `days` days.
+    """
+    since = timezone.now() - timedelta(days=days)
+    return list(
+        Profile.objects.filter(
+            is_deactivated=False,
+            pk__in=Transaction.objects.filter(updated_at__gte=since).values('profile_id')
+        ).order_by('pk').values_list('pk', flat=True)
+    )
+
+def get_prewarm_periods():
+    # The default view (last 30 days) and the current month are what clients open first.
+    return [None, timezone.now().date().strftime('%Y-%m')]
+
+def warm_profile_dashboards(profile):
+    warmed = 0
+    for period in get_prewarm_periods():
+        start_date, end_date = get_dashboard_period(profile, period)
+        warmed += warm_dashboard(
+            profile.pk,
+            get_dashboard_period_key(start_date, end_date, GRANULARITY_DAY),
+            lambda: get_dashboard_data(profile, start_date, end_date),
+        )
+    return warmed
+
+@shared_task(
+    soft_time_limit=settings.DASHBOARD_PREWARM_CHUNK_SOFT_TIME_LIMIT,
+    time_limit=settings.DASHBOARD_PREWARM_CHUNK_SOFT_TIME_LIMIT + 60
+)
+def prewarm_dashboard_chunk(warmed_so_far, profile_ids, correlation_id=None):
+    """
+    Pre-warms the dashboards of a chunk of profiles. Chunks of the same lane are chained,
+    so each one receives the running count of the previous chunk.
+    When the chunk hits its soft time limit it stops and still returns its count, so the rest
+    of the lane and the final report run.
+    """
+    warmed_profiles = 0
+    try:
+        for profile in Profile.objects.filter(pk__in=profile_ids, is_deactivated=False):
+            try:
+                warm_profile_dashboards(profile)
+                warmed_profiles += 1
+            except SoftTimeLimitExceeded:
+                raise
+            except Exception as e:
+                log.error(
+                    "Failed to pre-warm dashboard",
+                    event_type=EventType.DASHBOARD_PREWARM_FAILED,
+                    exc_info=e,
+                    correlation_id=correlation_id,
+                    event_details={"profile_id": str(profile.pk)}
+                )
+    except SoftTimeLimitExceeded as e:
+        log.error(
+            "Dashboard pre-warm chunk hit its time limit",
+            event_type=EventType.DASHBOARD_PREWARM_FAILED,
+            exc_info=e,
+            correlation_id=correlation_id,
+            event_details={"profiles_count": len(profile_ids), "warmed_count": warmed_profiles}
+        )
+    return warmed_so_far + warmed_profiles
+
+@shared_task
+def report_dashboard_prewarm(lane_results, started_at, profiles_count, correlation_id=None):
+    warmed_count = sum(lane_results)
+    duration = round(time.time() - started_at, 3)
+    summary = f"Pre-warmed dashboards of {warmed_count}/{profiles_count} active profiles in {duration}s."
+    log.info(
+        summary,
+        event_type=EventType.DASHBOARD_PREWARM_COMPLETED,
+        correlation_id=correlation_id,
+        trigger_type="system_scheduled",
+        event_details={
+            "warmed_count": warmed_count,
+            "profiles_count": profiles_count,
+            "duration_seconds": duration,
+        }
+    )
+    return {"warmed_count": warmed_count, "profiles_count": profiles_count, "duration_seconds": duration}
+
+@shared_task
+def prewarm_dashboards(days=None, chunk_size=None, concurrency=None):
+    """
+    Fills the dashboard cache of the profiles active in the last `days` days before the morning traffic.
+    Profiles are split in chunks; the chunks are distributed in `concurrency` lanes that run in
+    parallel across the workers, each lane processing its chunks one after the other.
+    """
+    days = days or settings.DASHBOARD_PREWARM_ACTIVE_DAYS
+    chunk_size = chunk_size or settings.DASHBOARD_PREWARM_CHUNK_SIZE
+    concurrency = concurrency or settings.DASHBOARD_PREWARM_CONCURRENCY
+    correlation_id = str(uuid.uuid4())
+
+    if not settings.DASHBOARD_CACHE_ENABLED:
+        log.info("Dashboard cache is disabled, skipping pre-warm.", event_type=EventType.DASHBOARD_PREWARM_SKIPPED)
+        return "Dashboard cache is disabled."
+
+    profile_ids = [str(profile_id) for profile_id in get_active_profile_ids(days)]
+    if not profile_ids:
+        log.info("No active profiles to pre-warm.", event_type=EventType.DASHBOARD_PREWARM_SKIPPED)
+        return "No active profiles to pre-warm."
+
+    chunks = [profile_ids[i:i + chunk_size] for i in range(0, len(profile_ids), chunk_size)]
+    lanes = [chunks[i::concurrency] for i in range(min(concurrency, len(chunks)))]
+
+    log.info(
+        "Starting dashboard pre-warm",
+        event_type=EventType.DASHBOARD_PREWARM_STARTED,
+        correlation_id=correlation_id,
+        trigger_type="system_scheduled",
+        event_details={"profiles_count": len(profile_ids), "chunks": len(chunks), "lanes": len(lanes)}
+    )
+
+    lane_signatures = [
+        chain(
+            prewarm_dashboard_chunk.s(0, lane[0], correlation_id),
+            *[prewarm_dashboard_chunk.s(chunk, correlation_id) for chunk in lane[1:]]
+        )
+        for lane in lanes
+    ]
+    chord(lane_signatures)(
+        report_dashboard_prewarm.s(time.time(), len(profile_ids), correlation_id)
+    )
+    return f"Scheduled the pre-warm of {len(profile_ids)} profiles in {len(chunks)} chunks."
@@ -1,6 +1,80 @@
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+
+GRANULARITY_DAY = "day"
+GRANULARITY_WEEK = "week"
+GRANULARITY_MONTH = "month"
+GRANULARITIES = (GRANULARITY_DAY, GRANULARITY_WEEK, GRANULARITY_MONTH)
+
 def get_difference_in_percent(initial_balance, current_balance):
     if initial_balance == 0:
         return 100.0 if current_balance > 0 else -100.0
     else:
         difference = current_balance - initial_balance
-        return (difference / abs(initial_balance)) * 100 if initial_balance != 0 else 0.0
\ No newline at end of file
+        return (difference / abs(initial_balance)) * 100 if initial_balance != 0 else 0.0
+
+def get_bucket_start(day, granularity):
+    """
+    Returns the first day of the bucket containing `day`, matching Postgres' date_trunc
+    (weeks start on Monday).
+    """
+    if granularity == GRANULARITY_WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == GRANULARITY_MONTH:
+        return day.replace(day=1)
+    return day
+
+def iter_buckets(start, end, granularity):
+    """
+    Yields the start of every bucket overlapping [start, end).
+    """
+    if granularity == GRANULARITY_WEEK:
+        step = timedelta(weeks=1)
+    elif granularity == GRANULARITY_MONTH:
+        step = relativedelta(months=1)
+    else:
+        step = timedelta(days=1)
+
+    bucket = get_bucket_start(start, granularity)
+    while bucket < end:
+        yield bucket
+        bucket += step
+
+def downsample_lttb(data, threshold, key):
+    """
+    Downsamples `data` to `threshold` points with the Largest-Triangle-Three-Buckets algorithm,
+    keeping the first and last points and the shape of the series. `key` is the name of the
+    value field; the position of each point in the list is used as its x coordinate.
+    """
+    length = len(data)
+    if threshold >= length or threshold < 3:
+        return data
+
+    every = (length - 2) / (threshold - 2)
+    sampled = [data[0]]
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, length)
+        avg_x = (avg_start + avg_end - 1) / 2
+        avg_y = sum(data[j][key] for j in range(avg_start, avg_end)) / (avg_end - avg_start)
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        a_y = data[a][key]
+
+        max_area = -1
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((a - avg_x) * (data[j][key] - a_y) - (a - j) * (avg_y - a_y))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled.append(data[next_a])
+        a = next_a
+
+    sampled.append(data[-1])
+    return sampled
@@ -18,6 +18,8 @@ from poupeai_finance_service.goals.api.serializers import (
     GoalDetailSerializer, 
     GoalDepositSerializer
 )
+from poupeai_finance_service.core.conditional import ConditionalListMixin
+from poupeai_finance_service.core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
 from django.utils import timezone
 
@@ -55,7 +57,7 @@ log = structlog.get_logger(__name__)
         description='Delete a specific goal'
     ),
 )
-class GoalViewSet(viewsets.ModelViewSet):
+class GoalViewSet(ConditionalListMixin, viewsets.ModelViewSet):
     queryset = Goal.objects.all()    
     serializer_class = GoalListSerializer
     permission_classes = [IsProfileActive, IsAuthenticated]
@@ -161,6 +163,7 @@ class GoalViewSet(viewsets.ModelViewSet):
         summary='Add deposit to goal',
         description='Add a deposit to a specific goal',
         parameters=[
+            IDEMPOTENCY_KEY_PARAMETER,
             OpenApiParameter(
                 name='id',
                 description='Goal ID',
@@ -187,6 +190,7 @@ class GoalDepositViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
             
         return context
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         goal = get_object_or_404(Goal, pk=self.kwargs.get('id'), profile=request.user)
         serializer = self.get_serializer(data=request.data)
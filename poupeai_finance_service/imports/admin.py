@@ -0,0 +1,15 @@
+from django.contrib import admin
+from poupeai_finance_service.imports.models import StatementImport
+
+@admin.register(StatementImport)
+class StatementImportAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 'profile', 'file_name', 'file_format', 'source_type', 'status',
+        'processed_lines', 'imported_count', 'duplicate_count', 'failed_count', 'created_at'
+    )
+    list_filter = ('status', 'file_format', 'source_type')
+    search_fields = ('file_name', 'profile__email')
+    readonly_fields = ('errors', 'error_message', 'started_at', 'finished_at')
+    # The statement file is private and only lives while the import runs.
+    exclude = ('file',)
+    list_per_page = 10
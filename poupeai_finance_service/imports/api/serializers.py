@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from poupeai_finance_service.imports.models import StatementImport
+from poupeai_finance_service.imports.services import guess_file_format
+
+class StatementImportCreateSerializer(serializers.ModelSerializer):
+    file = serializers.FileField(write_only=True)
+    file_format = serializers.ChoiceField(choices=StatementImport.FileFormat.choices, required=False)
+
+    class Meta:
+        model = StatementImport
+        fields = [
+            'id', 'file', 'file_format', 'source_type', 'bank_account', 'credit_card',
+            'income_category', 'expense_category'
+        ]
+
+    def _validate_owner(self, instance, message):
+        if instance and instance.profile_id != self.context['request'].user.pk:
+            raise serializers.ValidationError(message)
+        return instance
+
+    def validate_bank_account(self, bank_account):
+        return self._validate_owner(bank_account, _("Bank account does not belong to your profile."))
+
+    def validate_credit_card(self, credit_card):
+        return self._validate_owner(credit_card, _("Credit card does not belong to your profile."))
+
+    def validate_income_category(self, category):
+        self._validate_owner(category, _("Category does not belong to your profile."))
+        if category and category.type != 'income':
+            raise serializers.ValidationError(_("The income category must be of type income."))
+        return category
+
+    def validate_expense_category(self, category):
+        self._validate_owner(category, _("Category does not belong to your profile."))
+        if category.type != 'expense':
+            raise serializers.ValidationError(_("The expense category must be of type expense."))
+        return category
+
+    def validate_file(self, file):
+        if file.size > settings.STATEMENT_IMPORT_MAX_FILE_SIZE:
+            raise serializers.ValidationError(
+                _("The file is larger than %(size)d MB.")
+                % {'size': settings.STATEMENT_IMPORT_MAX_FILE_SIZE // (1024 * 1024)}
+            )
+        return file
+
+    def validate(self, data):
+        source_type = data.get('source_type')
+        if source_type == 'BANK_ACCOUNT':
+            if not data.get('bank_account'):
+                raise serializers.ValidationError({'bank_account': _("Bank account is required for bank imports.")})
+            if data.get('credit_card'):
+                raise serializers.ValidationError({'credit_card': _("Bank imports cannot have a credit card.")})
+            if not data.get('income_category'):
+                raise serializers.ValidationError(
+                    {'income_category': _("Income category is required for bank imports.")}
+                )
+        elif source_type == 'CREDIT_CARD':
+            if not data.get('credit_card'):
+                raise serializers.ValidationError(
+                    {'credit_card': _("Credit card is required for credit card imports.")}
+                )
+            if data.get('bank_account'):
+                raise serializers.ValidationError(
+                    {'bank_account': _("Credit card imports cannot have a bank account.")}
+                )
+
+        data['file_name'] = data['file'].name[:255]
+        if not data.get('file_format'):
+            data['file_format'] = guess_file_format(data['file'].name)
+            if not data['file_format']:
+                raise serializers.ValidationError(
+                    {'file_format': _("Could not infer the file format from its name; send it as OFX or CSV.")}
+                )
+        return data
+
+class StatementImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StatementImport
+        fields = [
+            'id', 'file_name', 'file_format', 'source_type', 'bank_account', 'credit_card',
+            'income_category', 'expense_category', 'status', 'processed_lines', 'imported_count',
+            'duplicate_count', 'skipped_count', 'failed_count', 'errors', 'error_message',
+            'started_at', 'finished_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
@@ -0,0 +1,87 @@
+import structlog
+from django.db import transaction
+from drf_spectacular.utils import extend_schema_view, extend_schema
+from rest_framework import mixins, status, viewsets
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from poupeai_finance_service.core.events import EventType
+from poupeai_finance_service.core.permissions import IsOwnerProfile
+from poupeai_finance_service.imports.api.serializers import StatementImportCreateSerializer, StatementImportSerializer
+from poupeai_finance_service.imports.models import StatementImport
+from poupeai_finance_service.imports.tasks import process_statement_import
+from poupeai_finance_service.profiles.api.permissions import IsProfileActive
+
+log = structlog.get_logger(__name__)
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=['Imports'],
+        summary='List statement imports',
+        description='Retrieve the statement imports of the authenticated user and their progress'
+    ),
+    create=extend_schema(
+        tags=['Imports'],
+        summary='Import statement',
+        description=(
+            'Upload an OFX or CSV bank or credit card statement. The file is imported in the background; '
+            'poll the returned import for its status and counts. Lines already imported (same FITID, or '
+            'same content when the file has no ids) are skipped as duplicates.'
+        ),
+        request={'multipart/form-data': StatementImportCreateSerializer},
+        responses={202: StatementImportSerializer}
+    ),
+    retrieve=extend_schema(
+        tags=['Imports'],
+        summary='Get statement import',
+        description='Retrieve the status, counts and line errors of a statement import'
+    ),
+)
+class StatementImportViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet
+):
+    queryset = StatementImport.objects.all()
+    permission_classes = [IsProfileActive, IsAuthenticated, IsOwnerProfile]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def get_queryset(self):
+        return self.queryset.filter(profile=self.request.user)
+
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return StatementImportCreateSerializer
+        return StatementImportSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except DRFValidationError as e:
+            log.warning(
+                "Statement import request failed",
+                event_type=EventType.STATEMENT_IMPORT_FAILED,
+                event_details={"errors": e.detail}
+            )
+            raise
+
+        statement_import = serializer.save(profile=request.user)
+        # Enqueued only once the upload is committed, so the worker always finds it.
+        transaction.on_commit(lambda: process_statement_import.delay(statement_import.pk))
+
+        log.info(
+            "Statement import requested",
+            event_type=EventType.STATEMENT_IMPORT_REQUESTED,
+            event_details={
+                "statement_import_id": statement_import.id,
+                "file_format": statement_import.file_format,
+                "source_type": statement_import.source_type,
+                "file_size": statement_import.file.size,
+            }
+        )
+
+        return Response(StatementImportSerializer(statement_import).data, status=status.HTTP_202_ACCEPTED)
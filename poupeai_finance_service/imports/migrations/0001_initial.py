@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('bank_accounts', '0001_initial'),
+        ('categories', '0001_initial'),
+        ('credit_cards', '0004_hot_path_indexes'),
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatementImport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('file', models.FileField(blank=True, upload_to='statement_imports/%Y/%m/', verbose_name='File')),
+                ('file_name', models.CharField(max_length=255, verbose_name='File Name')),
+                ('file_format', models.CharField(choices=[('OFX', 'OFX'), ('CSV', 'CSV')], max_length=3, verbose_name='File Format')),
+                ('source_type', models.CharField(choices=[('BANK_ACCOUNT', 'Bank Account'), ('CREDIT_CARD', 'Credit Card')], max_length=20, verbose_name='Source Type')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=10, verbose_name='Status')),
+                ('processed_lines', models.PositiveIntegerField(default=0, verbose_name='Processed Lines')),
+                ('imported_count', models.PositiveIntegerField(default=0, verbose_name='Imported')),
+                ('duplicate_count', models.PositiveIntegerField(default=0, verbose_name='Duplicates')),
+                ('skipped_count', models.PositiveIntegerField(default=0, verbose_name='Skipped')),
+                ('failed_count', models.PositiveIntegerField(default=0, verbose_name='Failed')),
+                ('errors', models.JSONField(blank=True, default=list, verbose_name='Errors')),
+                ('error_message', models.TextField(blank=True, verbose_name='Error Message')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+                ('bank_account', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='statement_imports', to='bank_accounts.bankaccount', verbose_name='Bank Account')),
+                ('credit_card', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='statement_imports', to='credit_cards.creditcard', verbose_name='Credit Card')),
+                ('expense_category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='categories.category', verbose_name='Expense Category')),
+                ('income_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='categories.category', verbose_name='Income Category')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statement_imports', to='profiles.profile', verbose_name='Profile')),
+            ],
+            options={
+                'verbose_name': 'Statement Import',
+                'verbose_name_plural': 'Statement Imports',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:16
+
+import poupeai_finance_service.imports.models
+import poupeai_finance_service.imports.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statementimport',
+            name='file',
+            field=models.FileField(blank=True, storage=poupeai_finance_service.imports.storage.get_statement_import_storage, upload_to=poupeai_finance_service.imports.models.statement_import_upload_to, verbose_name='File'),
+        ),
+    ]
@@ -0,0 +1,106 @@
+import os
+import uuid
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.categories.models import Category
+from poupeai_finance_service.core.models import TimeStampedModel
+from poupeai_finance_service.credit_cards.models import CreditCard
+from poupeai_finance_service.imports.storage import get_statement_import_storage
+from poupeai_finance_service.profiles.models import Profile
+
+def statement_import_upload_to(instance, filename):
+    """
+    Stores the statement under a random name; the original one is only kept in `file_name`.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    return f"{timezone.now():%Y/%m}/{uuid.uuid4().hex}{extension}"
+
+class StatementImport(TimeStampedModel):
+    """
+    A bank or credit card statement (OFX or CSV) uploaded for import, and the progress of the
+    background job that turns its lines into transactions.
+    """
+    class FileFormat(models.TextChoices):
+        OFX = "OFX", "OFX"
+        CSV = "CSV", "CSV"
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", _("Pending")
+        PROCESSING = "PROCESSING", _("Processing")
+        COMPLETED = "COMPLETED", _("Completed")
+        FAILED = "FAILED", _("Failed")
+
+    SOURCE_TYPES = (
+        ('BANK_ACCOUNT', _('Bank Account')),
+        ('CREDIT_CARD', _('Credit Card')),
+    )
+
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='statement_imports',
+        verbose_name=_('Profile')
+    )
+    file = models.FileField(
+        _('File'),
+        upload_to=statement_import_upload_to,
+        storage=get_statement_import_storage,
+        blank=True
+    )
+    file_name = models.CharField(_('File Name'), max_length=255)
+    file_format = models.CharField(_('File Format'), max_length=3, choices=FileFormat.choices)
+
+    source_type = models.CharField(_('Source Type'), max_length=20, choices=SOURCE_TYPES)
+    bank_account = models.ForeignKey(
+        BankAccount,
+        on_delete=models.CASCADE,
+        related_name='statement_imports',
+        blank=True,
+        null=True,
+        verbose_name=_('Bank Account')
+    )
+    credit_card = models.ForeignKey(
+        CreditCard,
+        on_delete=models.CASCADE,
+        related_name='statement_imports',
+        blank=True,
+        null=True,
+        verbose_name=_('Credit Card')
+    )
+    income_category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='+',
+        blank=True,
+        null=True,
+        verbose_name=_('Income Category')
+    )
+    expense_category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('Expense Category')
+    )
+
+    status = models.CharField(_('Status'), max_length=10, choices=Status.choices, default=Status.PENDING)
+    processed_lines = models.PositiveIntegerField(_('Processed Lines'), default=0)
+    imported_count = models.PositiveIntegerField(_('Imported'), default=0)
+    duplicate_count = models.PositiveIntegerField(_('Duplicates'), default=0)
+    skipped_count = models.PositiveIntegerField(_('Skipped'), default=0)
+    failed_count = models.PositiveIntegerField(_('Failed'), default=0)
+    errors = models.JSONField(_('Errors'), default=list, blank=True)
+    error_message = models.TextField(_('Error Message'), blank=True)
+    started_at = models.DateTimeField(_('Started At'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('Finished At'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Statement Import')
+        verbose_name_plural = _('Statement Imports')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
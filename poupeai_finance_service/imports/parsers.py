@@ -0,0 +1,203 @@
+import csv
+import io
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from django.utils.translation import gettext as _
+
+SNIFF_SIZE = 4096
+CSV_DELIMITERS = ',;\t'
+
+CSV_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d/%m/%y', '%d-%m-%Y')
+CSV_COLUMNS = {
+    'date': ('date', 'data', 'data lancamento', 'data de lancamento', 'data da transacao', 'dtposted'),
+    'description': ('description', 'descricao', 'historico', 'lancamento', 'estabelecimento', 'name'),
+    'memo': ('memo', 'detalhes', 'complemento', 'observacao'),
+    'amount': ('amount', 'valor', 'value', 'trnamt', 'valor (r$)'),
+    'transaction_id': ('id', 'fitid', 'identificador', 'transaction id', 'codigo', 'documento'),
+}
+
+OFX_TAG_RE = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+OFX_CHARSET_RE = re.compile(rb'CHARSET:\s*(\d+)|encoding="([A-Za-z0-9_-]+)"', re.IGNORECASE)
+
+class StatementParseError(Exception):
+    """
+    Raised when the file as a whole cannot be read as a statement of the given format.
+    """
+
+@dataclass
+class StatementLine:
+    line_number: int
+    issue_date: date
+    amount: Decimal
+    description: str
+    memo: str = ""
+    transaction_id: str = ""
+
+@dataclass
+class InvalidStatementLine:
+    line_number: int
+    error: str
+
+def parse_amount(value):
+    """
+    Parses "-1234.56", "1.234,56", "R$ -1.234,56" or "1,234.56" into a signed Decimal.
+    """
+    value = value.strip().replace('R$', '').replace(' ', '').replace('\xa0', '')
+    if ',' in value and '.' in value:
+        if value.rfind(',') > value.rfind('.'):
+            value = value.replace('.', '').replace(',', '.')
+        else:
+            value = value.replace(',', '')
+    elif ',' in value:
+        value = value.replace(',', '.')
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(_("Invalid amount: %(value)s") % {'value': value})
+
+def parse_csv_date(value):
+    value = value.strip()
+    for date_format in CSV_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(_("Invalid date: %(value)s") % {'value': value})
+
+def parse_ofx_date(value):
+    # YYYYMMDD, optionally followed by HHMMSS[.XXX][TZ offset:name].
+    try:
+        return datetime.strptime(value.strip()[:8], '%Y%m%d').date()
+    except ValueError:
+        raise ValueError(_("Invalid date: %(value)s") % {'value': value})
+
+def _normalize_header(value):
+    value = unicodedata.normalize('NFKD', value.strip().lower())
+    return ''.join(char for char in value if not unicodedata.combining(char))
+
+def _detect_encoding(binary_file, default):
+    sample = binary_file.read(SNIFF_SIZE)
+    binary_file.seek(0)
+    match = OFX_CHARSET_RE.search(sample)
+    if match and match.group(1):
+        return 'cp1252' if match.group(1) == b'1252' else default
+    if match and match.group(2):
+        return match.group(2).decode()
+    try:
+        sample.decode('utf-8')
+        return 'utf-8-sig'
+    except UnicodeDecodeError as e:
+        # A multibyte character cut by the end of the sample is still UTF-8.
+        return 'utf-8-sig' if e.start >= len(sample) - 3 else 'cp1252'
+
+def _text_stream(binary_file, default_encoding='utf-8-sig'):
+    encoding = _detect_encoding(binary_file, default_encoding)
+    return io.TextIOWrapper(binary_file, encoding=encoding, errors='replace', newline='')
+
+def parse_csv(binary_file):
+    """
+    Yields a StatementLine (or InvalidStatementLine) per row of a CSV statement, reading the file
+    row by row. The header row names the columns (Portuguese or English names, see CSV_COLUMNS);
+    the delimiter is sniffed among comma, semicolon and tab.
+    """
+    stream = _text_stream(binary_file)
+    sample = stream.read(SNIFF_SIZE)
+    stream.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS)
+        delimiter = dialect.delimiter
+    except csv.Error:
+        # The sniffer gives up unless every sampled row agrees, which blank lines or empty cells
+        # of bank exports prevent; the header row alone still tells the delimiter.
+        dialect = csv.excel
+        header_line = sample.splitlines()[0] if sample else ""
+        delimiter = max(CSV_DELIMITERS, key=header_line.count)
+
+    reader = csv.reader(stream, dialect, delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        raise StatementParseError(_("The CSV file is empty."))
+
+    normalized = [_normalize_header(name) for name in header]
+    columns = {}
+    for key, aliases in CSV_COLUMNS.items():
+        for position, name in enumerate(normalized):
+            if name in aliases:
+                columns[key] = position
+                break
+    missing = [key for key in ('date', 'description', 'amount') if key not in columns]
+    if missing:
+        raise StatementParseError(
+            _("The CSV header must have date, description and amount columns; missing: %(columns)s")
+            % {'columns': ", ".join(missing)}
+        )
+
+    def column(row, key):
+        position = columns.get(key)
+        return row[position].strip() if position is not None and position < len(row) else ""
+
+    for row in reader:
+        line_number = reader.line_num
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            yield StatementLine(
+                line_number=line_number,
+                issue_date=parse_csv_date(column(row, 'date')),
+                amount=parse_amount(column(row, 'amount')),
+                description=column(row, 'description'),
+                memo=column(row, 'memo'),
+                transaction_id=column(row, 'transaction_id'),
+            )
+        except ValueError as e:
+            yield InvalidStatementLine(line_number, str(e))
+
+def parse_ofx(binary_file):
+    """
+    Yields a StatementLine (or InvalidStatementLine) per <STMTTRN> of an OFX statement, SGML
+    (1.x) or XML (2.x), reading the file line by line.
+    """
+    stream = _text_stream(binary_file, default_encoding='cp1252')
+    current = None
+    found_ofx = False
+
+    for line_number, text in enumerate(stream, start=1):
+        for closing, tag, value in OFX_TAG_RE.findall(text):
+            tag = tag.upper()
+            found_ofx = found_ofx or tag == 'OFX'
+            if tag == 'STMTTRN':
+                if not closing:
+                    current = {'line_number': line_number}
+                elif current is not None:
+                    yield _build_ofx_line(current)
+                    current = None
+            elif current is not None and not closing:
+                current[tag] = value.strip()
+
+    if not found_ofx:
+        raise StatementParseError(_("The file is not an OFX statement."))
+
+def _build_ofx_line(fields):
+    try:
+        return StatementLine(
+            line_number=fields['line_number'],
+            issue_date=parse_ofx_date(fields.get('DTPOSTED', '')),
+            amount=parse_amount(fields.get('TRNAMT', '')),
+            description=fields.get('NAME', '') or fields.get('MEMO', ''),
+            memo=fields.get('MEMO', '') if fields.get('NAME') else '',
+            transaction_id=fields.get('FITID', ''),
+        )
+    except ValueError as e:
+        return InvalidStatementLine(fields['line_number'], str(e))
+
+PARSERS = {
+    'OFX': parse_ofx,
+    'CSV': parse_csv,
+}
+
+def parse_statement(binary_file, file_format):
+    return PARSERS[file_format](binary_file)
@@ -0,0 +1,136 @@
+import hashlib
+import os
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.utils.translation import gettext as _
+
+from poupeai_finance_service.imports.models import StatementImport
+from poupeai_finance_service.imports.parsers import InvalidStatementLine, parse_statement
+from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.transactions.services import TransactionService
+
+FILE_FORMATS_BY_EXTENSION = {
+    '.ofx': StatementImport.FileFormat.OFX,
+    '.qfx': StatementImport.FileFormat.OFX,
+    '.csv': StatementImport.FileFormat.CSV,
+    '.txt': StatementImport.FileFormat.CSV,
+}
+
+PROGRESS_FIELDS = [
+    'processed_lines', 'imported_count', 'duplicate_count', 'skipped_count', 'failed_count', 'errors', 'updated_at'
+]
+
+def guess_file_format(file_name):
+    return FILE_FORMATS_BY_EXTENSION.get(os.path.splitext(file_name)[1].lower())
+
+def get_line_digest(line):
+    content = f"{line.issue_date.isoformat()}|{line.amount}|{line.description}|{line.memo}"
+    return hashlib.sha1(content.encode()).hexdigest()
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+class StatementImportRunner:
+    """
+    Streams the lines of a StatementImport's file and writes them as transactions, one chunk per
+    database transaction, saving the progress counters after each chunk.
+    """
+    def __init__(self, statement_import):
+        self.statement_import = statement_import
+        self.chunk_size = settings.STATEMENT_IMPORT_CHUNK_SIZE
+        self.max_errors = settings.STATEMENT_IMPORT_MAX_ERRORS
+        # Occurrences of each line digest, to tell identical lines of the same file apart.
+        self.occurrences = {}
+
+    def run(self):
+        statement_import = self.statement_import
+        with statement_import.file.open('rb') as binary_file:
+            for chunk in _chunks(parse_statement(binary_file, statement_import.file_format), self.chunk_size):
+                with db_transaction.atomic():
+                    self.import_chunk(chunk)
+                    statement_import.save(update_fields=PROGRESS_FIELDS)
+
+    def add_error(self, line_number, errors):
+        statement_import = self.statement_import
+        statement_import.failed_count += 1
+        if len(statement_import.errors) < self.max_errors:
+            statement_import.errors.append({'line': line_number, 'errors': errors})
+
+    def get_account_filter(self):
+        if self.statement_import.source_type == 'CREDIT_CARD':
+            return {'credit_card_id': self.statement_import.credit_card_id}
+        return {'bank_account_id': self.statement_import.bank_account_id}
+
+    def import_chunk(self, chunk):
+        statement_import = self.statement_import
+        statement_import.processed_lines += len(chunk)
+
+        lines = {}
+        for line in chunk:
+            if isinstance(line, InvalidStatementLine):
+                self.add_error(line.line_number, [line.error])
+                continue
+            if statement_import.source_type == 'CREDIT_CARD' and line.amount > 0:
+                # Credits on a card statement are payments and refunds, not purchases.
+                statement_import.skipped_count += 1
+                continue
+
+            transaction_id = self.get_transaction_id(line)
+            if transaction_id in lines:
+                statement_import.duplicate_count += 1
+                continue
+            lines[transaction_id] = line
+
+        existing = set(
+            Transaction.objects.filter(
+                profile_id=statement_import.profile_id,
+                original_transaction_id__in=list(lines),
+                **self.get_account_filter()
+            ).values_list('original_transaction_id', flat=True)
+        )
+        statement_import.duplicate_count += len(existing)
+
+        new_lines = [(transaction_id, line) for transaction_id, line in lines.items() if transaction_id not in existing]
+        if not new_lines:
+            return
+
+        created, errors = TransactionService.create_transactions_batch(
+            statement_import.profile,
+            [self.build_item(transaction_id, line) for transaction_id, line in new_lines],
+            atomic=False
+        )
+        statement_import.imported_count += len(created)
+        for position, item_errors in errors.items():
+            self.add_error(new_lines[position][1].line_number, item_errors)
+
+    def get_transaction_id(self, line):
+        """
+        The statement's own id (OFX FITID or a CSV id column) or, when there is none, the digest
+        of the line's content and its occurrence among identical lines, stable across re-imports.
+        """
+        if line.transaction_id:
+            return line.transaction_id[:100]
+        digest = get_line_digest(line)
+        occurrence = self.occurrences.get(digest, 0)
+        self.occurrences[digest] = occurrence + 1
+        return f"sha1:{digest}:{occurrence}"
+
+    def build_item(self, transaction_id, line):
+        statement_import = self.statement_import
+        is_income = statement_import.source_type == 'BANK_ACCOUNT' and line.amount > 0
+        statement_description = " - ".join(part for part in (line.description, line.memo) if part)
+        return {
+            'category': statement_import.income_category if is_income else statement_import.expense_category,
+            'description': (line.description or line.memo or _("Imported transaction"))[:255],
+            'amount': abs(line.amount),
+            'issue_date': line.issue_date,
+            'source_type': statement_import.source_type,
+            'bank_account': statement_import.bank_account,
+            'credit_card': statement_import.credit_card,
+            'original_transaction_id': transaction_id,
+            'original_statement_description': statement_description,
+        }
@@ -0,0 +1,9 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+def get_statement_import_storage():
+    """
+    Storage of the uploaded statements, under STATEMENT_IMPORT_ROOT instead of MEDIA_ROOT so
+    they are never served publicly. Only the import task reads them back.
+    """
+    return FileSystemStorage(location=settings.STATEMENT_IMPORT_ROOT)
@@ -0,0 +1,127 @@
+from datetime import timedelta
+
+import structlog
+from celery import shared_task
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from poupeai_finance_service.core.events import EventType
+from poupeai_finance_service.imports.models import StatementImport
+from poupeai_finance_service.imports.services import StatementImportRunner
+
+log = structlog.get_logger(__name__)
+
+@shared_task(
+    soft_time_limit=settings.STATEMENT_IMPORT_SOFT_TIME_LIMIT,
+    time_limit=settings.STATEMENT_IMPORT_SOFT_TIME_LIMIT + 60
+)
+def process_statement_import(statement_import_id):
+    """
+    Imports the lines of a pending StatementImport. The conditional update claims the import,
+    so a redelivered task does not process the same file twice. Chunks committed before a
+    failure are kept; re-uploading the file skips them as duplicates.
+    """
+    claimed = StatementImport.objects.filter(
+        pk=statement_import_id, status=StatementImport.Status.PENDING
+    ).update(status=StatementImport.Status.PROCESSING, started_at=timezone.now())
+    if not claimed:
+        log.info("Statement import already claimed or missing", statement_import_id=statement_import_id)
+        return
+
+    statement_import = StatementImport.objects.select_related(
+        'profile', 'bank_account', 'credit_card', 'income_category', 'expense_category'
+    ).get(pk=statement_import_id)
+    log.info(
+        "Statement import started",
+        event_type=EventType.STATEMENT_IMPORT_STARTED,
+        event_details={
+            "statement_import_id": statement_import.id,
+            "file_format": statement_import.file_format,
+            "source_type": statement_import.source_type,
+        }
+    )
+
+    try:
+        StatementImportRunner(statement_import).run()
+    except Exception as e:
+        statement_import.status = StatementImport.Status.FAILED
+        statement_import.error_message = str(e) or e.__class__.__name__
+        statement_import.finished_at = timezone.now()
+        statement_import.save(update_fields=['status', 'error_message', 'finished_at', 'updated_at'])
+        log.error(
+            "Statement import failed",
+            event_type=EventType.STATEMENT_IMPORT_FAILED,
+            event_details={
+                "statement_import_id": statement_import.id,
+                "processed_lines": statement_import.processed_lines,
+                "imported_count": statement_import.imported_count,
+            },
+            exc_info=e
+        )
+    else:
+        statement_import.status = StatementImport.Status.COMPLETED
+        statement_import.finished_at = timezone.now()
+        statement_import.save(update_fields=['status', 'finished_at', 'updated_at'])
+        log.info(
+            "Statement import completed",
+            event_type=EventType.STATEMENT_IMPORT_COMPLETED,
+            event_details={
+                "statement_import_id": statement_import.id,
+                "processed_lines": statement_import.processed_lines,
+                "imported_count": statement_import.imported_count,
+                "duplicate_count": statement_import.duplicate_count,
+                "skipped_count": statement_import.skipped_count,
+                "failed_count": statement_import.failed_count,
+            }
+        )
+    finally:
+        # The statement is not kept once the import ends, whatever its outcome: a failed import
+        # is retried by uploading the file again. A task killed by the hard time limit never gets
+        # here; cleanup_stale_statement_imports deletes its file.
+        _delete_statement_file(statement_import)
+
+@shared_task
+def cleanup_stale_statement_imports():
+    """
+    Fails the imports whose task died without finishing them (killed by the hard time limit, lost
+    with its worker or never delivered) and deletes their files. The conditional update keeps a
+    worker from claiming an import while it is being failed.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.STATEMENT_IMPORT_STALE_AFTER)
+    stale_imports = StatementImport.objects.filter(
+        Q(status=StatementImport.Status.PROCESSING, started_at__lt=stale_before)
+        | Q(status=StatementImport.Status.PENDING, created_at__lt=stale_before)
+    )
+
+    failed_count = 0
+    for statement_import in stale_imports.only('id', 'status', 'file', 'processed_lines', 'imported_count'):
+        failed = StatementImport.objects.filter(pk=statement_import.pk, status=statement_import.status).update(
+            status=StatementImport.Status.FAILED,
+            error_message="The import did not finish in time. Upload the file again.",
+            finished_at=now,
+            updated_at=now,
+        )
+        if not failed:
+            continue
+        _delete_statement_file(statement_import)
+        failed_count += 1
+        log.warning(
+            "Stale statement import failed",
+            event_type=EventType.STATEMENT_IMPORT_FAILED,
+            event_details={
+                "statement_import_id": statement_import.id,
+                "previous_status": statement_import.status,
+                "processed_lines": statement_import.processed_lines,
+                "imported_count": statement_import.imported_count,
+            }
+        )
+
+    return f"Failed {failed_count} stale statement imports."
+
+def _delete_statement_file(statement_import):
+    if not statement_import.file:
+        return
+    statement_import.file.delete(save=False)
+    StatementImport.objects.filter(pk=statement_import.pk).update(file='')
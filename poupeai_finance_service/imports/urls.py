@@ -0,0 +1,13 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+
+from poupeai_finance_service.imports.api.viewsets import StatementImportViewSet
+
+app_name = 'imports'
+
+router = DefaultRouter()
+router.register(r'', StatementImportViewSet, basename='imports')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -2,6 +2,10 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.categories.models import Category
+from poupeai_finance_service.credit_cards.models import CreditCard
+from poupeai_finance_service.transactions.managers import AGGREGATE_GROUPS, AGGREGATE_METRICS
 from poupeai_finance_service.transactions.models import Transaction
 from poupeai_finance_service.transactions.services import TransactionService
 
@@ -35,7 +39,7 @@ class TransactionBaseSerializer(serializers.ModelSerializer):
         if self.instance:
             profile = profile or self.instance.profile
             
-        if profile and category.profile != profile:
+        if profile and category.profile_id != profile.pk:
             raise serializers.ValidationError(_("Category does not belong to your profile."))
         return category
     
@@ -47,7 +51,7 @@ class TransactionBaseSerializer(serializers.ModelSerializer):
         if self.instance:
             profile = profile or self.instance.profile
             
-        if profile and bank_account.profile != profile:
+        if profile and bank_account.profile_id != profile.pk:
             raise serializers.ValidationError(_("Bank account does not belong to your profile."))
         return bank_account
     
@@ -59,7 +63,7 @@ class TransactionBaseSerializer(serializers.ModelSerializer):
         if self.instance:
             profile = profile or self.instance.profile
             
-        if profile and credit_card.profile != profile:
+        if profile and credit_card.profile_id != profile.pk:
             raise serializers.ValidationError(_("Credit card does not belong to your profile."))
         return credit_card
 
@@ -205,4 +209,140 @@ class TransactionCreateUpdateSerializer(TransactionBaseSerializer):
         try:
             return TransactionService.update_transaction(instance, validated_data, apply_to_all_installments)
         except DjangoValidationError as e:
-            raise serializers.ValidationError(e.message_dict)
\ No newline at end of file
+            raise serializers.ValidationError(e.message_dict)
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves its value from the objects preloaded in the
+    `prefetched` context ({field_name: {str(pk): object}}), when there are any, instead of
+    running one query per value.
+    """
+    def to_internal_value(self, data):
+        prefetched = self.context.get('prefetched', {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return prefetched[str(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+class TransactionBatchItemSerializer(TransactionCreateUpdateSerializer):
+    """
+    One item of a batch create. Its related objects come from the batch's prefetched context.
+    """
+    category = PrefetchedPrimaryKeyRelatedField(queryset=Category.objects.all())
+    bank_account = PrefetchedPrimaryKeyRelatedField(
+        queryset=BankAccount.objects.all(), required=False, allow_null=True
+    )
+    credit_card = PrefetchedPrimaryKeyRelatedField(
+        queryset=CreditCard.objects.all(), required=False, allow_null=True
+    )
+
+    @classmethod
+    def get_prefetched(cls, profile, items):
+        """
+        Loads the profile's categories, bank accounts and credit cards referenced by the raw
+        items, with one query per model. Objects of other profiles are left out, so they fail
+        validation as unknown ids.
+        """
+        related = {'category': Category, 'bank_account': BankAccount, 'credit_card': CreditCard}
+        prefetched = {}
+        for field_name, model in related.items():
+            ids = {
+                str(item[field_name]) for item in items
+                if isinstance(item, dict) and str(item.get(field_name, '')).isdigit()
+            }
+            prefetched[field_name] = {
+                str(obj.pk): obj for obj in model.objects.filter(profile=profile, pk__in=ids)
+            }
+        return prefetched
+
+class TransactionBatchSerializer(serializers.Serializer):
+    """
+    Request of the batch create endpoint.
+    """
+    atomic = serializers.BooleanField(
+        default=True,
+        help_text=_("When true, nothing is created if any item is invalid.")
+    )
+    transactions = serializers.ListField(
+        child=serializers.DictField(),
+        min_length=1,
+        max_length=500,
+        help_text=_("Transactions to create, in the format of the create endpoint.")
+    )
+
+class TransactionBatchResultSerializer(serializers.Serializer):
+    """
+    Outcome of one item of a batch create, in the position it was sent.
+    """
+    index = serializers.IntegerField()
+    transaction = TransactionDetailSerializer(allow_null=True)
+    errors = serializers.DictField(allow_null=True)
+
+class TransactionBulkUpdateSerializer(serializers.Serializer):
+    """
+    Changes applied by the bulk update endpoint to every transaction matching the filters.
+    """
+    category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all(), required=False)
+    description = serializers.CharField(
+        max_length=Transaction._meta.get_field('description').max_length,
+        required=False
+    )
+
+    def validate_category(self, category):
+        if category.profile_id != self.context['request'].user.pk:
+            raise serializers.ValidationError(_("Category does not belong to your profile."))
+        return category
+
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError(_("Send at least one of: category, description."))
+        return data
+
+class TransactionBulkUpdateResultSerializer(serializers.Serializer):
+    """
+    Outcome of a bulk update.
+    """
+    updated = serializers.IntegerField(help_text=_("Number of transactions updated."))
+
+class TransactionSuggestQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the description suggestions endpoint.
+    """
+    q = serializers.CharField(min_length=2, max_length=100)
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=10)
+
+class TransactionSuggestionSerializer(serializers.Serializer):
+    """
+    A distinct description similar to the typed text, for autocomplete.
+    """
+    description = serializers.CharField()
+    similarity = serializers.FloatField()
+    occurrences = serializers.IntegerField()
+
+class TransactionAggregateQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the grouped aggregate endpoint.
+    """
+    group_by = serializers.ChoiceField(choices=list(AGGREGATE_GROUPS))
+    metric = serializers.ChoiceField(choices=list(AGGREGATE_METRICS), default='sum')
+
+class TransactionAggregateSerializer(serializers.Serializer):
+    """
+    A bucket of the grouped aggregate endpoint: the metric of the transactions of one type
+    (income or expense) in one group.
+    """
+    key = serializers.JSONField(
+        help_text=_("Category, bank account or credit card id, first day of the month or week, or source type.")
+    )
+    label = serializers.CharField(
+        required=False,
+        allow_null=True,
+        help_text=_("Category, bank account or credit card name.")
+    )
+    type = serializers.CharField()
+    value = serializers.FloatField()
+    count = serializers.IntegerField()
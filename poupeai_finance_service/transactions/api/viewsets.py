@@ -1,24 +1,52 @@
 import structlog
 from poupeai_finance_service.core.events import EventType
 
+from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema_view, extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema_view, extend_schema
 
+from poupeai_finance_service.core.conditional import (
+    ConditionalListMixin,
+    get_not_modified_response,
+    get_profile_etag,
+    set_validator_headers,
+)
+from poupeai_finance_service.core.export import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_FORMAT_CSV,
+    ExportContentNegotiation,
+    stream_export,
+)
+from poupeai_finance_service.core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from poupeai_finance_service.core.pagination import PageNumberOrKeysetPagination
 from poupeai_finance_service.core.permissions import IsOwnerProfile
+from poupeai_finance_service.core.search import FullTextSearchFilter
+from poupeai_finance_service.core.sparse import SparseFieldsetMixin
+from poupeai_finance_service.core.values import ValuesListMixin, ValuesMapper
 from poupeai_finance_service.transactions.api.serializers import (
+    TransactionAggregateQuerySerializer,
+    TransactionAggregateSerializer,
+    TransactionBatchItemSerializer,
+    TransactionBatchResultSerializer,
+    TransactionBatchSerializer,
+    TransactionBulkUpdateResultSerializer,
+    TransactionBulkUpdateSerializer,
     TransactionCreateUpdateSerializer,
     TransactionDetailSerializer,
     TransactionListSerializer,
+    TransactionSuggestionSerializer,
+    TransactionSuggestQuerySerializer,
 )
 from poupeai_finance_service.profiles.api.permissions import IsProfileActive
+from poupeai_finance_service.transactions.managers import TRANSACTION_STATUSES
 from poupeai_finance_service.transactions.models import Transaction
 from poupeai_finance_service.transactions.services import TransactionService
 
@@ -33,7 +61,8 @@ log = structlog.get_logger(__name__)
     create=extend_schema(
         tags=['Transactions'],
         summary='Create a new transaction',
-        description='Create a new transaction for the authenticated user'
+        description='Create a new transaction for the authenticated user',
+        parameters=[IDEMPOTENCY_KEY_PARAMETER]
     ),
     retrieve=extend_schema(
         tags=['Transactions'],
@@ -55,16 +84,107 @@ log = structlog.get_logger(__name__)
         summary='Delete a transaction',
         description='Delete a specific transaction for the authenticated user'
     ),
+    batch=extend_schema(
+        tags=['Transactions'],
+        summary='Create transactions in batch',
+        description=(
+            'Validates and creates up to 500 transactions in one request. With atomic=true (default) '
+            'nothing is created if any item is invalid; with atomic=false the valid items are created '
+            'and the invalid ones are reported (207).'
+        ),
+        request=TransactionBatchSerializer,
+        responses={
+            201: TransactionBatchResultSerializer(many=True),
+            207: TransactionBatchResultSerializer(many=True),
+            400: TransactionBatchResultSerializer(many=True),
+        }
+    ),
+    suggest=extend_schema(
+        tags=['Transactions'],
+        summary='Suggest transaction descriptions',
+        description='Distinct descriptions of the authenticated user similar to the typed text, for autocomplete. Tolerates typos and partial words.',
+        parameters=[TransactionSuggestQuerySerializer],
+        responses=TransactionSuggestionSerializer(many=True)
+    ),
+    aggregate=extend_schema(
+        tags=['Transactions'],
+        summary='Aggregate transactions',
+        description=(
+            'Sum, count or average of the amounts of the transactions matching the list filters, grouped '
+            'by category, month, week, source type, bank account or credit card and split by type '
+            '(income/expense), computed in a single query.'
+        ),
+        parameters=[TransactionAggregateQuerySerializer],
+        responses=TransactionAggregateSerializer(many=True)
+    ),
+    bulk_update=extend_schema(
+        tags=['Transactions'],
+        summary='Bulk update transactions',
+        description=(
+            'Sets the category and/or description of every transaction of the authenticated user '
+            'matching the list filters (query string), with a single update. Without filters, every '
+            'transaction is updated. Installments keep their "(i/n)" suffix, and the type follows the '
+            'new category.'
+        ),
+        request=TransactionBulkUpdateSerializer,
+        responses=TransactionBulkUpdateResultSerializer
+    ),
+    export=extend_schema(
+        tags=['Transactions'],
+        summary='Export transactions',
+        description=(
+            'Streams every transaction of the authenticated user matching the list filters, as CSV '
+            '(format=csv, default) or newline-delimited JSON (format=ndjson).'
+        ),
+        parameters=[
+            OpenApiParameter('format', str, enum=list(EXPORT_CONTENT_TYPES), default=EXPORT_FORMAT_CSV),
+        ],
+        responses={
+            (200, 'text/csv'): OpenApiTypes.STR,
+            (200, 'application/x-ndjson'): OpenApiTypes.STR,
+        }
+    ),
 )
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(SparseFieldsetMixin, ConditionalListMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Transaction.objects.all()
     permission_classes = [IsProfileActive, IsAuthenticated, IsOwnerProfile]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['purchase_group_uuid', 'category', 'source_type', 'type']
     search_fields = ['description', 'original_purchase_description', 'original_statement_description']
+    search_vector_field = 'search_vector'
+    search_trigram_fields = ['description', 'original_statement_description']
     ordering_fields = ['issue_date', 'amount', 'created_at']
     ordering = ['-issue_date']
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_tie_breakers = ('issue_date', 'created_at', 'id')
+    sparse_field_columns = {
+        'status': [],
+        'category_type': ['category__type'],
+    }
+    values_mapper = ValuesMapper(TransactionListSerializer, lookups={'status': 'computed_status'})
+    export_columns = {
+        'id': 'id',
+        'issue_date': 'issue_date',
+        'description': 'description',
+        'amount': 'amount',
+        'type': 'type',
+        'source_type': 'source_type',
+        'status': 'computed_status',
+        'category': 'category__name',
+        'bank_account': 'bank_account__name',
+        'credit_card': 'credit_card__name',
+        'installment_number': 'installment_number',
+        'total_installments': 'total_installments',
+        'purchase_group_uuid': 'purchase_group_uuid',
+        'payment_date': 'payment_date',
+        'original_statement_description': 'original_statement_description',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+
+    def use_values_list(self):
+        return settings.TRANSACTION_LIST_VALUES_PATH and super().use_values_list()
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -88,27 +208,14 @@ class TransactionViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(issue_date__lte=issue_date_end)
         
         status_param = self.request.query_params.get('status')
-        if status_param:
-            if status_param.upper() == 'PAID':
-                queryset = queryset.filter(
-                    models.Q(source_type='BANK_ACCOUNT') | 
-                    models.Q(source_type='CREDIT_CARD', invoice__paid=True)
-                )
-            elif status_param.upper() == 'PENDING':
-                queryset = queryset.filter(
-                    source_type='CREDIT_CARD', 
-                    invoice__paid=False, 
-                    invoice__due_date__gte=timezone.now().date()
-                )
-            elif status_param.upper() == 'OVERDUE':
-                queryset = queryset.filter(
-                    source_type='CREDIT_CARD', 
-                    invoice__paid=False, 
-                    invoice__due_date__lt=timezone.now().date()
-                )
+        if status_param and status_param.upper() in TRANSACTION_STATUSES:
+            queryset = queryset.with_status().filter(computed_status=status_param.upper())
+        elif self.is_field_requested('status'):
+            queryset = queryset.with_status()
 
         return queryset
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         try:
@@ -194,6 +301,139 @@ class TransactionViewSet(viewsets.ModelViewSet):
             )
             raise
 
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request):
+        batch_serializer = TransactionBatchSerializer(data=request.data)
+        batch_serializer.is_valid(raise_exception=True)
+        atomic = batch_serializer.validated_data['atomic']
+        items = batch_serializer.validated_data['transactions']
+
+        context = {
+            **self.get_serializer_context(),
+            'prefetched': TransactionBatchItemSerializer.get_prefetched(request.user, items),
+        }
+        valid_items = {}
+        errors = {}
+        for index, item in enumerate(items):
+            item_serializer = TransactionBatchItemSerializer(data=item, context=context)
+            if item_serializer.is_valid():
+                valid_items[index] = item_serializer.validated_data
+            else:
+                errors[index] = item_serializer.errors
+
+        created = {}
+        if valid_items and not (atomic and errors):
+            indexes = list(valid_items)
+            created_items, service_errors = TransactionService.create_transactions_batch(
+                request.user, list(valid_items.values()), atomic=atomic
+            )
+            created = {indexes[position]: instance for position, instance in created_items.items()}
+            errors.update({indexes[position]: item_errors for position, item_errors in service_errors.items()})
+
+        results = TransactionBatchResultSerializer([
+            {'index': index, 'transaction': created.get(index), 'errors': errors.get(index)}
+            for index in range(len(items))
+        ], many=True).data
+
+        if not errors:
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        log_event = log.info if created else log.warning
+        log_event(
+            "Transaction batch processed",
+            event_type=EventType.TRANSACTION_BATCH_CREATED if created else EventType.TRANSACTION_BATCH_CREATION_FAILED,
+            event_details={
+                "atomic": atomic,
+                "items": len(items),
+                "created": len(created),
+                "failed": len(errors),
+            }
+        )
+        return Response(results, status=response_status)
+
+    @action(detail=False, methods=['get'], url_path='suggest', filter_backends=[], pagination_class=None)
+    def suggest(self, request):
+        query_serializer = TransactionSuggestQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        suggestions = Transaction.objects.filter(profile=request.user).suggest_descriptions(
+            query_serializer.validated_data['q'],
+            limit=query_serializer.validated_data['limit']
+        )
+        return Response(TransactionSuggestionSerializer(suggestions, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='aggregate', pagination_class=None)
+    def aggregate(self, request):
+        query_serializer = TransactionAggregateQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        etag = get_profile_etag(request, request.get_full_path())
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        buckets = self.filter_queryset(self.get_queryset()).aggregate_by(
+            query_serializer.validated_data['group_by'],
+            query_serializer.validated_data['metric']
+        )
+        response = Response(TransactionAggregateSerializer(buckets, many=True).data)
+        return set_validator_headers(response, etag)
+
+    @action(detail=False, methods=['post'], url_path='bulk-update', pagination_class=None)
+    def bulk_update(self, request):
+        serializer = TransactionBulkUpdateSerializer(data=request.data, context=self.get_serializer_context())
+        try:
+            serializer.is_valid(raise_exception=True)
+            updated = TransactionService.bulk_update_transactions(
+                request.user,
+                self.filter_queryset(self.get_queryset()),
+                serializer.validated_data
+            )
+        except DRFValidationError as e:
+            log.warning(
+                "Transaction bulk update failed",
+                event_type=EventType.TRANSACTION_BULK_UPDATE_FAILED,
+                event_details={"errors": e.detail, "filters": request.query_params.dict()}
+            )
+            raise
+
+        log.info(
+            "Transactions bulk updated",
+            event_type=EventType.TRANSACTION_BULK_UPDATED,
+            event_details={
+                "updated": updated,
+                "fields": list(serializer.validated_data),
+                "filters": request.query_params.dict(),
+            }
+        )
+        return Response(TransactionBulkUpdateResultSerializer({'updated': updated}).data)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='export',
+        pagination_class=None,
+        content_negotiation_class=ExportContentNegotiation
+    )
+    def export(self, request):
+        export_format = request.query_params.get('format', EXPORT_FORMAT_CSV)
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise DRFValidationError(
+                {"format": _("Invalid export format. Use one of: %(formats)s.") % {"formats": ", ".join(EXPORT_CONTENT_TYPES)}}
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        log.info(
+            "Transaction export started",
+            event_type=EventType.TRANSACTION_EXPORTED,
+            event_details={"format": export_format, "filters": request.query_params.dict()}
+        )
+        return stream_export(queryset, self.export_columns, export_format, filename='transactions')
+
     def perform_create(self, serializer):
         serializer.save(profile=self.request.user)
     
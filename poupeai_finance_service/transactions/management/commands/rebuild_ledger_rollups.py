@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from poupeai_finance_service.profiles.models import Profile
+from poupeai_finance_service.transactions.rollups import find_rollup_mismatches, rebuild_daily_rollups
+
+class Command(BaseCommand):
+    help = "Rebuilds (or verifies) the daily ledger rollup table from the raw transactions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile',
+            action='append',
+            dest='profiles',
+            help='Restrict the run to the given profile user_id. Can be repeated.'
+        )
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only compare the rollups with the raw transactions and report mismatches.'
+        )
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.order_by('pk')
+        if options['profiles']:
+            profiles = profiles.filter(pk__in=options['profiles'])
+
+        profile_ids = list(profiles.values_list('pk', flat=True))
+        if options['verify']:
+            self._verify(profile_ids)
+        else:
+            self._rebuild(profile_ids)
+
+    def _rebuild(self, profile_ids):
+        for profile_id in profile_ids:
+            with transaction.atomic():
+                rebuild_daily_rollups(profile_id)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt daily ledger rollups for {len(profile_ids)} profile(s)."))
+
+    def _verify(self, profile_ids):
+        mismatched_profiles = 0
+        for profile_id in profile_ids:
+            mismatches = find_rollup_mismatches(profile_id)
+            if not mismatches:
+                continue
+
+            mismatched_profiles += 1
+            self.stdout.write(self.style.WARNING(f"Profile {profile_id}: {len(mismatches)} mismatched rollup row(s)"))
+            for key, expected, stored in mismatches:
+                self.stdout.write(f"  {key}: expected={expected} stored={stored}")
+
+        if mismatched_profiles:
+            raise CommandError(f"Daily ledger rollups are out of sync for {mismatched_profiles} profile(s).")
+        self.stdout.write(self.style.SUCCESS(f"Daily ledger rollups match for {len(profile_ids)} profile(s)."))
@@ -1,13 +1,100 @@
 import calendar
 import uuid
 
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.core.exceptions import ValidationError
-from django.db import models, transaction as db_transaction
+from django.db import connection, models, transaction as db_transaction
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
 from rest_framework import serializers
 
 from poupeai_finance_service.credit_cards.models import Invoice
 
-class TransactionManager(models.Manager):
+STATUS_PAID = 'PAID'
+STATUS_PENDING = 'PENDING'
+STATUS_OVERDUE = 'OVERDUE'
+TRANSACTION_STATUSES = (STATUS_PAID, STATUS_PENDING, STATUS_OVERDUE)
+
+INSTALLMENT_SHARED_FIELDS = ['profile', 'category', 'bank_account', 'credit_card', 'invoice']
+
+# group_by of TransactionQuerySet.aggregate_by: (bucket key, bucket label or None).
+AGGREGATE_GROUPS = {
+    'category': (models.F('category_id'), models.F('category__name')),
+    'month': (TruncMonth('issue_date'), None),
+    'week': (TruncWeek('issue_date'), None),
+    'source_type': (models.F('source_type'), None),
+    'bank_account': (models.F('bank_account_id'), models.F('bank_account__name')),
+    'credit_card': (models.F('credit_card_id'), models.F('credit_card__name')),
+}
+AGGREGATE_METRICS = {
+    'sum': models.Sum('amount'),
+    'count': models.Count('id'),
+    'avg': models.Avg('amount'),
+}
+
+class TransactionQuerySet(models.QuerySet):
+    def with_status(self, today=None):
+        """
+        Annotates `computed_status` with the same rules as Transaction.status, evaluated in SQL
+        through the invoice join instead of one invoice lookup per row.
+        """
+        today = today or timezone.now().date()
+        return self.annotate(
+            computed_status=models.Case(
+                models.When(source_type='BANK_ACCOUNT', then=models.Value(STATUS_PAID)),
+                models.When(
+                    source_type='CREDIT_CARD',
+                    invoice__payment_date__isnull=False,
+                    then=models.Value(STATUS_PAID)
+                ),
+                models.When(
+                    source_type='CREDIT_CARD',
+                    invoice__due_date__lt=today,
+                    then=models.Value(STATUS_OVERDUE)
+                ),
+                default=models.Value(STATUS_PENDING),
+                output_field=models.CharField(),
+            )
+        )
+
+    def suggest_descriptions(self, text, limit=10):
+        """
+        Distinct descriptions similar to `text`, best matches first, for autocomplete. Matching
+        is by trigram word similarity, so partial and misspelled words are served by the
+        description trigram index.
+        """
+        return (
+            self.filter(description__trigram_word_similar=text)
+            .values('description')
+            .annotate(
+                similarity=models.Max(TrigramWordSimilarity(text, 'description')),
+                occurrences=models.Count('id'),
+            )
+            .order_by('-similarity', '-occurrences', 'description')[:limit]
+        )
+
+    def aggregate_by(self, group_by, metric):
+        """
+        One row per (bucket, type) with the `metric` of the amounts and the number of
+        transactions, e.g. monthly income and expense sums, computed in a single GROUP BY.
+        Week buckets start on Monday, like Postgres' date_trunc.
+        """
+        key, label = AGGREGATE_GROUPS[group_by]
+        bucket = {'key': key}
+        if label is not None:
+            bucket['label'] = label
+        return (
+            self.order_by()
+            .values('type', **bucket)
+            .annotate(value=AGGREGATE_METRICS[metric], count=models.Count('id'))
+            .order_by('key', 'type')
+        )
+
+class TransactionManager(models.Manager.from_queryset(TransactionQuerySet)):
+    def get_queryset(self):
+        # The search vector is only read by the database; don't ship it with every row.
+        return super().get_queryset().defer('search_vector')
+
     def _calculate_installment_date(self, base_date, installment_offset):
         year = base_date.year
         month = base_date.month + installment_offset
@@ -21,23 +108,18 @@ class TransactionManager(models.Manager):
 
         return base_date.replace(year=year, month=month, day=day)
 
-    @db_transaction.atomic
-    def create_installment_transactions(self, **validated_data):
-        credit_card = validated_data['credit_card']
+    def build_installment_transactions(self, **validated_data):
+        """
+        Returns the unsaved installments of a credit card purchase, one per month from its
+        issue date, sharing a new purchase group. Invoices are left for the caller to resolve.
+        """
         total_installments = validated_data['total_installments']
         issue_date = validated_data['issue_date']
         original_purchase_description = validated_data.get('description')
-
         purchase_group_uuid = uuid.uuid4()
-        transactions = []
 
+        transactions = []
         for i in range(1, total_installments + 1):
-            installment_issue_date = self._calculate_installment_date(issue_date, i-1)
-            invoice = Invoice.objects.get_or_create_invoice(
-                credit_card=credit_card,
-                issue_date=installment_issue_date
-            )
-
             installment_data = {
                 **validated_data,
                 'is_installment': True,
@@ -45,18 +127,79 @@ class TransactionManager(models.Manager):
                 'total_installments': total_installments,
                 'purchase_group_uuid': purchase_group_uuid,
                 'original_purchase_description': original_purchase_description,
-                'issue_date': installment_issue_date,
-                'invoice': invoice,
+                'issue_date': self._calculate_installment_date(issue_date, i-1),
                 'description': f"{original_purchase_description} ({i}/{total_installments})",
             }
             installment_data.pop('apply_to_all_installments', None)
-            
-            transaction_instance = self.model(**installment_data)
+            transactions.append(self.model(**installment_data))
+        return transactions
+
+    def renumber_installments(self, purchase_group_uuids):
+        """
+        Renumbers the installments left in each purchase group 1..n in their current order,
+        rewriting total_installments and the "<description> (i/n)" descriptions, with a single
+        UPDATE for all the groups.
+        """
+        purchase_group_uuids = list(purchase_group_uuids)
+        if not purchase_group_uuids:
+            return
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} AS t
+                SET installment_number = r.position,
+                    total_installments = r.total,
+                    description = COALESCE(
+                        NULLIF(t.original_purchase_description, ''),
+                        split_part(t.description, ' (', 1)
+                    ) || ' (' || r.position || '/' || r.total || ')',
+                    updated_at = %s
+                FROM (
+                    SELECT id,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY purchase_group_uuid ORDER BY installment_number, id
+                           ) AS position,
+                           COUNT(*) OVER (PARTITION BY purchase_group_uuid) AS total
+                    FROM {table}
+                    WHERE purchase_group_uuid = ANY(%s)
+                ) AS r
+                WHERE t.id = r.id
+                """,
+                [timezone.now(), purchase_group_uuids]
+            )
+
+    @db_transaction.atomic
+    def create_installment_transactions(self, **validated_data):
+        """
+        Creates every installment of a credit card purchase with a constant number of queries:
+        one set-based get-or-create of the invoices and one bulk INSERT.
+        """
+        transactions = self.build_installment_transactions(**validated_data)
+        invoices = Invoice.objects.get_or_create_invoices(
+            (transaction_instance.credit_card, transaction_instance.issue_date)
+            for transaction_instance in transactions
+        )
+
+        for transaction_instance in transactions:
+            transaction_instance.invoice = invoices[
+                (transaction_instance.credit_card.pk, transaction_instance.issue_date)
+            ]
             try:
-                transaction_instance.full_clean()
+                if transaction_instance.installment_number == 1:
+                    transaction_instance.full_clean()
+                else:
+                    # The related objects were validated with the first installment (the invoice was
+                    # just resolved); validating them again would query once per installment.
+                    transaction_instance.clean_fields(exclude=INSTALLMENT_SHARED_FIELDS)
+                    transaction_instance.clean()
             except ValidationError as e:
                 raise serializers.ValidationError(e.message_dict)
-            transaction_instance.save()
-            transactions.append(transaction_instance)
-        
-        return transactions
\ No newline at end of file
+
+            if transaction_instance.invoice.is_paid:
+                # What Transaction.save() does for purchases on a paid invoice.
+                transaction_instance.bank_account_id = transaction_instance.invoice.bank_account_id
+                transaction_instance.payment_date = transaction_instance.invoice.payment_date
+
+        return self.bulk_create(transactions)
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_daily_ledger_rollups(apps, schema_editor):
+    Transaction = apps.get_model('transactions', 'Transaction')
+    DailyLedgerRollup = apps.get_model('transactions', 'DailyLedgerRollup')
+
+    rows = Transaction.objects.values(
+        'profile_id', 'issue_date', 'type', 'source_type', 'category_id'
+    ).annotate(total=Sum('amount'), count=Count('id')).order_by()
+
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        batch.append(DailyLedgerRollup(
+            profile_id=row['profile_id'],
+            date=row['issue_date'],
+            type=row['type'],
+            source_type=row['source_type'],
+            category_id=row['category_id'],
+            total_amount=row['total'],
+            transaction_count=row['count'],
+        ))
+        if len(batch) >= 2000:
+            DailyLedgerRollup.objects.bulk_create(batch)
+            batch = []
+    DailyLedgerRollup.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+        ('profiles', '0001_initial'),
+        ('transactions', '0002_alter_transaction_installment_number_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyLedgerRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('type', models.CharField(choices=[('expense', 'Despesa'), ('income', 'Receita')], max_length=10, verbose_name='Type')),
+                ('source_type', models.CharField(choices=[('BANK_ACCOUNT', 'Bank Account'), ('CREDIT_CARD', 'Credit Card')], max_length=20, verbose_name='Source Type')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Total Amount')),
+                ('transaction_count', models.PositiveIntegerField(default=0, verbose_name='Transaction Count')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_ledger_rollups', to='categories.category', verbose_name='Category')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_ledger_rollups', to='profiles.profile', verbose_name='Profile')),
+            ],
+            options={
+                'verbose_name': 'Daily Ledger Rollup',
+                'verbose_name_plural': 'Daily Ledger Rollups',
+                'constraints': [models.UniqueConstraint(fields=('profile', 'date', 'type', 'source_type', 'category'), name='unique_daily_ledger_rollup_key')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_ledger_rollups, migrations.RunPython.noop),
+    ]
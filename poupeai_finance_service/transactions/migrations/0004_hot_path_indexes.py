@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:28
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building the indexes this way
+    # does not block writes to the transactions table while they are created.
+    atomic = False
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('transactions', '0003_dailyledgerrollup'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='dailyledgerrollup',
+            index=models.Index(fields=['profile', 'source_type', 'date'], include=('type', 'total_amount'), name='rollup_profile_source_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['profile', 'issue_date', 'created_at', 'id'], name='transaction_profile_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['profile', 'type', 'source_type', 'issue_date'], name='transaction_profile_kind_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['purchase_group_uuid', 'installment_number'], name='transaction_purchase_group_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['updated_at'], name='transaction_updated_at_idx'),
+        ),
+        # The single-column profile indexes are prefixes of the indexes above (and of the rollup
+        # unique constraint), so they are dropped once those exist.
+        migrations.AlterField(
+            model_name='dailyledgerrollup',
+            name='profile',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_ledger_rollups', to='profiles.profile', verbose_name='Profile'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='profile',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='profiles.profile', verbose_name='Profile'),
+        ),
+    ]
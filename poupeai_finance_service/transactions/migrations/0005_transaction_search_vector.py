@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:31
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# Portuguese stemming with accent folding ("credito" matches "crédito"). unaccent ships with the
+# PostgreSQL contrib modules (and the postgres Docker images); on a server without them the
+# configuration is still created, with stemming only.
+CREATE_SEARCH_CONFIG = """
+CREATE TEXT SEARCH CONFIGURATION portuguese_unaccent (COPY = pg_catalog.portuguese);
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'unaccent') THEN
+        CREATE EXTENSION IF NOT EXISTS unaccent;
+        ALTER TEXT SEARCH CONFIGURATION portuguese_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+    END IF;
+END
+$$;
+"""
+
+DROP_SEARCH_CONFIG = "DROP TEXT SEARCH CONFIGURATION IF EXISTS portuguese_unaccent;"
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('transactions', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, DROP_SEARCH_CONFIG),
+        migrations.AddField(
+            model_name='transaction',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('description', config='portuguese_unaccent', weight='A'), '||', django.contrib.postgres.search.SearchVector('original_purchase_description', config='portuguese_unaccent', weight='B'), django.contrib.postgres.search.SearchConfig('portuguese_unaccent')), '||', django.contrib.postgres.search.SearchVector('original_statement_description', config='portuguese_unaccent', weight='C'), django.contrib.postgres.search.SearchConfig('portuguese_unaccent')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='transaction_search_idx'),
+        ),
+    ]
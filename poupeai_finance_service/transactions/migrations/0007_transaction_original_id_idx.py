@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('transactions', '0006_transaction_trigram_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('original_transaction_id__isnull', False)), fields=['profile', 'original_transaction_id'], name='transaction_original_id_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
@@ -9,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from poupeai_finance_service.bank_accounts.models import BankAccount
 from poupeai_finance_service.categories.models import Category
 from poupeai_finance_service.core.models import TimeStampedModel
+from poupeai_finance_service.core.search import SEARCH_CONFIG
 from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
 from poupeai_finance_service.profiles.models import Profile
 from .managers import TransactionManager
@@ -26,7 +29,9 @@ class Transaction(TimeStampedModel):
         Profile,
         on_delete=models.CASCADE,
         related_name='transactions',
-        verbose_name=_('Profile')
+        verbose_name=_('Profile'),
+        # Covered by transaction_profile_date_idx, which starts with the profile.
+        db_index=False
     )
     category = models.ForeignKey(
         Category,
@@ -91,6 +96,15 @@ class Transaction(TimeStampedModel):
     original_transaction_id = models.CharField(_('Original Transaction ID'), max_length=100, blank=True, null=True)
     original_statement_description = models.TextField(_('Original Statement Description'), blank=True, null=True)
     attachment = models.CharField(_('Attachment URL'), max_length=255, blank=True, null=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('description', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('original_purchase_description', weight='B', config=SEARCH_CONFIG)
+            + SearchVector('original_statement_description', weight='C', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     objects = TransactionManager()
 
@@ -98,6 +112,31 @@ class Transaction(TimeStampedModel):
         verbose_name = _('Transaction')
         verbose_name_plural = _('Transactions')
         ordering = ['-issue_date', '-created_at']
+        indexes = [
+            # Transaction list ordering (both directions), keyset pagination and rollup refreshes.
+            models.Index(fields=['profile', 'issue_date', 'created_at', 'id'], name='transaction_profile_date_idx'),
+            # List filters by type/source_type and per-kind date ranges.
+            models.Index(fields=['profile', 'type', 'source_type', 'issue_date'], name='transaction_profile_kind_idx'),
+            # Installment groups, always read in installment order.
+            models.Index(fields=['purchase_group_uuid', 'installment_number'], name='transaction_purchase_group_idx'),
+            # Profiles with recent writes (dashboard pre-warm).
+            models.Index(fields=['updated_at'], name='transaction_updated_at_idx'),
+            # Full-text search (?search=).
+            GinIndex(fields=['search_vector'], name='transaction_search_idx'),
+            # Typo-tolerant search and description suggestions (pg_trgm).
+            GinIndex(fields=['description'], opclasses=['gin_trgm_ops'], name='transaction_desc_trgm_idx'),
+            GinIndex(
+                fields=['original_statement_description'],
+                opclasses=['gin_trgm_ops'],
+                name='transaction_stmt_trgm_idx'
+            ),
+            # Statement import de-duplication by the statement's transaction id.
+            models.Index(
+                fields=['profile', 'original_transaction_id'],
+                condition=models.Q(original_transaction_id__isnull=False),
+                name='transaction_original_id_idx'
+            ),
+        ]
         
     def __str__(self):
         return f"{self.description} - {self.amount} on {self.issue_date}"
@@ -149,7 +188,12 @@ class Transaction(TimeStampedModel):
         Returns the status of the transaction.
         For BANK_ACCOUNT: PAID.
         For CREDIT_CARD: PAID, PENDING, OVERDUE.
+        Uses the `computed_status` annotation of Transaction.objects.with_status() when present.
         """
+        computed_status = getattr(self, 'computed_status', None)
+        if computed_status is not None:
+            return computed_status
+
         if self.source_type == 'BANK_ACCOUNT':
             return 'PAID'
         elif self.source_type == 'CREDIT_CARD' and self.invoice:
@@ -159,4 +203,50 @@ class Transaction(TimeStampedModel):
                 return 'OVERDUE'
             else:
                 return 'PENDING'
-        return 'PENDING'
\ No newline at end of file
+        return 'PENDING'
+
+class DailyLedgerRollup(models.Model):
+    """
+    Pre-aggregated daily totals per (profile, date, type, source_type, category).
+    Kept in sync with Transaction writes by poupeai_finance_service.transactions.rollups.
+    """
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='daily_ledger_rollups',
+        verbose_name=_('Profile'),
+        # Covered by unique_daily_ledger_rollup_key, which starts with the profile.
+        db_index=False
+    )
+    date = models.DateField(_('Date'))
+    type = models.CharField(_('Type'), max_length=10, choices=Category.CATEGORY_TYPES)
+    source_type = models.CharField(_('Source Type'), max_length=20, choices=Transaction.SOURCE_TYPES)
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='daily_ledger_rollups',
+        verbose_name=_('Category')
+    )
+    total_amount = models.DecimalField(_('Total Amount'), max_digits=14, decimal_places=2, default=0)
+    transaction_count = models.PositiveIntegerField(_('Transaction Count'), default=0)
+
+    class Meta:
+        verbose_name = _('Daily Ledger Rollup')
+        verbose_name_plural = _('Daily Ledger Rollups')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['profile', 'date', 'type', 'source_type', 'category'],
+                name='unique_daily_ledger_rollup_key'
+            )
+        ]
+        indexes = [
+            # Per-source balance/totals scans can be answered from the index alone.
+            models.Index(
+                fields=['profile', 'source_type', 'date'],
+                include=['type', 'total_amount'],
+                name='rollup_profile_source_date_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id} {self.date} {self.type}/{self.source_type}: {self.total_amount}"
@@ -0,0 +1,100 @@
+from collections import defaultdict
+
+from django.db.models import Count, Sum
+
+from poupeai_finance_service.core.data_version import bump_data_version
+from poupeai_finance_service.profiles.models import Profile
+from poupeai_finance_service.transactions.models import DailyLedgerRollup, Transaction
+
+ROLLUP_KEY_FIELDS = ('issue_date', 'type', 'source_type', 'category_id')
+
+def _lock_profile_ledger(profile_id):
+    # Serializes ledger writes per profile so concurrent refreshes of the same day cannot interleave.
+    list(Profile.objects.select_for_update().filter(pk=profile_id).values_list('pk', flat=True))
+    # Every ledger write goes through here, which makes it the single place to invalidate caches.
+    bump_data_version(profile_id)
+
+def _insert_rollups(profile_id, transactions):
+    rows = transactions.values(*ROLLUP_KEY_FIELDS).annotate(
+        total=Sum('amount'),
+        count=Count('id')
+    ).order_by()
+
+    DailyLedgerRollup.objects.bulk_create([
+        DailyLedgerRollup(
+            profile_id=profile_id,
+            date=row['issue_date'],
+            type=row['type'],
+            source_type=row['source_type'],
+            category_id=row['category_id'],
+            total_amount=row['total'],
+            transaction_count=row['count'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+def collect_rollup_keys(queryset):
+    """
+    Returns the distinct (profile_id, issue_date) pairs touched by a Transaction queryset.
+    Call it before deleting or bulk-updating rows so the affected days can be refreshed afterwards.
+    """
+    return set(queryset.order_by().values_list('profile_id', 'issue_date').distinct())
+
+def refresh_daily_rollups(profile_id, dates):
+    """
+    Recomputes the rollup rows of a profile for the given days from the raw transactions.
+    Must run inside the same database transaction as the write that touched those days.
+    """
+    dates = {d for d in dates if d is not None}
+    if not dates:
+        return
+
+    _lock_profile_ledger(profile_id)
+
+    DailyLedgerRollup.objects.filter(profile_id=profile_id, date__in=dates).delete()
+    _insert_rollups(profile_id, Transaction.objects.filter(profile_id=profile_id, issue_date__in=dates))
+
+def refresh_rollup_keys(keys):
+    """
+    Refreshes every (profile_id, issue_date) pair returned by collect_rollup_keys.
+    """
+    dates_by_profile = defaultdict(set)
+    for profile_id, issue_date in keys:
+        dates_by_profile[profile_id].add(issue_date)
+
+    for profile_id, dates in dates_by_profile.items():
+        refresh_daily_rollups(profile_id, dates)
+
+def rebuild_daily_rollups(profile_id):
+    """
+    Drops and recomputes every rollup row of a profile from its raw transactions.
+    """
+    _lock_profile_ledger(profile_id)
+
+    DailyLedgerRollup.objects.filter(profile_id=profile_id).delete()
+    _insert_rollups(profile_id, Transaction.objects.filter(profile_id=profile_id))
+
+def find_rollup_mismatches(profile_id):
+    """
+    Compares the stored rollup rows of a profile with the raw transactions.
+    Returns a list of (key, expected, stored) tuples, where totals are (amount, count) or None.
+    """
+    expected = {
+        (row['issue_date'], row['type'], row['source_type'], row['category_id']): (row['total'], row['count'])
+        for row in Transaction.objects.filter(profile_id=profile_id).values(*ROLLUP_KEY_FIELDS).annotate(
+            total=Sum('amount'),
+            count=Count('id')
+        ).order_by()
+    }
+    stored = {
+        (row['date'], row['type'], row['source_type'], row['category_id']): (row['total_amount'], row['transaction_count'])
+        for row in DailyLedgerRollup.objects.filter(profile_id=profile_id).values(
+            'date', 'type', 'source_type', 'category_id', 'total_amount', 'transaction_count'
+        )
+    }
+
+    return [
+        (key, expected.get(key), stored.get(key))
+        for key in sorted(expected.keys() | stored.keys(), key=str)
+        if expected.get(key) != stored.get(key)
+    ]
@@ -1,11 +1,24 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction as db_transaction
+from django.db.models import Case, CharField, Count, F, Max, Q, TextField, Value, When
+from django.db.models.functions import Cast, Concat
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.serializers import as_serializer_error
 
 from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.core.data_version import bump_data_version
 from poupeai_finance_service.credit_cards.models import Invoice
 from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.transactions.rollups import (
+    collect_rollup_keys,
+    refresh_daily_rollups,
+    refresh_rollup_keys,
+)
+
+BATCH_INSERT_SIZE = 500
+BATCH_RELATED_FIELDS = ['profile', 'category', 'bank_account', 'credit_card', 'invoice']
 
 class TransactionService:
     @staticmethod
@@ -31,6 +44,7 @@ class TransactionService:
 
         if source_type == 'CREDIT_CARD' and is_installment:
             transactions = Transaction.objects.create_installment_transactions(**data)
+            refresh_daily_rollups(profile.pk, {t.issue_date for t in transactions})
             return transactions[0] if transactions else None
         else:
             if source_type == 'CREDIT_CARD' and 'issue_date' in data:
@@ -44,8 +58,98 @@ class TransactionService:
             transaction_instance = Transaction(**data)
             transaction_instance.full_clean()
             transaction_instance.save()
+            refresh_daily_rollups(profile.pk, {transaction_instance.issue_date})
             return transaction_instance
 
+    @staticmethod
+    @db_transaction.atomic
+    def create_transactions_batch(profile, items, atomic=True):
+        """
+        Creates many validated transactions (validated_data of TransactionCreateUpdateSerializer)
+        with a constant number of queries: one default bank account lookup, one set-based
+        get-or-create of the invoices, the bulk inserts and one rollup refresh.
+
+        Returns (created, errors), mapping the position of each item to its created transaction
+        (the first installment of an installment purchase) or to its error dict. With `atomic`,
+        nothing is written when any item is rejected; without it, the accepted items are written
+        and the rejected ones leave nothing behind, not even a new invoice.
+        """
+        default_bank_account = None
+        if any(item.get('source_type') == 'BANK_ACCOUNT' and not item.get('bank_account') for item in items):
+            default_bank_account = BankAccount.objects.filter(profile=profile, is_default=True).first()
+
+        planned = []
+        errors = {}
+        for index, item in enumerate(items):
+            data = {**item, 'profile': profile}
+            data.pop('apply_to_all_installments', None)
+            if data.get('category'):
+                data['type'] = data['category'].type
+
+            if data.get('source_type') == 'BANK_ACCOUNT' and not data.get('bank_account'):
+                if default_bank_account is None:
+                    errors[index] = {"bank_account": [_("Bank account is required for bank account transactions or a default bank account must be set.")]}
+                    continue
+                data['bank_account'] = default_bank_account
+
+            if data.get('source_type') == 'CREDIT_CARD' and data.get('is_installment'):
+                planned.append((index, Transaction.objects.build_installment_transactions(**data)))
+            else:
+                planned.append((index, [Transaction(**data)]))
+
+        # Resolved up front so Transaction.clean() finds the invoice set instead of running
+        # get_or_create_invoice once per row. Missing invoices are only built here and inserted
+        # below for the accepted rows, so rejected items leave no invoice behind.
+        invoices = Invoice.objects.build_invoices(
+            (instance.credit_card, instance.issue_date)
+            for index, instances in planned for instance in instances
+            if instance.source_type == 'CREDIT_CARD' and instance.credit_card
+        )
+
+        rows = []
+        for index, instances in planned:
+            try:
+                for instance in instances:
+                    if instance.source_type == 'CREDIT_CARD' and instance.credit_card:
+                        instance.invoice = invoices[(instance.credit_card.pk, instance.issue_date)]
+                    # Related objects were resolved (and their ownership checked) in bulk by the
+                    # serializer; validating them again here would query once per row.
+                    instance.clean_fields(exclude=BATCH_RELATED_FIELDS)
+                    instance.clean()
+            except DjangoValidationError as e:
+                errors[index] = as_serializer_error(e)
+                continue
+            rows.append((index, instances))
+
+        if errors and atomic:
+            return {}, errors
+
+        invoices = Invoice.objects.save_invoices({
+            (instance.credit_card.pk, instance.issue_date): instance.invoice
+            for index, instances in rows for instance in instances
+            if instance.invoice is not None
+        })
+        created = {}
+        for index, instances in rows:
+            for instance in instances:
+                if instance.invoice is not None:
+                    instance.invoice = invoices[(instance.credit_card.pk, instance.issue_date)]
+                if instance.invoice is not None and instance.invoice.is_paid:
+                    # What Transaction.save() does for purchases on a paid invoice.
+                    instance.bank_account_id = instance.invoice.bank_account_id
+                    instance.payment_date = instance.invoice.payment_date
+            created[index] = instances[0]
+
+        Transaction.objects.bulk_create(
+            [instance for index, instances in rows for instance in instances],
+            batch_size=BATCH_INSERT_SIZE
+        )
+        refresh_daily_rollups(
+            profile.pk,
+            {instance.issue_date for index, instances in rows for instance in instances}
+        )
+        return created, errors
+
     @staticmethod
     @db_transaction.atomic
     def update_transaction(instance, data, apply_to_all_installments=False):
@@ -66,6 +170,8 @@ class TransactionService:
         
         if 'category' in data and data['category']:
             data['type'] = data['category'].type
+
+        touched_dates = {instance.issue_date}
         
         if instance.source_type == 'CREDIT_CARD' and instance.is_installment:
             restricted_fields = [
@@ -87,9 +193,11 @@ class TransactionService:
                     updated_fields['amount'] = data['amount']
                 
                 if updated_fields:
-                    Transaction.objects.filter(
+                    purchase_group = Transaction.objects.filter(
                         purchase_group_uuid=instance.purchase_group_uuid
-                    ).update(**updated_fields)
+                    )
+                    purchase_group.update(**updated_fields)
+                    touched_dates.update(purchase_group.values_list('issue_date', flat=True))
                     instance.refresh_from_db()
             else:
                 for attr, value in data.items():
@@ -107,8 +215,77 @@ class TransactionService:
             instance.full_clean()
             instance.save()
 
+        touched_dates.add(instance.issue_date)
+        refresh_daily_rollups(instance.profile_id, touched_dates)
+
         return instance
     
+    @staticmethod
+    @db_transaction.atomic
+    def bulk_update_transactions(profile, queryset, data):
+        """
+        Applies the same category and/or description to every transaction of `queryset` with a
+        single UPDATE, validated once for the whole set:
+        - `type` follows the new category, and credit card transactions keep an expense category
+        - installments keep their "<description> (i/n)" form and original purchase description
+        - the rollups of the touched days are refreshed when the category changes
+        Returns the number of updated transactions.
+        """
+        # Filtering by primary key drops the annotations and joins of the list queryset,
+        # which an UPDATE cannot carry.
+        queryset = Transaction.objects.filter(pk__in=queryset.order_by().values('pk'))
+        category = data.get('category')
+        description = data.get('description')
+
+        summary = queryset.aggregate(
+            credit_card_count=Count('pk', filter=Q(source_type='CREDIT_CARD')),
+            max_installments=Max('total_installments', filter=Q(is_installment=True)),
+        )
+        if category and category.type != 'expense' and summary['credit_card_count']:
+            raise DRFValidationError(
+                {"category": _("Credit card transactions must be of 'expense' category type.")}
+            )
+        if description is not None and summary['max_installments']:
+            max_length = Transaction._meta.get_field('description').max_length
+            max_length -= len(f" ({summary['max_installments']}/{summary['max_installments']})")
+            if len(description) > max_length:
+                raise DRFValidationError(
+                    {"description": _("Ensure this field has no more than %(max)d characters for installment transactions.")
+                     % {'max': max_length}}
+                )
+
+        changes = {'updated_at': timezone.now()}
+        if category:
+            changes['category'] = category
+            changes['type'] = category.type
+        if description is not None:
+            changes['description'] = Case(
+                When(is_installment=True, then=Concat(
+                    Value(f"{description} ("),
+                    Cast('installment_number', CharField()),
+                    Value('/'),
+                    Cast('total_installments', CharField()),
+                    Value(')'),
+                    output_field=CharField()
+                )),
+                default=Value(description),
+            )
+            changes['original_purchase_description'] = Case(
+                When(is_installment=True, then=Value(description)),
+                default=F('original_purchase_description'),
+                output_field=TextField()
+            )
+
+        rollup_keys = collect_rollup_keys(queryset) if category else set()
+        updated = queryset.update(**changes)
+        if rollup_keys:
+            refresh_rollup_keys(rollup_keys)
+        elif updated:
+            # Descriptions are not part of the rollups, but cached responses still show them.
+            bump_data_version(profile.pk)
+
+        return updated
+
     @staticmethod
     @db_transaction.atomic
     def delete_transaction(instance, deletion_option=None):
@@ -128,21 +305,15 @@ class TransactionService:
             ).order_by('installment_number')
 
             if deletion_option == 'CURRENT_ONLY':
+                rollup_keys = {(instance.profile_id, instance.issue_date)}
                 instance.delete()
-                remaining = purchase_group.exclude(id=instance.id)
-                
-                for idx, trans in enumerate(remaining, start=1):
-                    trans.installment_number = idx
-                    original_desc = trans.original_purchase_description or trans.description.split(' (')[0]
-                    trans.description = f"{original_desc} ({idx}/{remaining.count()})"
-                    trans.save()
-
-                remaining.update(total_installments=remaining.count())
+                Transaction.objects.renumber_installments([instance.purchase_group_uuid])
 
             elif deletion_option == 'CURRENT_AND_FUTURE':
                 to_delete = purchase_group.filter(
                     installment_number__gte=instance.installment_number
                 )
+                rollup_keys = collect_rollup_keys(to_delete)
                 to_delete.delete()
                 
                 remaining = purchase_group.filter(
@@ -156,4 +327,7 @@ class TransactionService:
                     _("Invalid deletion_option. Use 'CURRENT_ONLY' or 'CURRENT_AND_FUTURE'.")
                 )
         else:
+            rollup_keys = {(instance.profile_id, instance.issue_date)}
             instance.delete()
+
+        refresh_rollup_keys(rollup_keys)
@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from poupeai_finance_service.bank_accounts.models import BankAccount
+from poupeai_finance_service.categories.models import Category
+from poupeai_finance_service.credit_cards.models import CreditCard
+from poupeai_finance_service.profiles.models import Profile
+
+TEST_TOKEN = "test-token"
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+@pytest.fixture
+def profile(db):
+    return Profile.objects.create(email="user@poupe.ai", first_name="Test", last_name="User")
+
+@pytest.fixture
+def other_profile(db):
+    return Profile.objects.create(email="other@poupe.ai", first_name="Other", last_name="User")
+
+@pytest.fixture
+def income_category(profile):
+    return Category.objects.create(profile=profile, name="Salário", type="income")
+
+@pytest.fixture
+def expense_category(profile):
+    return Category.objects.create(profile=profile, name="Mercado", type="expense")
+
+@pytest.fixture
+def other_expense_category(profile):
+    return Category.objects.create(profile=profile, name="Lazer", type="expense")
+
+@pytest.fixture
+def bank_account(profile):
+    return BankAccount.objects.create(profile=profile, name="Conta", initial_balance=Decimal("10000.00"))
+
+@pytest.fixture
+def credit_card(profile):
+    return CreditCard.objects.create(
+        profile=profile,
+        name="Cartão",
+        credit_limit=Decimal("50000.00"),
+        closing_day=5,
+        due_day=15,
+        brand=CreditCard.BrandChoices.VISA,
+    )
+
+@pytest.fixture
+def api_request():
+    """
+    Builds a request authenticated as `profile`, without Keycloak.
+    """
+    factory = APIRequestFactory()
+
+    def build(method, profile, path="/", data=None, **extra):
+        if method == "get":
+            request = factory.get(path, data, **extra)
+        else:
+            request = getattr(factory, method)(path, data, format="json", **extra)
+        force_authenticate(request, user=profile, token=TEST_TOKEN)
+        return request
+
+    return build
@@ -0,0 +1,69 @@
+from unittest import mock
+
+import pytest
+
+from poupeai_finance_service.dashboard.cache import get_or_build_dashboard
+from poupeai_finance_service.transactions.api.viewsets import TransactionViewSet
+
+list_view = TransactionViewSet.as_view({'get': 'list'})
+aggregate_view = TransactionViewSet.as_view({'get': 'aggregate'}, **TransactionViewSet.aggregate.kwargs)
+
+@pytest.fixture
+def cache_down():
+    """
+    The cache as django-redis with IGNORE_EXCEPTIONS behaves while Redis is unreachable:
+    reads and add() return None, writes are dropped.
+    """
+    unreachable = mock.MagicMock()
+    unreachable.get.return_value = None
+    unreachable.add.return_value = None
+    unreachable.incr.side_effect = ValueError
+    with mock.patch('poupeai_finance_service.core.data_version.cache', unreachable), \
+            mock.patch('poupeai_finance_service.dashboard.cache.cache', unreachable):
+        yield unreachable
+
+def test_list_answers_304_while_the_data_is_unchanged(profile, api_request):
+    response = list_view(api_request('get', profile))
+    assert response.status_code == 200
+    etag = response['ETag']
+
+    response = list_view(api_request('get', profile, HTTP_IF_NONE_MATCH=etag))
+    assert response.status_code == 304
+
+def test_if_modified_since_alone_never_answers_304(profile, api_request):
+    response = list_view(api_request('get', profile))
+    assert 'Last-Modified' not in response
+
+    response = list_view(api_request('get', profile, HTTP_IF_MODIFIED_SINCE="Wed, 01 Jan 2098 00:00:00 GMT"))
+
+    assert response.status_code == 200
+
+def test_list_is_served_without_validators_when_the_cache_is_down(profile, api_request, cache_down):
+    response = list_view(api_request('get', profile))
+
+    assert response.status_code == 200
+    assert 'ETag' not in response
+    assert 'Last-Modified' not in response
+
+def test_stale_etag_is_not_answered_with_304_when_the_cache_is_down(profile, api_request):
+    etag = list_view(api_request('get', profile))['ETag']
+
+    with mock.patch('poupeai_finance_service.core.data_version.cache') as unreachable:
+        unreachable.get.return_value = None
+        unreachable.add.return_value = None
+        response = list_view(api_request('get', profile, HTTP_IF_NONE_MATCH=etag))
+
+    assert response.status_code == 200
+
+def test_aggregate_is_served_when_the_cache_is_down(profile, api_request, cache_down):
+    response = aggregate_view(api_request('get', profile, data={'group_by': 'category'}))
+
+    assert response.status_code == 200
+    assert 'ETag' not in response
+
+def test_dashboard_cache_is_bypassed_when_the_cache_is_down(profile, cache_down):
+    payload, cache_status = get_or_build_dashboard(profile.pk, "period", lambda: {"ok": True})
+
+    assert payload == {"ok": True}
+    assert cache_status == 'BYPASS'
+    cache_down.set.assert_not_called()
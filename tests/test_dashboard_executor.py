@@ -0,0 +1,19 @@
+from django.db import connection
+
+from poupeai_finance_service.dashboard.executor import EXECUTOR_SERIAL, DashboardSection, run_sections
+from poupeai_finance_service.profiles.models import Profile
+
+def _failing_query():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT * FROM missing_dashboard_table")
+
+def test_failed_section_does_not_abort_the_following_ones(profile):
+    sections = [
+        DashboardSection("broken", _failing_query, fallback=[]),
+        DashboardSection("profiles", lambda: Profile.objects.filter(pk=profile.pk).count(), fallback=0),
+    ]
+
+    results, degraded = run_sections(sections, mode=EXECUTOR_SERIAL)
+
+    assert results == {"broken": [], "profiles": 1}
+    assert degraded == ["broken"]
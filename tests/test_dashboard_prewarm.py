@@ -0,0 +1,37 @@
+from unittest import mock
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.test import override_settings
+
+from poupeai_finance_service.dashboard import tasks
+from poupeai_finance_service.dashboard.cache import warm_dashboard
+from poupeai_finance_service.profiles.models import Profile
+
+@override_settings(DASHBOARD_CACHE_TIMEOUT=60 * 60, DASHBOARD_PREWARM_TIMEOUT=24 * 60 * 60)
+def test_warmed_dashboards_are_kept_for_the_prewarm_timeout(profile):
+    with mock.patch('poupeai_finance_service.dashboard.cache.cache') as cache:
+        cache.get.return_value = None
+        with mock.patch('poupeai_finance_service.dashboard.cache.get_data_version', return_value=1):
+            assert warm_dashboard(profile.pk, "period", lambda: {"ok": True})
+
+    cache.set.assert_called_once_with(mock.ANY, {"ok": True}, timeout=24 * 60 * 60)
+
+@pytest.fixture
+def profiles(db):
+    return [Profile.objects.create(email=f"user{i}@poupe.ai") for i in range(4)]
+
+def test_chunk_keeps_going_after_a_failed_profile(profiles):
+    failures = [None, RuntimeError("boom"), None, None]
+    with mock.patch.object(tasks, 'warm_profile_dashboards', side_effect=failures):
+        assert tasks.prewarm_dashboard_chunk(5, [str(p.pk) for p in profiles]) == 5 + 3
+
+def test_chunk_stops_at_the_soft_time_limit_and_returns_its_count(profiles):
+    failures = [None, None, SoftTimeLimitExceeded(), None]
+    with mock.patch.object(tasks, 'warm_profile_dashboards', side_effect=failures) as warm:
+        assert tasks.prewarm_dashboard_chunk(5, [str(p.pk) for p in profiles]) == 5 + 2
+
+    assert warm.call_count == 3
+
+def test_chunk_task_has_its_own_time_limits():
+    assert tasks.prewarm_dashboard_chunk.soft_time_limit < tasks.prewarm_dashboard_chunk.time_limit
@@ -0,0 +1,137 @@
+import hashlib
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from poupeai_finance_service.core.idempotency import IDEMPOTENCY_LOCK_KEY, IDEMPOTENCY_RESPONSE_KEY
+from poupeai_finance_service.credit_cards.api.viewsets import InvoiceViewSet
+from poupeai_finance_service.credit_cards.models import Invoice
+from poupeai_finance_service.transactions.api.viewsets import TransactionViewSet
+from poupeai_finance_service.transactions.models import Transaction
+
+create_view = TransactionViewSet.as_view({'post': 'create'})
+payment_view = InvoiceViewSet.as_view({'post': 'payment'}, **InvoiceViewSet.payment.kwargs)
+
+class Rollback(Exception):
+    pass
+
+@pytest.fixture
+def body(expense_category, bank_account):
+    return {
+        'description': "Mercado do mês",
+        'amount': "120.50",
+        'issue_date': "2025-03-05",
+        'source_type': 'BANK_ACCOUNT',
+        'bank_account': bank_account.pk,
+        'category': expense_category.pk,
+    }
+
+@pytest.fixture
+def post(api_request, django_capture_on_commit_callbacks):
+    """
+    Sends a transaction create as a request of its own, committing (and running the on_commit
+    callbacks) at the end, as ATOMIC_REQUESTS does.
+    """
+    def send(profile, data, key=None):
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key is not None else {}
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                response = create_view(api_request('post', profile, path="/api/v1/transactions/", data=data, **headers))
+        response.render()
+        return response
+
+    return send
+
+def _cache_keys(profile, key, scope="TransactionViewSet.create"):
+    names = {
+        'profile_id': profile.pk,
+        'scope': scope,
+        'key': hashlib.sha256(key.encode()).hexdigest(),
+    }
+    return IDEMPOTENCY_RESPONSE_KEY.format(**names), IDEMPOTENCY_LOCK_KEY.format(**names)
+
+def test_retry_with_the_same_key_replays_the_first_response(profile, body, post):
+    first = post(profile, body, key="key-1")
+    retry = post(profile, body, key="key-1")
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.content == first.content
+    assert retry['Idempotent-Replayed'] == 'true'
+    assert 'Idempotent-Replayed' not in first
+    assert Transaction.objects.filter(profile=profile).count() == 1
+
+def test_requests_without_a_key_are_not_deduplicated(profile, body, post):
+    post(profile, body)
+    post(profile, body)
+
+    assert Transaction.objects.filter(profile=profile).count() == 2
+
+def test_key_reused_with_a_different_body_is_rejected(profile, body, post):
+    post(profile, body, key="key-1")
+
+    response = post(profile, {**body, 'amount': "99.90"}, key="key-1")
+
+    assert response.status_code == 422
+    assert Transaction.objects.filter(profile=profile).count() == 1
+
+def test_keys_are_scoped_to_the_profile(profile, other_profile, body, post):
+    post(profile, body, key="key-1")
+
+    # The other profile does not own the category, so its request fails on its own terms.
+    response = post(other_profile, body, key="key-1")
+
+    assert response.status_code == 400
+    assert 'Idempotent-Replayed' not in response
+
+def test_rejected_requests_are_not_stored(profile, body, post):
+    invalid = post(profile, {**body, 'amount': "-1"}, key="key-1")
+    retry = post(profile, body, key="key-1")
+
+    assert invalid.status_code == 400
+    assert cache.get(_cache_keys(profile, "key-1")[1]) is None
+    assert retry.status_code == 201
+    assert 'Idempotent-Replayed' not in retry
+    assert Transaction.objects.filter(profile=profile).count() == 1
+
+def test_error_responses_returned_by_the_action_are_not_stored(profile, credit_card, bank_account, api_request):
+    invoice = Invoice.objects.get_or_create_invoice(credit_card=credit_card, issue_date=date(2025, 3, 5))
+    invoice.payment_date = date(2025, 4, 1)
+    invoice.bank_account = bank_account
+    invoice.save()
+    data = {'payment_date': "2025-04-01", 'bank_account_id': bank_account.pk}
+
+    for _ in range(2):
+        request = api_request('post', profile, data=data, HTTP_IDEMPOTENCY_KEY="key-1")
+        response = payment_view(request, id=credit_card.pk, pk=invoice.pk)
+
+        assert response.status_code == 409
+        assert 'Idempotent-Replayed' not in response
+
+    response_key, lock_key = _cache_keys(profile, "key-1", scope="InvoiceViewSet.payment")
+    assert cache.get(response_key) is None
+    assert cache.get(lock_key) is None
+
+def test_rolled_back_writes_are_not_stored(profile, body, api_request, post, django_capture_on_commit_callbacks):
+    response_key, lock_key = _cache_keys(profile, "key-1")
+    request = api_request('post', profile, path="/api/v1/transactions/", data=body, HTTP_IDEMPOTENCY_KEY="key-1")
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(Rollback):
+            with transaction.atomic():
+                assert create_view(request).status_code == 201
+                raise Rollback
+
+    assert callbacks == []
+    assert cache.get(response_key) is None
+    assert Transaction.objects.filter(profile=profile).count() == 0
+
+    # Once the lock of the rolled back request expires, the retry writes again.
+    cache.delete(lock_key)
+    retry = post(profile, body, key="key-1")
+
+    assert retry.status_code == 201
+    assert 'Idempotent-Replayed' not in retry
+    assert Transaction.objects.filter(profile=profile).count() == 1
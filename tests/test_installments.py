@@ -0,0 +1,100 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.transactions.services import TransactionService
+
+@pytest.fixture
+def make_purchase(profile, expense_category, credit_card):
+    def make(description="Geladeira", total_installments=4):
+        first = TransactionService.create_transaction(profile, {
+            'category': expense_category,
+            'description': description,
+            'amount': Decimal("100.00"),
+            'issue_date': date(2025, 1, 10),
+            'source_type': 'CREDIT_CARD',
+            'credit_card': credit_card,
+            'is_installment': True,
+            'total_installments': total_installments,
+        })
+        return first.purchase_group_uuid
+
+    return make
+
+def _group(purchase_group_uuid):
+    return list(Transaction.objects.filter(purchase_group_uuid=purchase_group_uuid).order_by('installment_number'))
+
+def _renumber_row_by_row(remaining):
+    """
+    What the per-row loop that renumber_installments replaced would have saved, by id:
+    (installment_number, total_installments, description).
+    """
+    expected = {}
+    for idx, trans in enumerate(remaining, start=1):
+        original_desc = trans.original_purchase_description or trans.description.split(' (')[0]
+        expected[trans.id] = (idx, len(remaining), f"{original_desc} ({idx}/{len(remaining)})")
+    return expected
+
+def _saved(purchase_group_uuid):
+    return {
+        trans.id: (trans.installment_number, trans.total_installments, trans.description)
+        for trans in _group(purchase_group_uuid)
+    }
+
+@pytest.mark.parametrize(
+    ("description", "original_purchase_description", "deleted_numbers"),
+    [
+        ("Geladeira", None, [2]),
+        ("Geladeira", None, [1, 2, 3]),
+        ("Geladeira", None, [4]),
+        ("Tênis (promoção)", None, [2]),
+        ("Tênis (promoção)", "", [2]),
+        ("Tênis (promoção)", "Tênis (promoção)", [3]),
+    ],
+    ids=["middle", "last-remaining", "last", "parenthesis", "parenthesis-empty-original", "parenthesis-original"],
+)
+def test_renumbering_matches_the_row_by_row_logic(
+    make_purchase, description, original_purchase_description, deleted_numbers
+):
+    purchase_group_uuid = make_purchase(description)
+    group = Transaction.objects.filter(purchase_group_uuid=purchase_group_uuid)
+    if original_purchase_description != description:
+        group.update(original_purchase_description=original_purchase_description)
+    group.filter(installment_number__in=deleted_numbers).delete()
+    expected = _renumber_row_by_row(_group(purchase_group_uuid))
+
+    Transaction.objects.renumber_installments([purchase_group_uuid])
+
+    assert _saved(purchase_group_uuid) == expected
+
+def test_renumbering_handles_several_groups_at_once(make_purchase):
+    first_group, second_group = make_purchase("Geladeira", 3), make_purchase("Notebook", 5)
+    Transaction.objects.filter(purchase_group_uuid=first_group, installment_number=1).delete()
+    Transaction.objects.filter(purchase_group_uuid=second_group, installment_number__in=[2, 4]).delete()
+    expected = {**_renumber_row_by_row(_group(first_group)), **_renumber_row_by_row(_group(second_group))}
+
+    Transaction.objects.renumber_installments([first_group, second_group])
+
+    assert {**_saved(first_group), **_saved(second_group)} == expected
+
+def test_deleting_a_middle_installment_renumbers_the_others(make_purchase):
+    purchase_group_uuid = make_purchase("Tênis (promoção)", 4)
+    middle = Transaction.objects.get(purchase_group_uuid=purchase_group_uuid, installment_number=2)
+
+    TransactionService.delete_transaction(middle, 'CURRENT_ONLY')
+
+    assert [(t.installment_number, t.total_installments, t.description) for t in _group(purchase_group_uuid)] == [
+        (1, 3, "Tênis (promoção) (1/3)"),
+        (2, 3, "Tênis (promoção) (2/3)"),
+        (3, 3, "Tênis (promoção) (3/3)"),
+    ]
+
+def test_deleting_an_invoice_renumbers_the_installments_left_in_other_invoices(make_purchase):
+    purchase_group_uuid = make_purchase("Geladeira", 3)
+    middle = Transaction.objects.get(purchase_group_uuid=purchase_group_uuid, installment_number=2)
+
+    middle.invoice.delete()
+
+    assert [t.description for t in _group(purchase_group_uuid)] == ["Geladeira (1/2)", "Geladeira (2/2)"]
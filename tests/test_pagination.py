@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.db import connection
+
+from poupeai_finance_service.core.pagination import KeysetPagination
+from poupeai_finance_service.transactions.api.viewsets import TransactionViewSet
+from poupeai_finance_service.transactions.models import Transaction
+
+list_view = TransactionViewSet.as_view({'get': 'list'})
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch):
+    monkeypatch.setattr(KeysetPagination, 'page_size', 3)
+
+@pytest.fixture
+def transactions(profile, expense_category, bank_account):
+    # Pairs of transactions share an issue date, so pages break inside ties.
+    return Transaction.objects.bulk_create(
+        Transaction(
+            profile=profile,
+            category=expense_category,
+            type='expense',
+            description=f"Compra {i}",
+            amount=Decimal(10 + i),
+            issue_date=date(2025, 3, 1) + timedelta(days=i // 2),
+            source_type='BANK_ACCOUNT',
+            bank_account=bank_account,
+        )
+        for i in range(8)
+    )
+
+@pytest.fixture
+def get_page(profile, api_request):
+    def get(**params):
+        response = list_view(api_request('get', profile, path="/api/v1/transactions/", data=params))
+        response.render()
+        return response
+
+    return get
+
+def _cursor(link):
+    return parse_qs(urlparse(link).query)['cursor'][0]
+
+def _ids(response):
+    return [row['id'] for row in response.data['results']]
+
+def _walk(get_page, **params):
+    pages = [get_page(pagination='cursor', **params)]
+    while pages[-1].data['next']:
+        pages.append(get_page(cursor=_cursor(pages[-1].data['next']), **params))
+    return pages
+
+def test_next_links_walk_every_row_once_in_order(transactions, get_page):
+    pages = _walk(get_page)
+
+    expected = list(
+        Transaction.objects.order_by('-issue_date', '-created_at', '-id').values_list('id', flat=True)
+    )
+    assert [row_id for page in pages for row_id in _ids(page)] == expected
+    assert [len(_ids(page)) for page in pages] == [3, 3, 2]
+    assert pages[0].data['previous'] is None
+
+def test_previous_links_walk_back_to_the_same_pages(transactions, get_page):
+    pages = _walk(get_page)
+
+    previous = get_page(cursor=_cursor(pages[-1].data['previous']))
+    first = get_page(cursor=_cursor(previous.data['previous']))
+
+    assert _ids(previous) == _ids(pages[1])
+    assert _ids(first) == _ids(pages[0])
+    assert first.data['previous'] is None
+    assert _ids(get_page(cursor=_cursor(first.data['next']))) == _ids(pages[1])
+
+def test_ascending_ordering_walks_in_reverse(transactions, get_page):
+    descending = [row_id for page in _walk(get_page, ordering='-issue_date') for row_id in _ids(page)]
+    ascending = [row_id for page in _walk(get_page, ordering='issue_date') for row_id in _ids(page)]
+
+    assert ascending == list(
+        Transaction.objects.order_by('issue_date', 'created_at', 'id').values_list('id', flat=True)
+    )
+    assert sorted(ascending) == sorted(descending)
+
+def test_cursor_of_another_ordering_is_rejected(transactions, get_page):
+    first = get_page(pagination='cursor', ordering='-issue_date')
+
+    response = get_page(cursor=_cursor(first.data['next']), ordering='amount')
+
+    assert response.status_code == 404
+
+def test_malformed_cursor_is_rejected(transactions, get_page):
+    assert get_page(cursor="not-a-cursor").status_code == 404
+
+def test_search_ranked_by_relevance_cannot_be_paged_by_cursor(transactions, get_page):
+    response = get_page(pagination='cursor', search="compra")
+
+    assert response.status_code == 400
+    assert 'ordering' in response.data
+
+def test_search_with_an_explicit_ordering_is_paged_by_cursor(transactions, get_page):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            pytest.skip("The search matches by trigram similarity, which needs pg_trgm.")
+
+    pages = _walk(get_page, search="compra", ordering='-amount')
+
+    assert [row_id for page in pages for row_id in _ids(page)] == list(
+        Transaction.objects.order_by('-amount', '-issue_date', '-created_at', '-id').values_list('id', flat=True)
+    )
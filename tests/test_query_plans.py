@@ -0,0 +1,71 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from poupeai_finance_service.core.query_plans import check_query_plans, get_hot_queries
+from poupeai_finance_service.credit_cards.models import CreditCard, Invoice
+from poupeai_finance_service.dashboard.benchmarks import _analyze_tables, seed_benchmark_profile
+from poupeai_finance_service.transactions.models import Transaction
+
+# The checked profile is a small share of the table, as any profile is in production, so the
+# planner has a real choice between its indexes and a sequential scan.
+CHECKED_PROFILE_SIZE = 2000
+OTHER_PROFILE_SIZE = 20000
+# Paid invoices of other cards: the notification tasks must only visit the few unpaid ones.
+PAID_INVOICE_CARDS = 50
+PAID_INVOICE_MONTHS = 120
+
+def _has_extension(name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [name])
+        return cursor.fetchone() is not None
+
+def _create_paid_invoices(profile):
+    cards = CreditCard.objects.bulk_create(
+        CreditCard(
+            profile=profile, name=f"Cartão {i}", credit_limit=Decimal("1000.00"),
+            closing_day=5, due_day=15, brand=CreditCard.BrandChoices.VISA
+        )
+        for i in range(PAID_INVOICE_CARDS)
+    )
+    invoices = []
+    for card in cards:
+        for months_ago in range(1, PAID_INVOICE_MONTHS + 1):
+            year, month = divmod(date.today().year * 12 + date.today().month - 1 - months_ago, 12)
+            due_date = date(year, month + 1, 15)
+            invoices.append(Invoice(
+                credit_card=card, month=month + 1, year=year, due_date=due_date, payment_date=due_date
+            ))
+    Invoice.objects.bulk_create(invoices)
+
+@pytest.fixture
+def seeded_profile(db):
+    other_profile = seed_benchmark_profile(OTHER_PROFILE_SIZE, seed=1)
+    _create_paid_invoices(other_profile)
+    profile = seed_benchmark_profile(CHECKED_PROFILE_SIZE)
+    # Seeded rows are all "updated" now; only a few are recent in a real table.
+    Transaction.objects.update(updated_at=timezone.now() - timedelta(days=90))
+    Transaction.objects.filter(pk__in=Transaction.objects.filter(profile=profile).values('pk')[:20]).update(
+        updated_at=timezone.now()
+    )
+    _analyze_tables()
+    return profile
+
+def test_hot_queries_use_their_indexes_with_sequential_scans_enabled(seeded_profile):
+    checks = get_hot_queries()
+    if not _has_extension("pg_trgm"):
+        # The trigram index (and the suggestions query itself) needs the pg_trgm extension.
+        checks = [check for check in checks if "transaction_desc_trgm_idx" not in check.expected_indexes]
+
+    results = check_query_plans(seeded_profile.pk, allow_seqscan=True, checks=checks)
+
+    failures = [
+        f"{check.name}: scanned {', '.join(sorted(scanned)) or 'no index'}, "
+        f"expected one of {', '.join(check.expected_indexes)}"
+        for check, scanned, ok in results
+        if not ok
+    ]
+    assert not failures, "\n".join(failures)
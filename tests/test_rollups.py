@@ -0,0 +1,137 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from poupeai_finance_service.core.data_version import get_data_version
+from poupeai_finance_service.credit_cards.api.viewsets import InvoiceViewSet
+from poupeai_finance_service.transactions.models import DailyLedgerRollup, Transaction
+from poupeai_finance_service.transactions.rollups import find_rollup_mismatches
+from poupeai_finance_service.transactions.services import TransactionService
+
+payment_view = InvoiceViewSet.as_view({'post': 'payment'}, **InvoiceViewSet.payment.kwargs)
+reopen_view = InvoiceViewSet.as_view({'post': 'reopen'}, **InvoiceViewSet.reopen.kwargs)
+
+@pytest.fixture
+def ledger(profile, income_category, expense_category, bank_account, credit_card):
+    """
+    A salary, a bank expense, a single card purchase and a card purchase in three installments.
+    """
+    def create(**data):
+        return TransactionService.create_transaction(profile, {'amount': Decimal("100.00"), **data})
+
+    return {
+        'salary': create(
+            category=income_category, description="Salário", amount=Decimal("5000.00"),
+            issue_date=date(2025, 3, 5), source_type='BANK_ACCOUNT', bank_account=bank_account,
+        ),
+        'groceries': create(
+            category=expense_category, description="Mercado", issue_date=date(2025, 3, 5),
+            source_type='BANK_ACCOUNT', bank_account=bank_account,
+        ),
+        'purchase': create(
+            category=expense_category, description="Livro", issue_date=date(2025, 3, 8),
+            source_type='CREDIT_CARD', credit_card=credit_card,
+        ),
+        'installment': create(
+            category=expense_category, description="Geladeira", amount=Decimal("300.00"),
+            issue_date=date(2025, 3, 10), source_type='CREDIT_CARD', credit_card=credit_card,
+            is_installment=True, total_installments=3,
+        ),
+    }
+
+def _group(transaction):
+    return Transaction.objects.filter(purchase_group_uuid=transaction.purchase_group_uuid)
+
+def _update_amount_and_date(ledger, categories):
+    TransactionService.update_transaction(
+        ledger['groceries'], {'amount': Decimal("80.00"), 'issue_date': date(2025, 3, 20)}
+    )
+
+def _update_category(ledger, categories):
+    TransactionService.update_transaction(ledger['purchase'], {'category': categories['other_expense']})
+
+def _update_one_installment(ledger, categories):
+    second = _group(ledger['installment']).get(installment_number=2)
+    TransactionService.update_transaction(second, {'amount': Decimal("50.00")})
+
+def _update_all_installments(ledger, categories):
+    TransactionService.update_transaction(
+        ledger['installment'],
+        {'amount': Decimal("75.00"), 'category': categories['other_expense']},
+        apply_to_all_installments=True,
+    )
+
+def _bulk_update_category(ledger, categories):
+    queryset = Transaction.objects.filter(type='expense')
+    TransactionService.bulk_update_transactions(ledger['salary'].profile, queryset, {'category': categories['other_expense']})
+
+def _delete(ledger, categories):
+    TransactionService.delete_transaction(ledger['groceries'])
+
+def _delete_current_installment(ledger, categories):
+    TransactionService.delete_transaction(_group(ledger['installment']).get(installment_number=2), 'CURRENT_ONLY')
+
+def _delete_current_and_future_installments(ledger, categories):
+    TransactionService.delete_transaction(
+        _group(ledger['installment']).get(installment_number=2), 'CURRENT_AND_FUTURE'
+    )
+
+def _delete_invoice(ledger, categories):
+    ledger['purchase'].invoice.delete()
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        _update_amount_and_date,
+        _update_category,
+        _update_one_installment,
+        _update_all_installments,
+        _bulk_update_category,
+        _delete,
+        _delete_current_installment,
+        _delete_current_and_future_installments,
+        _delete_invoice,
+    ],
+    ids=lambda write: write.__name__.lstrip('_'),
+)
+def test_rollups_match_the_transactions_after_each_write(profile, ledger, other_expense_category, write):
+    assert DailyLedgerRollup.objects.filter(profile=profile).exists()
+    assert find_rollup_mismatches(profile.pk) == []
+
+    write(ledger, {'other_expense': other_expense_category})
+
+    assert find_rollup_mismatches(profile.pk) == []
+
+def test_mismatches_are_reported(profile, ledger):
+    Transaction.objects.filter(pk=ledger['groceries'].pk).update(amount=Decimal("1.00"))
+
+    mismatches = find_rollup_mismatches(profile.pk)
+
+    assert len(mismatches) == 1
+    key, expected, stored = mismatches[0]
+    assert key[0] == date(2025, 3, 5)
+    assert expected == (Decimal("1.00"), 1)
+    assert stored == (Decimal("100.00"), 1)
+
+def test_paying_and_reopening_an_invoice_leaves_the_rollups_untouched(
+    profile, ledger, bank_account, api_request, django_capture_on_commit_callbacks
+):
+    invoice = ledger['purchase'].invoice
+    rollups = list(DailyLedgerRollup.objects.filter(profile=profile).values_list('pk', flat=True))
+    version = get_data_version(profile.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = payment_view(
+            api_request('post', profile, data={'payment_date': "2025-04-15", 'bank_account_id': bank_account.pk}),
+            id=invoice.credit_card_id, pk=invoice.pk
+        )
+    assert response.status_code == 204
+    assert get_data_version(profile.pk) != version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = reopen_view(api_request('post', profile), id=invoice.credit_card_id, pk=invoice.pk)
+    assert response.status_code == 204
+
+    assert list(DailyLedgerRollup.objects.filter(profile=profile).values_list('pk', flat=True)) == rollups
+    assert find_rollup_mismatches(profile.pk) == []
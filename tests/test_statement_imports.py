@@ -0,0 +1,141 @@
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+from poupeai_finance_service.imports.models import StatementImport
+from poupeai_finance_service.imports.services import guess_file_format
+from poupeai_finance_service.imports.tasks import cleanup_stale_statement_imports, process_statement_import
+from poupeai_finance_service.transactions.models import Transaction
+
+FIXTURES = Path(__file__).parent / "fixtures" / "statements"
+
+CSV_STATEMENT = "Data;Descrição;Valor\n05/03/2025;Padaria;-12,50\n06/03/2025;Salário;3.500,00\n".encode()
+
+@pytest.fixture
+def statement_storage(tmp_path, monkeypatch):
+    storage = FileSystemStorage(location=tmp_path)
+    monkeypatch.setattr(StatementImport._meta.get_field('file'), 'storage', storage)
+    return storage
+
+@pytest.fixture
+def make_statement_import(profile, bank_account, income_category, expense_category, statement_storage):
+    def make(content=CSV_STATEMENT, file_name="extrato.csv", **fields):
+        return StatementImport.objects.create(
+            profile=profile,
+            file=ContentFile(content, name=file_name),
+            file_name=file_name,
+            file_format=guess_file_format(file_name),
+            source_type='BANK_ACCOUNT',
+            bank_account=bank_account,
+            income_category=income_category,
+            expense_category=expense_category,
+            **fields
+        )
+
+    return make
+
+def test_statements_are_stored_outside_media_root():
+    storage = StatementImport._meta.get_field('file').storage
+
+    root = os.path.realpath(storage.location)
+    assert root == os.path.realpath(settings.STATEMENT_IMPORT_ROOT)
+    assert os.path.commonpath([root, os.path.realpath(settings.MEDIA_ROOT)]) != os.path.realpath(settings.MEDIA_ROOT)
+
+def test_statements_are_stored_under_a_random_name(make_statement_import, statement_storage):
+    statement_import = make_statement_import(file_name="extrato-maria-silva.csv")
+
+    assert "maria" not in statement_import.file.name
+    assert statement_import.file.name.endswith(".csv")
+    assert statement_storage.exists(statement_import.file.name)
+
+def test_file_is_deleted_when_the_import_completes(make_statement_import, statement_storage):
+    statement_import = make_statement_import()
+    file_name = statement_import.file.name
+
+    process_statement_import(statement_import.pk)
+
+    statement_import.refresh_from_db()
+    assert statement_import.status == StatementImport.Status.COMPLETED
+    assert statement_import.imported_count == 2
+    assert not statement_import.file
+    assert not statement_storage.exists(file_name)
+
+def test_file_is_deleted_when_the_import_fails(make_statement_import, statement_storage):
+    statement_import = make_statement_import(content=b"foo;bar\n1;2\n")
+    file_name = statement_import.file.name
+
+    process_statement_import(statement_import.pk)
+
+    statement_import.refresh_from_db()
+    assert statement_import.status == StatementImport.Status.FAILED
+    assert "missing" in statement_import.error_message
+    assert not statement_import.file
+    assert not statement_storage.exists(file_name)
+
+def test_cleanup_fails_stale_imports_and_deletes_their_files(make_statement_import, statement_storage):
+    long_ago = timezone.now() - timedelta(seconds=settings.STATEMENT_IMPORT_STALE_AFTER + 60)
+    stale_processing = make_statement_import(status=StatementImport.Status.PROCESSING, started_at=long_ago)
+    stale_pending = make_statement_import()
+    StatementImport.objects.filter(pk=stale_pending.pk).update(created_at=long_ago)
+    running = make_statement_import(status=StatementImport.Status.PROCESSING, started_at=timezone.now())
+
+    cleanup_stale_statement_imports()
+
+    for statement_import in (stale_processing, stale_pending):
+        file_name = statement_import.file.name
+        statement_import.refresh_from_db()
+        assert statement_import.status == StatementImport.Status.FAILED
+        assert statement_import.finished_at is not None
+        assert not statement_import.file
+        assert not statement_storage.exists(file_name)
+
+    running.refresh_from_db()
+    assert running.status == StatementImport.Status.PROCESSING
+    assert statement_storage.exists(running.file.name)
+
+@pytest.mark.parametrize("file_name", ["extrato_ponto_e_virgula.csv", "extrato_virgula.csv", "extrato_sgml.ofx"])
+def test_reimporting_a_statement_skips_its_lines_as_duplicates(make_statement_import, profile, file_name):
+    content = (FIXTURES / file_name).read_bytes()
+    first = make_statement_import(content=content, file_name=file_name)
+    process_statement_import(first.pk)
+    second = make_statement_import(content=content, file_name=file_name)
+    process_statement_import(second.pk)
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.imported_count > 0
+    assert second.status == StatementImport.Status.COMPLETED
+    assert second.imported_count == 0
+    assert second.duplicate_count == first.imported_count
+    assert second.failed_count == first.failed_count
+    assert Transaction.objects.filter(profile=profile).count() == first.imported_count
+
+def test_identical_lines_without_ids_are_imported_once_each(make_statement_import, profile):
+    content = "Data;Descrição;Valor\n05/03/2025;Café;-5,00\n05/03/2025;Café;-5,00\n".encode()
+    first = make_statement_import(content=content)
+    process_statement_import(first.pk)
+    second = make_statement_import(content=content)
+    process_statement_import(second.pk)
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert (first.imported_count, first.duplicate_count) == (2, 0)
+    assert (second.imported_count, second.duplicate_count) == (0, 2)
+    assert Transaction.objects.filter(profile=profile).count() == 2
+
+def test_invalid_lines_are_reported_with_their_line_numbers(make_statement_import):
+    content = (FIXTURES / "extrato_linhas_invalidas.csv").read_bytes()
+    statement_import = make_statement_import(content=content)
+
+    process_statement_import(statement_import.pk)
+
+    statement_import.refresh_from_db()
+    assert statement_import.status == StatementImport.Status.COMPLETED
+    assert (statement_import.imported_count, statement_import.failed_count) == (2, 2)
+    assert [error['line'] for error in statement_import.errors] == [3, 4]
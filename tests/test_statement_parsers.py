@@ -0,0 +1,98 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from poupeai_finance_service.imports.parsers import (
+    InvalidStatementLine,
+    StatementLine,
+    StatementParseError,
+    parse_amount,
+    parse_statement,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "statements"
+
+def parse_fixture(name, file_format):
+    with open(FIXTURES / name, 'rb') as binary_file:
+        return list(parse_statement(binary_file, file_format))
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("-1234.56", Decimal("-1234.56")),
+        ("1.234,56", Decimal("1234.56")),
+        ("R$ -1.234,56", Decimal("-1234.56")),
+        ("1,234.56", Decimal("1234.56")),
+        ("-12,5", Decimal("-12.5")),
+        ("R$\xa0980,00", Decimal("980.00")),
+    ],
+)
+def test_amounts_in_brazilian_and_english_formats(value, expected):
+    assert parse_amount(value) == expected
+
+def test_semicolon_csv_in_windows_1252_with_brazilian_formats():
+    lines = parse_fixture("extrato_ponto_e_virgula.csv", "CSV")
+
+    assert lines == [
+        StatementLine(2, date(2025, 3, 5), Decimal("-12.50"), "PADARIA PÃO QUENTE", "Cartão de débito"),
+        StatementLine(3, date(2025, 3, 6), Decimal("3500.00"), "SALÁRIO", "Empresa X"),
+        # The blank line 4 is skipped; two-digit years are read too.
+        StatementLine(5, date(2025, 3, 7), Decimal("-1850.75"), "ALUGUEL", ""),
+    ]
+
+def test_comma_csv_with_quoted_fields_and_ids():
+    lines = parse_fixture("extrato_virgula.csv", "CSV")
+
+    assert [(line.description, line.amount, line.transaction_id) for line in lines] == [
+        ("Coffee shop", Decimal("-4.50"), "tx-001"),
+        ("Rent, March", Decimal("-1200.00"), "tx-002"),
+        ("Refund", Decimal("15.00"), "tx-003"),
+    ]
+    assert lines[0].issue_date == date(2025, 3, 5)
+
+def test_tab_separated_csv_with_a_byte_order_mark():
+    lines = parse_fixture("extrato_tabulacao.csv", "CSV")
+
+    assert [(line.issue_date, line.description, line.amount) for line in lines] == [
+        (date(2025, 3, 5), "Mercado", Decimal("-230.10")),
+        (date(2025, 3, 6), "Farmácia", Decimal("-45.00")),
+    ]
+
+def test_invalid_csv_rows_are_reported_with_their_line_numbers():
+    lines = parse_fixture("extrato_linhas_invalidas.csv", "CSV")
+
+    assert [type(line) for line in lines] == [StatementLine, InvalidStatementLine, InvalidStatementLine, StatementLine]
+    assert [line.line_number for line in lines] == [2, 3, 4, 5]
+    assert "32/03/2025" in lines[1].error
+    assert "dezreais" in lines[2].error
+
+def test_csv_without_an_amount_column_is_rejected():
+    with pytest.raises(StatementParseError):
+        parse_fixture("extrato_sem_valor.csv", "CSV")
+
+def test_sgml_ofx_in_windows_1252():
+    lines = parse_fixture("extrato_sgml.ofx", "OFX")
+
+    assert lines[:2] == [
+        StatementLine(
+            10, date(2025, 3, 5), Decimal("-12.50"), "PADARIA PÃO QUENTE", "Compra no débito", "2025030501"
+        ),
+        # Without a NAME, the MEMO is the description.
+        StatementLine(18, date(2025, 3, 6), Decimal("3500.00"), "SALÁRIO", "", "2025030601"),
+    ]
+    assert isinstance(lines[2], InvalidStatementLine)
+    assert lines[2].line_number == 25
+
+def test_xml_ofx():
+    lines = parse_fixture("extrato_xml.ofx", "OFX")
+
+    assert lines == [
+        StatementLine(6, date(2025, 3, 5), Decimal("-89.90"), "Livraria Café", "", "cc-001"),
+        StatementLine(7, date(2025, 3, 10), Decimal("500.00"), "Pagamento recebido", "", "cc-002"),
+    ]
+
+def test_file_without_an_ofx_element_is_rejected():
+    with pytest.raises(StatementParseError):
+        parse_fixture("nao_e_ofx.ofx", "OFX")
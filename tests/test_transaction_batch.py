@@ -0,0 +1,78 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from poupeai_finance_service.credit_cards.models import Invoice
+from poupeai_finance_service.transactions.models import Transaction
+from poupeai_finance_service.transactions.rollups import find_rollup_mismatches
+from poupeai_finance_service.transactions.services import TransactionService
+
+@pytest.fixture
+def card_item(expense_category, credit_card):
+    def item(issue_date, **data):
+        return {
+            'category': expense_category,
+            'description': "Compra",
+            'amount': Decimal("50.00"),
+            'issue_date': issue_date,
+            'source_type': 'CREDIT_CARD',
+            'credit_card': credit_card,
+            **data,
+        }
+
+    return item
+
+def _invoice_periods(credit_card):
+    return set(Invoice.objects.filter(credit_card=credit_card).values_list('month', 'year'))
+
+def test_rejected_items_leave_no_invoice_behind(profile, credit_card, income_category, card_item):
+    items = [
+        card_item(date(2025, 3, 1)),
+        # An income category is not allowed on a credit card: rejected by Transaction.clean().
+        card_item(date(2025, 7, 1), category=income_category),
+        card_item(date(2025, 9, 1), description="x" * 300),
+    ]
+
+    created, errors = TransactionService.create_transactions_batch(profile, items, atomic=False)
+
+    assert list(created) == [0]
+    assert set(errors) == {1, 2}
+    assert _invoice_periods(credit_card) == {(3, 2025)}
+    assert created[0].invoice.month == 3
+    assert Transaction.objects.filter(profile=profile).count() == 1
+    assert find_rollup_mismatches(profile.pk) == []
+
+def test_atomic_batch_writes_nothing_when_an_item_is_rejected(profile, credit_card, income_category, card_item):
+    items = [card_item(date(2025, 3, 1)), card_item(date(2025, 7, 1), category=income_category)]
+
+    created, errors = TransactionService.create_transactions_batch(profile, items, atomic=True)
+
+    assert created == {}
+    assert set(errors) == {1}
+    assert _invoice_periods(credit_card) == set()
+    assert not Transaction.objects.filter(profile=profile).exists()
+
+def test_installments_and_existing_invoices_are_linked(profile, credit_card, bank_account, card_item):
+    paid = Invoice.objects.get_or_create_invoice(credit_card=credit_card, issue_date=date(2025, 3, 1))
+    paid.payment_date = date(2025, 3, 15)
+    paid.bank_account = bank_account
+    paid.save()
+    items = [
+        card_item(date(2025, 3, 1)),
+        card_item(date(2025, 3, 1), description="Geladeira", is_installment=True, total_installments=3),
+    ]
+
+    created, errors = TransactionService.create_transactions_batch(profile, items, atomic=False)
+
+    assert errors == {}
+    assert _invoice_periods(credit_card) == {(3, 2025), (4, 2025), (5, 2025)}
+    single = created[0]
+    assert single.invoice == paid
+    assert (single.bank_account, single.payment_date) == (bank_account, paid.payment_date)
+    installments = Transaction.objects.filter(
+        purchase_group_uuid=created[1].purchase_group_uuid
+    ).order_by('installment_number').select_related('invoice')
+    assert [(t.invoice.month, t.description) for t in installments] == [
+        (3, "Geladeira (1/3)"), (4, "Geladeira (2/3)"), (5, "Geladeira (3/3)")
+    ]